@@ -15,6 +15,8 @@ __email__ = __email__
 # Local Packages #
 from .sentinelobject import SentinelObject, search_sentinel
 from .baseobject import BaseObject
+from .slotted import slotted
+from .objectpool import ObjectPool
 from .basemeta import BaseMeta
 from .basecallable import BaseCallable, BaseMethod, BaseFunction
 from .collections import *
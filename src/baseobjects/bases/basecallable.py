@@ -16,6 +16,8 @@ __email__ = __email__
 from asyncio.coroutines import iscoroutinefunction, _is_coroutine
 from collections.abc import Iterable
 from functools import WRAPPER_ASSIGNMENTS
+from inspect import Parameter, Signature, signature
+from keyword import iskeyword
 from typing import Any
 from types import FunctionType, MethodType
 import weakref
@@ -43,6 +45,8 @@ class BaseCallable(BaseObject):
     """
 
     # Attributes #
+    _eager_assignments: tuple[str, ...] = ("__module__", "__doc__", "__annotations__")
+    _lazy_assignments: frozenset[str] = frozenset(WRAPPER_ASSIGNMENTS) - {"__name__", *_eager_assignments}
     __wrapped__: AnyCallable | None = None
     _is_coroutine: object | None = None
     _cast_excluded: set = {"__call__"}
@@ -63,22 +67,18 @@ class BaseCallable(BaseObject):
         if value is None:
             self._is_coroutine = None
         else:
-            self._is_coroutine = _is_coroutine if iscoroutinefunction(value) else None
-            d_copy = getattr(value, "__dict__", {}).copy()
-            # Copy all attributes from the wrapped function to this object.
-            if d_copy:
-                exlcuded = set(dir(self))
-                for k, v in d_copy.items():
-                    if k not in exlcuded:
-                        setattr(self, k, v)
-            # Assign documentation from warped function to this object.
-            for attr in WRAPPER_ASSIGNMENTS:
+            if isinstance(value, BaseCallable):
+                # The wrapped callable has already determined if it is a coroutine.
+                self._is_coroutine = value._is_coroutine
+            else:
+                self._is_coroutine = _is_coroutine if iscoroutinefunction(value) else None
+            # Assign the metadata which is shadowed by class attributes, the rest is resolved lazily by __getattr__.
+            instance_dict = self.__dict__
+            for attr in self._eager_assignments:
                 try:
-                    value = getattr(value, attr)
+                    instance_dict[attr] = getattr(value, attr)
                 except AttributeError:
                     pass
-                else:
-                    setattr(self, attr, value)
 
     @property
     def __name__(self) -> str:
@@ -121,6 +121,28 @@ class BaseCallable(BaseObject):
         if init:
             self.construct(func=func, *args, **kwargs)
 
+    # Attribute Access
+    def __getattr__(self, name: str) -> Any:
+        """Gets an attribute of the wrapped function which this object does not have.
+
+        The wrapped function's __dict__ and the metadata which is not shadowed by class attributes, like __qualname__,
+        are resolved here on access rather than copied when the function is wrapped.
+
+        Args:
+            name: The name of the attribute to get.
+
+        Returns:
+            The attribute of the wrapped function.
+        """
+        wrapped = self.__wrapped__
+        if wrapped is not None:
+            try:
+                return getattr(wrapped, "__dict__", {})[name]
+            except KeyError:
+                if name in self._lazy_assignments:
+                    return getattr(wrapped, name)
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
     # Calling
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Calls the wrapped function with the instance as an argument.
@@ -155,16 +177,101 @@ class BaseCallable(BaseObject):
         super().construct(*args, **kwargs)
 
     # Casting
-    def as_function(self) -> FunctionType:
-        """Creates a wrapper function of this class."""
+    def get_call_signature(self) -> Signature:
+        """Gets the signature of calling this object.
+
+        Returns:
+            The signature of calling this object.
+        """
+        return signature(self.__wrapped__)
+
+    def get_exact_call(self) -> tuple[AnyCallable, weakref.ref | None]:
+        """Gets the implementation which calls of this object are delegated to.
+
+        Returns:
+            The implementation and a weak reference to the instance given to it as the first argument, if any.
+        """
+        return (self.__wrapped__, None) if type(self).__call__ is BaseCallable.__call__ else (self, None)
+
+    def build_exact_function(self) -> FunctionType | None:
+        """Generates a function with the exact parameters of this object which calls the selected implementation.
+
+        The implementation is the one selected when the function is generated, so later changes to the selection are
+        not followed by the function.
+
+        Returns:
+            The generated function or None if the signature of this object cannot be generated.
+        """
+        try:
+            call_signature = self.get_call_signature()
+        except (TypeError, ValueError):
+            return None
+
+        target, instance_ref = self.get_exact_call()
+        namespace = {"__target__": target, "__instance_ref__": instance_ref}
+        parameters = []
+        arguments = [] if instance_ref is None else ["__instance_ref__()"]
+        previous = None
+        for i, (name, parameter) in enumerate(call_signature.parameters.items()):
+            if not name.isidentifier() or iskeyword(name) or name.startswith("__"):
+                return None
+
+            kind = parameter.kind
+            if previous is Parameter.POSITIONAL_ONLY and kind is not Parameter.POSITIONAL_ONLY:
+                parameters.append("/")
+            if kind is Parameter.KEYWORD_ONLY and previous not in {Parameter.KEYWORD_ONLY, Parameter.VAR_POSITIONAL}:
+                parameters.append("*")
+
+            if kind is Parameter.VAR_POSITIONAL:
+                parameters.append(f"*{name}")
+                arguments.append(f"*{name}")
+            elif kind is Parameter.VAR_KEYWORD:
+                parameters.append(f"**{name}")
+                arguments.append(f"**{name}")
+            else:
+                if parameter.default is Parameter.empty:
+                    parameters.append(name)
+                else:
+                    namespace[f"__default_{i}__"] = parameter.default
+                    parameters.append(f"{name}=__default_{i}__")
+                arguments.append(f"{name}={name}" if kind is Parameter.KEYWORD_ONLY else name)
+            previous = kind
+
+        if previous is Parameter.POSITIONAL_ONLY:
+            parameters.append("/")
+
+        function_name = self.__name__ if self.__name__.isidentifier() and not iskeyword(self.__name__) else "wrapper"
         if self._is_coroutine:
-            async def wrapper_function(*args: Any, **kwargs: Any) -> Any:
-                """A function which wraps a callable."""
-                return await self(*args, **kwargs)
+            header, call = "async def", "await __target__"
         else:
-            def wrapper_function(*args: Any, **kwargs: Any) -> Any:
-                """A function which wraps a callable."""
-                return self(*args, **kwargs)
+            header, call = "def", "__target__"
+        source = f"{header} {function_name}({', '.join(parameters)}):\n    return {call}({', '.join(arguments)})\n"
+        exec(source, namespace)
+
+        exact_function = namespace[function_name]
+        exact_function.__signature__ = call_signature
+        return exact_function
+
+    def as_function(self, exact: bool = False) -> FunctionType:
+        """Creates a wrapper function of this class.
+
+        Args:
+            exact: Determines if the wrapper is generated with the exact parameters of this object and calls the
+                selected implementation directly. Falls back to a generic wrapper if the signature cannot be generated.
+
+        Returns:
+            The wrapper function.
+        """
+        wrapper_function = self.build_exact_function() if exact else None
+        if wrapper_function is None:
+            if self._is_coroutine:
+                async def wrapper_function(*args: Any, **kwargs: Any) -> Any:
+                    """A function which wraps a callable."""
+                    return await self(*args, **kwargs)
+            else:
+                def wrapper_function(*args: Any, **kwargs: Any) -> Any:
+                    """A function which wraps a callable."""
+                    return self(*args, **kwargs)
 
         for attr in WRAPPER_ASSIGNMENTS:
             try:
@@ -174,6 +281,7 @@ class BaseCallable(BaseObject):
             else:
                 setattr(wrapper_function, attr, value)
 
+        wrapper_function.__dict__.update(getattr(self.__wrapped__, "__dict__", {}))
         wrapper_function.__dict__.update(self.__dict__)
         wrapper_function.__wrapped__ = self
 
@@ -284,6 +392,35 @@ class BaseMethod(BaseCallable):
 
         super().construct(func=func, *args, **kwargs)
 
+    def reset(self) -> None:
+        """Unbinds this method, so it can be bound to another object when it is reused."""
+        self._self_ = None
+        self.__owner__ = None
+
+    # Casting
+    def get_call_signature(self) -> Signature:
+        """Gets the signature of calling this object, which is the wrapped function's without the instance parameter.
+
+        Returns:
+            The signature of calling this object.
+        """
+        call_signature = super().get_call_signature()
+        parameters = tuple(call_signature.parameters.values())
+        if not parameters or parameters[0].kind not in {Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD}:
+            raise ValueError(f"{self.__wrapped__!r} does not have a parameter for the instance.")
+        return call_signature.replace(parameters=parameters[1:])
+
+    def get_exact_call(self) -> tuple[AnyCallable, weakref.ref | None]:
+        """Gets the implementation which calls of this object are delegated to.
+
+        Returns:
+            The implementation and a weak reference to the instance given to it as the first argument, if any.
+        """
+        if type(self).__call__ is BaseMethod.__call__ and self._self_ is not None:
+            return self.__wrapped__, self._self_
+        else:
+            return self, None
+
     # Binding
     def bind(self, instance: Any = None, owner: type[Any] | None = None) -> "BaseMethod":
         """Binds this object to another.
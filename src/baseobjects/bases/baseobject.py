@@ -14,6 +14,7 @@ __email__ = __email__
 # Imports #
 # Standard Libraries #
 from abc import ABC
+from collections.abc import Callable
 from copy import (
     _copy_dispatch,
     _copy_immutable,
@@ -21,10 +22,12 @@ from copy import (
     _deepcopy_atomic,
     _keep_alive,
     _reconstruct,
+    deepcopy,
     Error,
 )
-from copyreg import dispatch_table
+from copyreg import _slotnames, dispatch_table
 from typing import Any
+from weakref import WeakKeyDictionary
 
 # Third-Party Packages #
 
@@ -34,7 +37,16 @@ from typing import Any
 # Definitions #
 # Classes #
 class BaseObject(ABC):
-    """An abstract class that implements some basic functions that all objects should have."""
+    """An abstract class that implements some basic functions that all objects should have.
+
+    Class Attributes:
+        _atomic_types: The types which deepcopy does not copy.
+        _copiers: The cached shallow and deep copiers of each class.
+    """
+
+    # Class Attributes #
+    _atomic_types: frozenset[type] = frozenset(t for t, c in _deepcopy_dispatch.items() if c is _deepcopy_atomic)
+    _copiers: WeakKeyDictionary[type, tuple[Callable[[Any], Any], Callable[[Any, dict], Any]]] = WeakKeyDictionary()
 
     # Magic Methods #
     # Construction/Destruction
@@ -47,33 +59,11 @@ class BaseObject(ABC):
         Returns:
             A shallow copy of this object.
         """
-        cls = type(self)
-
-        copier = _copy_dispatch.get(cls)
-        if copier:
-            return copier(self)
-
-        if issubclass(cls, type):
-            # treat it as a regular class:
-            return _copy_immutable(self)
-
-        reductor = dispatch_table.get(cls)
-        if reductor is not None:
-            rv = reductor(self)
-        else:
-            reductor = getattr(self, "__reduce_ex__", None)
-            if reductor is not None:
-                rv = reductor(4)
-            else:
-                reductor = getattr(self, "__reduce__", None)
-                if reductor:
-                    rv = reductor()
-                else:
-                    raise Error("un(shallow)copyable object of type %s" % cls)
-
-        if isinstance(rv, str):
-            return self
-        return _reconstruct(self, None, *rv)
+        try:
+            copier = self._copiers[type(self)][0]
+        except KeyError:
+            copier = self.create_copiers()[0]
+        return copier(self)
 
     def __deepcopy__(self, memo: dict | None = None, _nil=[]) -> Any:
         """The deepcopy magic method based on python's deepcopy function.
@@ -92,34 +82,11 @@ class BaseObject(ABC):
         if y is not _nil:
             return y
 
-        cls = type(self)
-
-        # If copy method is in the deepcopy dispatch then use it
-        copier = _deepcopy_dispatch.get(cls)
-        if copier is not None:
-            y = copier(self, memo)
-        else:
-            # Handle if this object is a type subclass
-            if issubclass(cls, type):
-                y = _deepcopy_atomic(self, memo)
-            else:
-                reductor = dispatch_table.get(cls)
-                if reductor:
-                    rv = reductor(self)
-                else:
-                    reductor = getattr(self, "__reduce_ex__", None)
-                    if reductor is not None:
-                        rv = reductor(4)
-                    else:
-                        reductor = getattr(self, "__reduce__", None)
-                        if reductor:
-                            rv = reductor()
-                        else:
-                            raise Error("un(deep)copyable object of type %s" % cls)
-                if isinstance(rv, str):
-                    y = self
-                else:
-                    y = _reconstruct(self, memo, *rv)
+        try:
+            copier = self._copiers[type(self)][1]
+        except KeyError:
+            copier = self.create_copiers()[1]
+        y = copier(self, memo)
 
         # If is its own copy, don't memoize.
         if y is not self:
@@ -135,7 +102,17 @@ class BaseObject(ABC):
         Returns:
             A dictionary of this object's attributes.
         """
-        return self.__dict__.copy()
+        try:
+            state = self.__dict__.copy()
+        except AttributeError:
+            state = {}
+
+        for name in _slotnames(type(self)):
+            try:
+                state[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         """Builds this object based on a dictionary of corresponding attributes.
@@ -143,7 +120,48 @@ class BaseObject(ABC):
         Args:
             state: The attributes to build this object from.
         """
-        self.__dict__.update(state)
+        if slot_names := _slotnames(type(self)):
+            state = state.copy()
+            for name in slot_names:
+                if name in state:
+                    setattr(self, name, state.pop(name))
+
+        if state:
+            self.__dict__.update(state)
+
+    # Class Methods #
+    # Copying
+    @classmethod
+    def create_copiers(cls) -> tuple[Callable[[Any], Any], Callable[[Any, dict], Any]]:
+        """Creates the shallow and deep copiers of this class and caches them.
+
+        A class which is reduced like a plain object is copied by creating a new instance and copying its state
+        directly, rather than reducing the object and reconstructing it. If the class also uses the state methods of
+        BaseObject, copiers which copy its __dict__ and each of its slots are generated for the class. The deep copiers
+        only deepcopy the values which are not atomic. Any other class is copied with its reduction like the copy
+        module.
+
+        Returns:
+            The shallow copier and the deep copier of this class.
+        """
+        if (
+            cls in _copy_dispatch
+            or cls in _deepcopy_dispatch
+            or cls in dispatch_table
+            or issubclass(cls, (type, list, dict))
+            or cls.__reduce_ex__ is not object.__reduce_ex__
+            or cls.__reduce__ is not object.__reduce__
+            or hasattr(cls, "__getnewargs_ex__")
+            or hasattr(cls, "__getnewargs__")
+        ):
+            copiers = (reduce_copy, reduce_deepcopy)
+        elif cls.__getstate__ is BaseObject.__getstate__ and cls.__setstate__ is BaseObject.__setstate__:
+            copiers = create_attribute_copiers(cls, cls._atomic_types)
+        else:
+            copiers = create_state_copiers(cls, cls._atomic_types)
+
+        cls._copiers[cls] = copiers
+        return copiers
 
     # Instance Methods #
     # Constructors/Destructors
@@ -156,6 +174,10 @@ class BaseObject(ABC):
         """
         pass
 
+    def reset(self) -> None:
+        """Drops the state which construct sets, so this object can be constructed again when it is reused."""
+        pass
+
     def copy(self) -> Any:
         """Creates a shallow copy of this object.
 
@@ -174,3 +196,171 @@ class BaseObject(ABC):
             A deep copy of this object.
         """
         return self.__deepcopy__(memo=memo)
+
+
+# Functions #
+def reduce_copy(obj: Any) -> Any:
+    """Creates a shallow copy of an object with its reduction like the copy module.
+
+    Args:
+        obj: The object to copy.
+
+    Returns:
+        A shallow copy of the object.
+    """
+    cls = type(obj)
+
+    copier = _copy_dispatch.get(cls)
+    if copier:
+        return copier(obj)
+
+    if issubclass(cls, type):
+        # treat it as a regular class:
+        return _copy_immutable(obj)
+
+    reductor = dispatch_table.get(cls)
+    if reductor is not None:
+        rv = reductor(obj)
+    else:
+        reductor = getattr(obj, "__reduce_ex__", None)
+        if reductor is not None:
+            rv = reductor(4)
+        else:
+            reductor = getattr(obj, "__reduce__", None)
+            if reductor:
+                rv = reductor()
+            else:
+                raise Error("un(shallow)copyable object of type %s" % cls)
+
+    if isinstance(rv, str):
+        return obj
+    return _reconstruct(obj, None, *rv)
+
+
+def reduce_deepcopy(obj: Any, memo: dict) -> Any:
+    """Creates a deep copy of an object with its reduction like the copy module.
+
+    Args:
+        obj: The object to copy.
+        memo: The dictionary of objects already copied.
+
+    Returns:
+        A deep copy of the object.
+    """
+    cls = type(obj)
+
+    # If copy method is in the deepcopy dispatch then use it
+    copier = _deepcopy_dispatch.get(cls)
+    if copier is not None:
+        return copier(obj, memo)
+
+    # Handle if this object is a type subclass
+    if issubclass(cls, type):
+        return _deepcopy_atomic(obj, memo)
+
+    reductor = dispatch_table.get(cls)
+    if reductor:
+        rv = reductor(obj)
+    else:
+        reductor = getattr(obj, "__reduce_ex__", None)
+        if reductor is not None:
+            rv = reductor(4)
+        else:
+            reductor = getattr(obj, "__reduce__", None)
+            if reductor:
+                rv = reductor()
+            else:
+                raise Error("un(deep)copyable object of type %s" % cls)
+
+    if isinstance(rv, str):
+        return obj
+    return _reconstruct(obj, memo, *rv)
+
+
+def create_attribute_copiers(
+    cls: type,
+    atomic_types: frozenset[type],
+) -> tuple[Callable[[Any], Any], Callable[[Any, dict], Any]]:
+    """Generates copiers which copy the __dict__ and the slots of the instances of a class.
+
+    Args:
+        cls: The class to create the copiers for.
+        atomic_types: The types which the deep copier does not copy.
+
+    Returns:
+        The shallow copier and the deep copier of the class.
+    """
+    has_dict = cls.__dictoffset__ != 0
+    slots = _slotnames(cls)
+
+    lines = ["def copy_(obj):", "    new = __new__(__cls__)"]
+    if has_dict:
+        lines.append("    new.__dict__.update(obj.__dict__)")
+    for name in slots:
+        lines.extend(("    try:", f"        new.{name} = obj.{name}", "    except AttributeError:", "        pass"))
+    lines.append("    return new")
+
+    lines.extend(("def deepcopy_(obj, memo):", "    new = __new__(__cls__)", "    memo[id(obj)] = new"))
+    if has_dict:
+        lines.extend(
+            (
+                "    new_dict = new.__dict__",
+                "    for name, value in obj.__dict__.items():",
+                "        new_dict[name] = value if type(value) in __atomic__ else __deepcopy__(value, memo)",
+            )
+        )
+    for name in slots:
+        lines.extend(
+            (
+                "    try:",
+                f"        value = obj.{name}",
+                "    except AttributeError:",
+                "        pass",
+                "    else:",
+                f"        new.{name} = value if type(value) in __atomic__ else __deepcopy__(value, memo)",
+            )
+        )
+    lines.append("    return new")
+
+    namespace = {"__cls__": cls, "__new__": cls.__new__, "__atomic__": atomic_types, "__deepcopy__": deepcopy}
+    exec("\n".join(lines), namespace)
+    return namespace["copy_"], namespace["deepcopy_"]
+
+
+def create_state_copiers(
+    cls: type,
+    atomic_types: frozenset[type],
+) -> tuple[Callable[[Any], Any], Callable[[Any, dict], Any]]:
+    """Creates copiers which copy the instances of a class through their __getstate__ and __setstate__.
+
+    Args:
+        cls: The class to create the copiers for.
+        atomic_types: The types which the deep copier does not copy.
+
+    Returns:
+        The shallow copier and the deep copier of the class.
+    """
+    new_ = cls.__new__
+
+    def copy_(obj: Any) -> Any:
+        """Creates a shallow copy of an object by setting the state of a new instance to the object's state."""
+        new = new_(cls)
+        state = obj.__getstate__()
+        if state is not None:
+            new.__setstate__(state)
+        return new
+
+    def deepcopy_(obj: Any, memo: dict) -> Any:
+        """Creates a deep copy of an object by setting the state of a new instance to a copy of the object's state."""
+        new = new_(cls)
+        memo[id(obj)] = new
+        state = obj.__getstate__()
+        if type(state) is dict:
+            new.__setstate__(
+                {n: v if type(v) in atomic_types else deepcopy(v, memo) for n, v in state.items()},
+            )
+        elif state is not None:
+            new.__setstate__(deepcopy(state, memo))
+        return new
+
+    return copy_, deepcopy_
@@ -0,0 +1,160 @@
+"""objectpool.py
+A bounded freelist of the instances of a class, which are reset and reused rather than created.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from .baseobject import BaseObject
+
+
+# Definitions #
+# Classes #
+class ObjectPool(BaseObject):
+    """A bounded freelist of the instances of a class, which are reset and reused rather than created.
+
+    Released objects are reset, which drops the references they hold, and kept until the pool is full. An acquired
+    object is constructed again with the construct method of its class, so a pooled class must set all of its state
+    in construct and reset it in reset. When the pool is empty, a new instance is created.
+
+    Pooling is explicit: the owner of a pool acquires objects from it and releases the objects it knows are no longer
+    referenced anywhere else. In this package only the items of a timed LRU cache with an item pool are recycled. No
+    library path recycles bound methods, so binding a DynamicFunction never takes a DynamicMethod from a pool, and
+    callers which create many short-lived methods can pool them explicitly with acquire and release. A pool does not
+    lock, so it should be used the same way as the object which owns it, like only from one thread.
+
+    Attributes:
+        type_: The class of the objects in this pool.
+        max_size: The max number of free objects this pool keeps.
+        free: The objects which can be reused.
+
+    Args:
+        type_: The class of the objects in this pool.
+        max_size: The max number of free objects this pool keeps.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    type_: type[BaseObject] | None = None
+    max_size: int = 1024
+
+    free: list[BaseObject]
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        type_: type[BaseObject] | None = None,
+        max_size: int | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.free: list[BaseObject] = []
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(type_=type_, max_size=max_size, *args, **kwargs)
+
+    def __len__(self) -> int:
+        """Gets the number of free objects in this pool.
+
+        Returns:
+            The number of free objects.
+        """
+        return len(self.free)
+
+    # Pickling
+    def __getstate__(self) -> dict[str, Any]:
+        """Creates a dictionary of attributes which can be used to rebuild this object
+
+        Returns:
+            A dictionary of this object's attributes.
+        """
+        state = super().__getstate__()
+        state["free"] = []
+        return state
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        type_: type[BaseObject] | None = None,
+        max_size: int | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            type_: The class of the objects in this pool.
+            max_size: The max number of free objects this pool keeps.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if type_ is not None:
+            self.type_ = type_
+
+        if max_size is not None:
+            self.max_size = max_size
+
+        super().construct(*args, **kwargs)
+
+    # Pooling
+    def acquire(self, *args: Any, **kwargs: Any) -> Any:
+        """Gets a free object constructed with the arguments or creates a new object if there are none.
+
+        Args:
+            *args: The arguments to construct the object with.
+            **kwargs: The keyword arguments to construct the object with.
+
+        Returns:
+            The constructed object.
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.construct(*args, **kwargs)
+            return obj
+
+        return self.type_(*args, **kwargs)
+
+    def release(self, obj: Any) -> bool:
+        """Resets an object which is no longer used and keeps it for reuse if this pool is not full.
+
+        Objects which are not exactly of the class of this pool are not kept, because a subclass may have state which
+        the construct of the class does not set.
+
+        Args:
+            obj: The object to release, which must not be referenced or used by anything after it is released.
+
+        Returns:
+            True if the object was kept.
+        """
+        if type(obj) is self.type_ and len(self.free) < self.max_size:
+            obj.reset()
+            self.free.append(obj)
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Removes all the free objects from this pool."""
+        self.free.clear()
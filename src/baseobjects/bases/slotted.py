@@ -0,0 +1,158 @@
+"""slotted.py
+A class decorator which creates the __slots__ of a class from its annotated attributes.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Callable
+from copyreg import _slotnames
+from types import FunctionType
+from typing import Any, ClassVar, get_origin
+
+# Third-Party Packages #
+
+# Local Packages #
+
+
+# Definitions #
+# Functions #
+def is_class_variable(annotation: Any) -> bool:
+    """Determines if an annotation marks a class variable.
+
+    Args:
+        annotation: The annotation to check.
+
+    Returns:
+        True if the annotation is ClassVar.
+    """
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+    return annotation is ClassVar or get_origin(annotation) is ClassVar
+
+
+def replace_class_cells(namespace: dict[str, Any], old: type, new: type) -> None:
+    """Replaces the references to a class in the closures of the functions of a namespace, which super() uses.
+
+    This depends on the __class__ cell which CPython creates in the closure of every function that uses super() or
+    __class__, and on the cells being writable. Functions which are wrapped by objects without __wrapped__ are not
+    found, so they keep the original class.
+
+    Args:
+        namespace: The namespace which contains the functions.
+        old: The class to replace.
+        new: The class to replace it with.
+    """
+    for value in namespace.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            functions = (value.__func__,)
+        elif isinstance(value, property):
+            functions = (value.fget, value.fset, value.fdel)
+        else:
+            functions = (value,)
+
+        for function in functions:
+            while function is not None and not isinstance(function, FunctionType):
+                function = getattr(function, "__wrapped__", None)
+            for cell in getattr(function, "__closure__", None) or ():
+                try:
+                    if cell.cell_contents is old:
+                        cell.cell_contents = new
+                except ValueError:
+                    pass
+
+
+def create_default_new(cls: type, defaults: dict[str, Any]) -> Callable[..., Any]:
+    """Generates a __new__ which assigns the default values of the slots of a class to a new instance.
+
+    Args:
+        cls: The class to create the __new__ for.
+        defaults: The default value of each slot.
+
+    Returns:
+        The generated __new__.
+    """
+    next_new = super(cls, cls).__new__
+    namespace = {"__next_new__": next_new}
+    arguments = "cls" if next_new is object.__new__ else "cls, *args, **kwargs"
+    lines = ["def __new__(cls, *args, **kwargs):", f"    self = __next_new__({arguments})"]
+    for i, (name, value) in enumerate(defaults.items()):
+        namespace[f"__default_{i}__"] = value
+        lines.append(f"    self.{name} = __default_{i}__")
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)
+    new = namespace["__new__"]
+    new.__qualname__ = f"{cls.__qualname__}.__new__"
+    return new
+
+
+def slotted(cls: type | None = None, *, weakref: bool = True) -> type | Callable[[type], type]:
+    """A class decorator which recreates a class with __slots__ created from its annotated attributes.
+
+    Every annotated attribute of the class, which is not a ClassVar or a slot of a base, becomes a slot. The class
+    default of an attribute, including a new default of a slot of a base, is moved to a generated __new__ which
+    assigns it to each new instance, rather than to a __getattr__, which would slow down every attribute access of the
+    instances. Instances of subclasses which do not call the __init__ of the class still have the defaults, but
+    reading the attribute on the class gives its slot descriptor rather than the default. The instances of the class
+    only have no __dict__ when every base has __slots__, so the subclasses of BaseObject, and subclasses which are not
+    slotted, still have one.
+
+    The slots can only be added by creating a new class, so the metaclass is called again with the namespace of the
+    class, which runs the side effects of the metaclass and of __init_subclass__ a second time, like registering the
+    class. The closure cells of the methods which refer to the original class are replaced with the new class, so
+    zero-argument super() keeps working, see replace_class_cells.
+
+    Args:
+        cls: The class to recreate with slots.
+        weakref: Determines if the instances can be weakly referenced.
+
+    Returns:
+        The slotted class or a decorator which slots a class if no class is given.
+    """
+    if cls is None:
+        return lambda cls_: slotted(cls_, weakref=weakref)
+
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already defines __slots__.")
+
+    namespace = dict(cls.__dict__)
+    inherited = {name for base in cls.__mro__[1:] for name in _slotnames(base)}
+
+    slots = []
+    defaults = {}
+    for name, annotation in namespace.get("__annotations__", {}).items():
+        if is_class_variable(annotation):
+            continue
+        if name in namespace:
+            value = namespace[name]
+            if hasattr(type(value), "__get__"):
+                continue
+            # A default would shadow the slot, so it is assigned to new instances even when a base has the slot.
+            defaults[name] = namespace.pop(name)
+        if name not in inherited:
+            slots.append(name)
+
+    if weakref and not any(base.__weakrefoffset__ for base in cls.__mro__[1:]):
+        slots.append("__weakref__")
+
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(slots)
+    namespace["__qualname__"] = cls.__qualname__
+
+    if defaults and "__new__" in namespace:
+        raise TypeError(f"{cls.__name__} defines __new__, so the defaults of its slots cannot be assigned.")
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    replace_class_cells(namespace, cls, new_cls)
+    if defaults:
+        new_cls.__new__ = staticmethod(create_default_new(new_cls, defaults))
+    return new_cls
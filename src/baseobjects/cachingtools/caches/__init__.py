@@ -13,8 +13,12 @@ __email__ = __email__
 
 # Imports
 # Local Packages #
-from .basetimedcache import BaseTimedCache
+from .replayiterable import ReplayIterable, ReplayFunction
+from .basetimedcache import CacheItem, BaseTimedCache
+from .cachecompressor import CacheCompressor
 from .timedsinglecache import TimedSingleCache, timed_single_cache
 from .timedkeylesscache import TimedKeylessCache, timed_keyless_cache
 from .timedcache import TimedCache, timed_cache
 from .timedlrucache import TimedLRUCache, timed_lru_cache
+from .timedtieredcache import TimedTieredCache, timed_tiered_cache
+from .timedcachedproperty import TimedCachedProperty, timed_cached_property
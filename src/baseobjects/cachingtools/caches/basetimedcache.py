@@ -17,14 +17,16 @@ import abc
 from collections.abc import Callable, Hashable, Iterable, Iterator
 from contextlib import contextmanager
 from time import perf_counter
+from types import TracebackType
 from typing import Any
 
 # Third-Party Packages #
 
 # Local Packages #
 from ...typing import AnyCallable
-from ...bases import BaseObject
+from ...bases import BaseObject, slotted
 from ...functions import MethodMultiplexer, DynamicCallable, DynamicMethod, DynamicFunction
+from .replayiterable import ReplayFunction
 
 
 # Definitions #
@@ -55,6 +57,7 @@ class _HashedSeq(list):
         return self.hashvalue
 
 
+@slotted
 class CacheItem(BaseObject):
     """An item within a cache which contains the result and a link to priority.
 
@@ -82,17 +85,100 @@ class CacheItem(BaseObject):
         result: Any | None = None,
         priority_link: Any | None = None,
         *args: Any,
+        init: bool = True,
         **kwargs: Any,
     ) -> None:
         # Parent Attributes #
-        super().__init__(*args, **kwargs)
+        super().__init__(*args, init=False, **kwargs)
 
-        # Attributes #
+        # Object Construction #
+        if init:
+            self.construct(key=key, result=result, priority_link=priority_link, *args, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        key: Hashable | None = None,
+        result: Any | None = None,
+        priority_link: Any | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            key: The key to this item in the cache.
+            result: The value to store in the cache.
+            priority_link: The object that represents this item's priority.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
         self.priority_link = priority_link
 
         self.key = key
         self.result = result
 
+        super().construct(*args, **kwargs)
+
+    def get_stored_result(self) -> Any:
+        """Gets the result as it is stored, so it can be moved to another store without being converted.
+
+        Returns:
+            The stored result.
+        """
+        return self.result
+
+    def reset(self) -> None:
+        """Drops the key, result, and priority of this item, so it can be reused for another result."""
+        self.priority_link = None
+        self.key = None
+        self.result = None
+
+
+class NegativeCacheItem(CacheItem):
+    """An item within a cache which contains a negative result or an exception and its own expiration.
+
+    Attributes:
+        expiration: The time when this item expires or None if it only expires when the cache clears.
+        is_exception: Determines if the result is an exception which should be raised.
+        traceback: The traceback of the exception when it was first raised.
+
+    Args:
+        key: The key to this item in the cache.
+        result: The negative result or the exception to store in the cache.
+        expiration: The time when this item expires or None if it only expires when the cache clears.
+        is_exception: Determines if the result is an exception which should be raised.
+        traceback: The traceback of the exception when it was first raised.
+        *args: Arguments for inheritance.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    expiration: int | float | None
+    is_exception: bool
+    traceback: TracebackType | None
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        key: Hashable | None = None,
+        result: Any | None = None,
+        expiration: int | float | None = None,
+        is_exception: bool = False,
+        traceback: TracebackType | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # Parent Attributes #
+        super().__init__(key, result, *args, **kwargs)
+
+        # Attributes #
+        self.expiration = expiration
+        self.is_exception = is_exception
+        self.traceback = traceback
+
 
 class BaseTimedCacheCallable(DynamicCallable):
     """A base cache wrapper object for a function which resets its cache periodically.
@@ -111,6 +197,9 @@ class BaseTimedCacheCallable(DynamicCallable):
         _previous_cache_method: The previous caching method used.
         cache: The multiplexer which control the caching method being use.
 
+        replay_function_type: The type of function which wraps the function when replaying.
+        is_replay: Determines if iterator results are cached as iterables which lazily replay their items.
+
     Args:
         func: The function to wrap.
         typed: Determines if the function's arguments are type sensitive for caching.
@@ -137,6 +226,9 @@ class BaseTimedCacheCallable(DynamicCallable):
     _previous_cache_method: str = "no_cache"
     cache: MethodMultiplexer
 
+    replay_function_type: type[ReplayFunction] = ReplayFunction
+    is_replay: bool = False
+
     # Properties #
     @property
     def is_local(self) -> bool:
@@ -198,6 +290,7 @@ class BaseTimedCacheCallable(DynamicCallable):
         lifetime: int | float | None = None,
         call_method: str | None = None,
         local: bool | None = None,
+        replay: bool | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -209,6 +302,7 @@ class BaseTimedCacheCallable(DynamicCallable):
             lifetime: The period between cache resets in seconds.
             call_method: The default call method to use.
             local: Determines if the cache is local to each instance or all instances.
+            replay: Determines if iterator results are cached as iterables which lazily replay their items.
             *args: Arguments for inheritance.
             **kwargs: Keyword arguments for inheritance.
         """
@@ -224,6 +318,12 @@ class BaseTimedCacheCallable(DynamicCallable):
         if local is not None:
             self.is_local = local
 
+        if replay is not None:
+            self.is_replay = replay
+
+        if func is not None and self.is_replay:
+            func = self.replay_function_type(func)
+
         super().construct(func=func, *args, **kwargs)
 
     # Caching Methods
@@ -296,6 +396,25 @@ class BaseTimedCacheCallable(DynamicCallable):
         if self.lifetime is not None:
             self.expiration = perf_counter() + self.lifetime
 
+    def set_replay(self, value: bool) -> None:
+        """Sets if iterator results are cached as iterables which lazily replay their items and clears the cache.
+
+        Generators and other iterators can only be iterated once, so caching them directly gives later callers an
+        exhausted iterator. When replaying, the wrapped function's iterator results are wrapped in a ReplayIterable
+        which stores items as the first iteration pulls them. Each iteration of a cached result replays the stored
+        items and then continues from the shared iterator.
+
+        Args:
+            value: Determines if iterator results are cached as iterables which lazily replay their items.
+        """
+        is_wrapped = isinstance(self.__wrapped__, self.replay_function_type)
+        if value and not is_wrapped and self.__wrapped__ is not None:
+            self.__func__ = self.replay_function_type(self.__wrapped__)
+        elif not value and is_wrapped:
+            self.__func__ = self.__wrapped__.__wrapped__
+        self.is_replay = value
+        self.clear_cache()
+
     def stop_caching(self) -> None:
         """Stops using the cache, storing the method used."""
         self._previous_cache_method = self.cache.selected
@@ -326,7 +445,7 @@ class BaseTimedCacheCallable(DynamicCallable):
         if self.clear_condition():
             self.clear_cache()
 
-        return self.cache(*args, **kwargs)
+        return self.cache.target(*args, **kwargs)
 
     def clearing_call(self, *args: Any, **kwargs: Any) -> Any:
         """Clears the cache then calls the caching function.
@@ -340,7 +459,7 @@ class BaseTimedCacheCallable(DynamicCallable):
         """
         self.clear_cache()
 
-        return self.cache(*args, **kwargs)
+        return self.cache.target(*args, **kwargs)
 
 
 class BaseTimedCacheMethod(BaseTimedCacheCallable, DynamicMethod):
@@ -383,7 +502,7 @@ class BaseTimedCacheMethod(BaseTimedCacheCallable, DynamicMethod):
         if self.clear_condition():
             self.clear_cache()
 
-        return self.cache(self.__self__, *args, **kwargs)
+        return self.cache.target(self.__self__, *args, **kwargs)
 
     def clearing_call(self, *args: Any, **kwargs: Any) -> Any:
         """Clears the cache then calls the caching function.
@@ -397,7 +516,7 @@ class BaseTimedCacheMethod(BaseTimedCacheCallable, DynamicMethod):
         """
         self.clear_cache()
 
-        return self.cache(self.__self__, *args, **kwargs)
+        return self.cache.target(self.__self__, *args, **kwargs)
 
 
 class BaseTimedCache(BaseTimedCacheCallable, DynamicFunction):
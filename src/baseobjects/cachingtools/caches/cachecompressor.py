@@ -0,0 +1,316 @@
+"""cachecompressor.py
+A compressor for cache results which records the cost and savings of the compression.
+"""
+# Package Header #
+from ...header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Hashable
+import lzma
+from time import perf_counter
+from typing import Any, ClassVar, NamedTuple
+import zlib
+
+# Third-Party Packages #
+
+# Local Packages #
+from ...typing import AnyCallable
+from ...bases import BaseObject, slotted
+from .basetimedcache import CacheItem
+
+
+# Definitions #
+# Classes #
+class CompressedPayload(NamedTuple):
+    """A compressed result moved out of a cache item with what is needed to decompress it.
+
+    Attributes:
+        payload: The compressed result.
+        result_type: The type of the original result.
+        codec: The name of the codec the result was compressed with.
+    """
+
+    payload: bytes
+    result_type: type
+    codec: str
+
+
+@slotted
+class CompressedCacheItem(CacheItem):
+    """An item within a cache which compresses its result when it is large and decompresses it when it is accessed.
+
+    A result which is not compressed is kept in the result slot of the base, and a compressed result is kept in the
+    payload slot, so the result property only reads and writes the slot of the base rather than replacing it.
+
+    Attributes:
+        compressor: The compressor which compresses and decompresses the result.
+        payload: The compressed result or None if the result is not compressed.
+        result_type: The type of the result if it is compressed, otherwise None.
+
+    Args:
+        key: The key to this item in the cache.
+        result: The value to store in the cache.
+        priority_link: The object that represents this item's priority.
+        compressor: The compressor which compresses and decompresses the result.
+        *args: Arguments for inheritance.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    compressor: "CacheCompressor"
+    payload: bytes | None = None
+    result_type: type | None = None
+
+    # Properties #
+    @property
+    def result(self) -> Any:
+        """The cached value, which is decompressed if it was compressed."""
+        if self.result_type is None:
+            return CacheItem.result.__get__(self)
+        else:
+            return self.compressor.decompress(self.payload, self.result_type)
+
+    @result.setter
+    def result(self, value: Any) -> None:
+        stored, self.result_type = self.compressor.compress(value)
+        if self.result_type is None:
+            self.payload = None
+            CacheItem.result.__set__(self, stored)
+        else:
+            self.payload = stored
+            CacheItem.result.__set__(self, None)
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        key: Hashable | None = None,
+        result: Any | None = None,
+        priority_link: Any | None = None,
+        compressor: "CacheCompressor" = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.compressor = compressor
+
+        # Parent Attributes #
+        super().__init__(key, result, priority_link, *args, **kwargs)
+
+    # Instance Methods #
+    def get_stored_result(self) -> Any:
+        """Gets the result as it is stored, which is a compressed payload if the result was compressed.
+
+        Returns:
+            The stored result.
+        """
+        if self.result_type is None:
+            return CacheItem.result.__get__(self)
+        else:
+            return CompressedPayload(self.payload, self.result_type, self.compressor.codec)
+
+
+class CacheCompressor(BaseObject):
+    """A compressor for cache results which records the cost and savings of the compression.
+
+    Only str, bytes, and bytearray results with a length at or above the threshold are compressed, and results which do
+    not shrink are stored uncompressed. The statistics show the time spent compressing and decompressing against the
+    memory saved.
+
+    Class Attributes:
+        codecs: The names of the available codecs and their compress and decompress functions.
+
+    Attributes:
+        codec: The name of the codec used for compression.
+        threshold: The minimum length of a result before it is compressed.
+        _compress: The compress function of the codec.
+        _decompress: The decompress function of the codec.
+
+        compressions: The number of results compressed.
+        decompressions: The number of results decompressed.
+        skips: The number of large results stored uncompressed because compressing did not reduce their size.
+        raw_size: The total size in bytes of the compressed results before compression.
+        compressed_size: The total size in bytes of the compressed results after compression.
+        compress_time: The total time in seconds spent compressing.
+        decompress_time: The total time in seconds spent decompressing.
+
+    Args:
+        codec: The name of the codec used for compression.
+        threshold: The minimum length of a result before it is compressed.
+        init: Determines if this object will construct.
+        *args: Arguments for inheritance.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Class Attributes #
+    codecs: ClassVar[dict[str, tuple[AnyCallable, AnyCallable]]] = {
+        "zlib": (zlib.compress, zlib.decompress),
+        "lzma": (lzma.compress, lzma.decompress),
+    }
+
+    # Attributes #
+    codec: str = "zlib"
+    threshold: int = 1024
+    _compress: AnyCallable = zlib.compress
+    _decompress: AnyCallable = zlib.decompress
+
+    compressions: int = 0
+    decompressions: int = 0
+    skips: int = 0
+    raw_size: int = 0
+    compressed_size: int = 0
+    compress_time: float = 0.0
+    decompress_time: float = 0.0
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        codec: str | None = None,
+        threshold: int | None = None,
+        init: bool = True,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(codec=codec, threshold=threshold, *args, **kwargs)
+
+    # Instance Methods #
+    # Constructors
+    def construct(self, codec: str | None = None, threshold: int | None = None, *args: Any, **kwargs: Any) -> None:
+        """The constructor for this object.
+
+        Args:
+            codec: The name of the codec used for compression.
+            threshold: The minimum length of a result before it is compressed.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if codec is not None:
+            self.set_codec(codec)
+
+        if threshold is not None:
+            self.threshold = threshold
+
+        super().construct(*args, **kwargs)
+
+    def set_codec(self, codec: str) -> None:
+        """Sets the codec used for compression.
+
+        Args:
+            codec: The name of the codec used for compression.
+        """
+        try:
+            self._compress, self._decompress = self.codecs[codec]
+        except KeyError:
+            raise ValueError(f"{codec} is not an available codec, choose from {tuple(self.codecs)}.") from None
+        self.codec = codec
+
+    # Compression
+    def compress(self, result: Any) -> tuple[Any, type | None]:
+        """Compresses a result if it is large enough and shrinks when compressed.
+
+        Args:
+            result: The result to compress.
+
+        Returns:
+            The stored payload and the type of the result if the payload is compressed, otherwise None.
+        """
+        result_type = type(result)
+        if result_type not in {str, bytes, bytearray} or len(result) < self.threshold:
+            return result, None
+
+        start = perf_counter()
+        raw = result.encode("utf-8", "surrogatepass") if result_type is str else result
+        payload = self._compress(raw)
+        self.compress_time += perf_counter() - start
+
+        if len(payload) >= len(raw):
+            self.skips += 1
+            return result, None
+
+        self.compressions += 1
+        self.raw_size += len(raw)
+        self.compressed_size += len(payload)
+        return payload, result_type
+
+    def decompress(self, payload: bytes, result_type: type) -> Any:
+        """Decompresses a payload into a result.
+
+        Args:
+            payload: The compressed result.
+            result_type: The type of the original result.
+
+        Returns:
+            The decompressed result.
+        """
+        start = perf_counter()
+        raw = self._decompress(payload)
+        if result_type is str:
+            result = raw.decode("utf-8", "surrogatepass")
+        else:
+            result = raw if result_type is bytes else result_type(raw)
+        self.decompress_time += perf_counter() - start
+        self.decompressions += 1
+        return result
+
+    def create_item(
+        self,
+        key: Hashable | None = None,
+        result: Any | None = None,
+        priority_link: Any | None = None,
+    ) -> CompressedCacheItem:
+        """Creates a cache item which uses this compressor.
+
+        Args:
+            key: The key to this item in the cache.
+            result: The value to store in the cache.
+            priority_link: The object that represents this item's priority.
+
+        Returns:
+            The new compressed cache item.
+        """
+        return CompressedCacheItem(key=key, result=result, priority_link=priority_link, compressor=self)
+
+    # Statistics
+    def get_stats(self) -> dict[str, Any]:
+        """Gets the statistics of the compression.
+
+        Returns:
+            The statistics of the compression including the memory saved and the time spent.
+        """
+        return {
+            "codec": self.codec,
+            "threshold": self.threshold,
+            "compressions": self.compressions,
+            "decompressions": self.decompressions,
+            "skips": self.skips,
+            "raw_size": self.raw_size,
+            "compressed_size": self.compressed_size,
+            "saved_size": self.raw_size - self.compressed_size,
+            "ratio": self.raw_size / self.compressed_size if self.compressed_size else None,
+            "compress_time": self.compress_time,
+            "decompress_time": self.decompress_time,
+        }
+
+    def reset_stats(self) -> None:
+        """Resets the statistics of the compression."""
+        self.compressions = 0
+        self.decompressions = 0
+        self.skips = 0
+        self.raw_size = 0
+        self.compressed_size = 0
+        self.compress_time = 0.0
+        self.decompress_time = 0.0
@@ -0,0 +1,139 @@
+"""replayiterable.py
+An iterable which lazily stores the items of an iterator so that they can be replayed by later iterations.
+"""
+# Package Header #
+from ...header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Iterator
+from threading import Lock
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from ...bases import BaseObject, BaseFunction
+
+
+# Definitions #
+# Classes #
+class ReplayIterable(BaseObject):
+    """An iterable which lazily stores the items of an iterator so that they can be replayed by later iterations.
+
+    Items are only pulled from the underlying iterator when an iteration reaches the end of the stored items, so the
+    iterator is never materialized ahead of its consumers. Each iteration first replays the stored items and then
+    continues from the shared underlying iterator. If the underlying iterator raises an exception, the exception is
+    stored and raised by every iteration after it replays the items before it, so a failed result is never replayed
+    as a shorter result. Exceptions which are not an Exception, like KeyboardInterrupt, are only raised to the
+    iteration which pulled the item and are not stored.
+
+    Attributes:
+        iterator: The underlying iterator or None when it is exhausted.
+        items: The items pulled from the underlying iterator so far.
+        exception: The exception raised by the underlying iterator or None if it did not raise one.
+        lock: The lock which keeps concurrent iterations from pulling from the iterator at the same time.
+
+    Args:
+        iterator: The iterator to store the items of.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    iterator: Iterator | None
+    items: list[Any]
+    exception: Exception | None = None
+    lock: Lock
+
+    # Properties #
+    @property
+    def is_exhausted(self) -> bool:
+        """Determines if all items have been pulled from the underlying iterator."""
+        return self.iterator is None
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, iterator: Iterator | None = None, *args: Any, init: bool = True, **kwargs: Any) -> None:
+        # New Attributes #
+        self.iterator: Iterator | None = None
+        self.items: list[Any] = []
+        self.lock: Lock = Lock()
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(iterator=iterator, *args, **kwargs)
+
+    # Iteration
+    def __iter__(self) -> Iterator[Any]:
+        """Creates an iterator which replays the stored items and then continues from the underlying iterator.
+
+        Returns:
+            The replaying iterator.
+        """
+        items = self.items
+        index = 0
+        while True:
+            if index < len(items):
+                yield items[index]
+                index += 1
+            elif self.iterator is None:
+                if self.exception is not None:
+                    raise self.exception
+                return
+            else:
+                with self.lock:
+                    # Another iteration may have pulled an item while this one waited.
+                    if index == len(items) and self.iterator is not None:
+                        try:
+                            items.append(next(self.iterator))
+                        except StopIteration:
+                            self.iterator = None
+                        except Exception as exception:
+                            self.exception = exception
+                            self.iterator = None
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, iterator: Iterator | None = None, *args: Any, **kwargs: Any) -> None:
+        """The constructor for this object.
+
+        Args:
+            iterator: The iterator to store the items of.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if iterator is not None:
+            self.iterator = iterator
+
+        super().construct(*args, **kwargs)
+
+
+class ReplayFunction(BaseFunction):
+    """A function which wraps iterator results in a ReplayIterable so that they can be cached and replayed."""
+
+    # Magic Methods #
+    # Calling
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the wrapped function and wraps the result in a ReplayIterable if it is an iterator.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The output of the wrapped function, which is a ReplayIterable if the output was an iterator.
+        """
+        result = self.__wrapped__(*args, **kwargs)
+        return ReplayIterable(result) if isinstance(result, Iterator) else result
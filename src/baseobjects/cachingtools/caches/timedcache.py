@@ -13,7 +13,8 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
+from copy import copy
 from time import perf_counter
 from typing import Any
 
@@ -23,7 +24,9 @@ from typing import Any
 from ...typing import AnyCallable
 from ...bases import search_sentinel
 from ...collections import CircularDoublyLinkedContainer
-from .basetimedcache import BaseTimedCacheCallable, BaseTimedCacheMethod, BaseTimedCache
+from ...functions import MethodMultiplexer
+from .basetimedcache import NegativeCacheItem, BaseTimedCacheCallable, BaseTimedCacheMethod, BaseTimedCache
+from .cachecompressor import CacheCompressor
 
 
 # Definitions #
@@ -31,14 +34,34 @@ from .basetimedcache import BaseTimedCacheCallable, BaseTimedCacheMethod, BaseTi
 class TimedCacheCallable(BaseTimedCacheCallable):
     """A periodically clearing multiple item cache wrapper object for a function.
 
+    Negative caching stores exceptions and negative results (e.g. "not found" sentinels) in a separate container with
+    their own, usually shorter, lifetime. When enabled, the negative caching method is selected as the cache method and
+    the normal caching method is moved to the positive cache multiplexer.
+
+    Compression is an opt-in mode which compresses large str and bytes results with a stdlib codec while they are in
+    the cache and decompresses them on a cache hit. The compressor's statistics show the time spent against the memory
+    saved.
+
     Class Attributes:
         priority_queue_type = The type of priority queue to hold cache item priorities.
+        negative_item_type = The class that will create the negative cache items.
 
     Attributes:
         _maxsize: The number of results the cache will hold before replacing results.
 
         priority: The object that will control the replacement of cached results.
 
+        _is_negative_caching: Determines if exceptions and negative results are cached.
+        _negative_cache_method: The name of the negative caching method.
+        cache_exceptions: The exception types which will be cached and raised on a cache hit.
+        negative_results: The results which are cached as negative results, compared by identity.
+        negative_lifetime: The period negative results and exceptions stay in the cache in seconds.
+        negative_container: Contains the negative results and exceptions of the wrapped function.
+        positive_cache: The multiplexer which control the caching method being use for normal results.
+
+        compressor_type: The type of compressor to create when compression is set.
+        compressor: The compressor of the results or None if the results are not compressed.
+
     Args:
         func: The function to wrap.
         maxsize: The max size of the cache.
@@ -46,6 +69,12 @@ class TimedCacheCallable(BaseTimedCacheCallable):
         lifetime: The period between cache resets in seconds.
         call_method: The default call method to use.
         local: Determines if the cache is local to each instance or all instances.
+        cache_exceptions: The exception types which will be cached and raised on a cache hit.
+        negative_results: The results which are cached as negative results, compared by identity.
+        negative_lifetime: The period negative results and exceptions stay in the cache in seconds.
+        compression: The name of the codec to compress results with or None for no compression.
+        compression_threshold: The minimum length of a result before it is compressed.
+        compressor: A compressor to share with another cache, which is used instead of creating one.
         *args: Arguments for inheritance.
         init: Determines if this object will construct.
         **kwargs: Keyword arguments for inheritance.
@@ -57,7 +86,48 @@ class TimedCacheCallable(BaseTimedCacheCallable):
     priority_queue_type: type[CircularDoublyLinkedContainer] = CircularDoublyLinkedContainer
     priority: Any
 
+    _is_negative_caching: bool = False
+    _negative_cache_method: str = "negative_caching"
+    negative_item_type: type[NegativeCacheItem] = NegativeCacheItem
+    cache_exceptions: tuple[type[BaseException], ...] = ()
+    negative_results: tuple[Any, ...] = ()
+    negative_lifetime: int | float | None = None
+    negative_container: dict
+    positive_cache: MethodMultiplexer
+
+    compressor_type: type[CacheCompressor] = CacheCompressor
+    compressor: CacheCompressor | None = None
+
     # Properties #
+    @property
+    def cache_method(self) -> str:
+        """The name of the method used when caching normal results."""
+        return self._cache_method
+
+    @cache_method.setter
+    def cache_method(self, value: str) -> None:
+        if self._is_negative_caching:
+            self.positive_cache.select(value)
+            self.cache.select(self._negative_cache_method)
+        else:
+            self.cache.select(value)
+        self._cache_method = value
+
+    @property
+    def is_negative_caching(self) -> bool:
+        """Determines if exceptions and negative results are cached."""
+        return self._is_negative_caching
+
+    @property
+    def compression(self) -> str | None:
+        """The name of the codec used to compress results or None if the results are not compressed."""
+        return None if self.compressor is None else self.compressor.codec
+
+    @property
+    def compression_threshold(self) -> int | None:
+        """The minimum length of a result before it is compressed."""
+        return None if self.compressor is None else self.compressor.threshold
+
     @property
     def maxsize(self) -> int:
         """The cache's max size and when updated it changes the cache to its optimal handle function."""
@@ -77,12 +147,20 @@ class TimedCacheCallable(BaseTimedCacheCallable):
         lifetime: int | float | None = None,
         call_method: str | None = None,
         local: bool | None = None,
+        cache_exceptions: Iterable[type[BaseException]] | None = None,
+        negative_results: Iterable[Any] | None = None,
+        negative_lifetime: int | float | None = None,
+        compression: str | None = None,
+        compression_threshold: int | None = None,
+        compressor: CacheCompressor | None = None,
         *args: Any,
         init: bool = True,
         **kwargs: Any,
     ) -> None:
         # New Attributes #
         self.priority: Any = self.priority_queue_type()
+        self.negative_container: dict = {}
+        self.positive_cache: MethodMultiplexer = MethodMultiplexer(instance=self, select=self._cache_method)
 
         # Parent Attributes #
         super().__init__(*args, init=False, **kwargs)
@@ -99,6 +177,12 @@ class TimedCacheCallable(BaseTimedCacheCallable):
                 typed=typed,
                 call_method=call_method,
                 local=local,
+                cache_exceptions=cache_exceptions,
+                negative_results=negative_results,
+                negative_lifetime=negative_lifetime,
+                compression=compression,
+                compression_threshold=compression_threshold,
+                compressor=compressor,
                 *args,
                 **kwargs,
             )
@@ -118,6 +202,12 @@ class TimedCacheCallable(BaseTimedCacheCallable):
         lifetime: int | float | None = None,
         call_method: str | None = None,
         local: bool = True,
+        cache_exceptions: Iterable[type[BaseException]] | None = None,
+        negative_results: Iterable[Any] | None = None,
+        negative_lifetime: int | float | None = None,
+        compression: str | None = None,
+        compression_threshold: int | None = None,
+        compressor: CacheCompressor | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -130,12 +220,30 @@ class TimedCacheCallable(BaseTimedCacheCallable):
             lifetime: The period between cache resets in seconds.
             call_method: The default call method to use.
             local: Determines if the cache is local to each instance or all instances.
+            cache_exceptions: The exception types which will be cached and raised on a cache hit.
+            negative_results: The results which are cached as negative results, compared by identity.
+            negative_lifetime: The period negative results and exceptions stay in the cache in seconds.
+            compression: The name of the codec to compress results with or None for no compression.
+            compression_threshold: The minimum length of a result before it is compressed.
+            compressor: A compressor to share with another cache, which is used instead of creating one.
             *args: Arguments for inheritance.
             **kwargs: Keyword arguments for inheritance.
         """
         if maxsize is not None:
             self.maxsize = maxsize
 
+        if cache_exceptions or negative_results or negative_lifetime is not None:
+            self.set_negative_caching(
+                cache_exceptions=cache_exceptions,
+                negative_results=negative_results,
+                negative_lifetime=negative_lifetime,
+            )
+
+        if compressor is not None:
+            self.set_compressor(compressor)
+        elif compression is not None:
+            self.set_compression(compression, compression_threshold)
+
         super().construct(
             func=func,
             typed=typed,
@@ -164,7 +272,8 @@ class TimedCacheCallable(BaseTimedCacheCallable):
             return cache_item.result
         else:
             result = self.__func__(*args, **kwargs)
-            self.cache_container[key] = self.cache_item_type(key=key, result=result)
+            if not (self._is_negative_caching and self.is_negative_result(result)):
+                self.cache_container[key] = self.cache_item_type(key=key, result=result)
             return result
 
     def limited_cache(self, *args: Any, **kwargs: Any) -> Any:
@@ -184,14 +293,110 @@ class TimedCacheCallable(BaseTimedCacheCallable):
             return cache_item.result
         else:
             result = self.__func__(*args, **kwargs)
+            if self._is_negative_caching and self.is_negative_result(result):
+                return result
             if self.cache_container.__len__() <= self._maxsize:
                 self.cache_container[key] = self.cache_item_type(result=result)
             return result
 
+    def negative_caching(self, *args: Any, **kwargs: Any) -> Any:
+        """Caching which separately caches exceptions and negative results, then uses the positive cache for the rest.
+
+        The positive cache does not store negative results, so they do not evict positive results. A cached exception
+        is raised as a copy, so the frames of each call it is raised in are not kept by the cache.
+
+        Args:
+            *args: Arguments of the wrapped function.
+            **kwargs: Keyword Arguments of the wrapped function.
+
+        Returns:
+            The result of the wrapped function.
+        """
+        key = self.create_key(args, kwargs, self.typed)
+        negative_item = self.negative_container.get(key, search_sentinel)
+
+        if negative_item is not search_sentinel:
+            if negative_item.expiration is None or perf_counter() < negative_item.expiration:
+                if negative_item.is_exception:
+                    raise self.copy_exception(negative_item.result).with_traceback(negative_item.traceback)
+                return negative_item.result
+            else:
+                del self.negative_container[key]
+
+        try:
+            result = self.positive_cache.target(*args, **kwargs)
+        except self.cache_exceptions as error:
+            self.negative_container[key] = self.create_negative_item(key, error, is_exception=True)
+            raise
+
+        if self.is_negative_result(result):
+            self.negative_container[key] = self.create_negative_item(key, result)
+
+        return result
+
     # Cache Control
+    def is_negative_result(self, result: Any) -> bool:
+        """Determines if a result is one of the negative results, which are compared by identity.
+
+        Args:
+            result: The result to check.
+
+        Returns:
+            True if the result is a negative result.
+        """
+        for negative_result in self.negative_results:
+            if result is negative_result:
+                return True
+        return False
+
+    def copy_exception(self, error: BaseException) -> BaseException:
+        """Copies a cached exception to raise, or clears its traceback if it cannot be copied.
+
+        Args:
+            error: The cached exception.
+
+        Returns:
+            The exception to raise.
+        """
+        try:
+            new = copy(error)
+        except Exception:
+            return error.with_traceback(None)
+        new.__cause__ = error.__cause__
+        new.__suppress_context__ = error.__suppress_context__
+        return new
+
+    def create_negative_item(self, key: Hashable, result: Any, is_exception: bool = False) -> NegativeCacheItem:
+        """Creates an item for the negative cache which expires after the negative lifetime.
+
+        Args:
+            key: The key to the item in the negative cache.
+            result: The negative result or exception to store.
+            is_exception: Determines if the result is an exception which should be raised.
+
+        Returns:
+            The new negative cache item.
+        """
+        return self.negative_item_type(
+            key=key,
+            result=result,
+            expiration=None if self.negative_lifetime is None else perf_counter() + self.negative_lifetime,
+            is_exception=is_exception,
+            traceback=result.__traceback__ if is_exception else None,
+        )
+
+    def remove_item(self, key: Hashable) -> None:
+        """Removes an item from the cache if it is present.
+
+        Args:
+            key: The key of the item to remove.
+        """
+        self.cache_container.pop(key, None)
+
     def clear_cache(self) -> None:
         """Clear the cache and update the expiration of the cache."""
         self.cache_container.clear()
+        self.negative_container.clear()
         self.priority.clear()
         if self.lifetime is not None:
             self.expiration = perf_counter() + self.lifetime
@@ -211,6 +416,53 @@ class TimedCacheCallable(BaseTimedCacheCallable):
 
         self._maxsize = value
 
+    def set_negative_caching(
+        self,
+        cache_exceptions: Iterable[type[BaseException]] | None = None,
+        negative_results: Iterable[Any] | None = None,
+        negative_lifetime: int | float | None = None,
+    ) -> None:
+        """Sets what will be negatively cached and enables negative caching if there is anything to cache.
+
+        Args:
+            cache_exceptions: The exception types which will be cached and raised on a cache hit.
+            negative_results: The results which are cached as negative results, compared by identity.
+            negative_lifetime: The period negative results and exceptions stay in the cache in seconds.
+        """
+        if cache_exceptions is not None:
+            self.cache_exceptions = tuple(cache_exceptions)
+
+        if negative_results is not None:
+            self.negative_results = tuple(negative_results)
+
+        if negative_lifetime is not None:
+            self.negative_lifetime = negative_lifetime
+
+        self._is_negative_caching = bool(self.cache_exceptions or self.negative_results)
+        self.cache_method = self._cache_method
+        self.negative_container.clear()
+
+    def set_compression(self, codec: str | None, threshold: int | None = None) -> None:
+        """Sets the codec to compress new results with, items already in the cache keep their own compression.
+
+        Args:
+            codec: The name of the codec to compress results with or None for no compression.
+            threshold: The minimum length of a result before it is compressed.
+        """
+        self.set_compressor(None if codec is None else self.compressor_type(codec=codec, threshold=threshold))
+
+    def set_compressor(self, compressor: CacheCompressor | None) -> None:
+        """Sets the compressor of new results, which can be shared with other caches to share its statistics.
+
+        Args:
+            compressor: The compressor of the results or None for no compression.
+        """
+        self.compressor = compressor
+        if compressor is None:
+            self.cache_item_type = type(self).cache_item_type
+        else:
+            self.cache_item_type = compressor.create_item
+
     def poll(self) -> bool:
         """Check if the cache has reached its max size."""
         return self.cache_container.__len__() <= self._maxsize
@@ -251,6 +503,10 @@ class TimedCache(TimedCacheCallable, BaseTimedCache):
             call_method=self.call_method,
             local=self.is_local,
             maxsize=self.maxsize,
+            cache_exceptions=self.cache_exceptions,
+            negative_results=self.negative_results,
+            negative_lifetime=self.negative_lifetime,
+            compressor=self.compressor,
         )
 
     def bind_to_attribute(
@@ -281,6 +537,10 @@ class TimedCache(TimedCacheCallable, BaseTimedCache):
             call_method=self.call_method,
             local=self.is_local,
             maxsize=self.maxsize,
+            cache_exceptions=self.cache_exceptions,
+            negative_results=self.negative_results,
+            negative_lifetime=self.negative_lifetime,
+            compressor=self.compressor,
         )
         setattr(instance, name, method)
 
@@ -294,6 +554,12 @@ def timed_cache(
     lifetime: int | float | None = None,
     call_method: str | None = None,
     local: bool = True,
+    cache_exceptions: Iterable[type[BaseException]] | None = None,
+    negative_results: Iterable[Any] | None = None,
+    negative_lifetime: int | float | None = None,
+    compression: str | None = None,
+    compression_threshold: int | None = None,
+    replay: bool = False,
 ) -> Callable[[AnyCallable], TimedCache]:
     """A factory to be used a decorator that sets the parameters of timed cache function factory.
 
@@ -303,6 +569,12 @@ def timed_cache(
         lifetime: The period between cache resets in seconds.
         call_method: The default call method to use.
         local: Determines if the cache is local for all method bindings or for each instance.
+        cache_exceptions: The exception types which will be cached and raised on a cache hit.
+        negative_results: The results which are cached as negative results, compared by identity.
+        negative_lifetime: The period negative results and exceptions stay in the cache in seconds.
+        compression: The name of the codec to compress results with or None for no compression.
+        compression_threshold: The minimum length of a result before it is compressed.
+        replay: Determines if iterator results are cached as iterables which lazily replay their items.
 
     Returns:
         The parameterized timed cache function factory.
@@ -324,6 +596,12 @@ def timed_cache(
             lifetime=lifetime,
             call_method=call_method,
             local=local,
+            cache_exceptions=cache_exceptions,
+            negative_results=negative_results,
+            negative_lifetime=negative_lifetime,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            replay=replay,
         )
 
     return timed_cache_factory
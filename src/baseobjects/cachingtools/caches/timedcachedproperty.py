@@ -0,0 +1,199 @@
+"""timedcachedproperty.py
+A cached property which stores its value in the instance and can expire after a lifetime.
+"""
+# Package Header #
+from ...header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from ...typing import AnyCallable
+from ...bases import BaseObject
+
+
+# Definitions #
+# Classes #
+class TimedCachedProperty(BaseObject):
+    """A cached property which stores its value in the instance and can expire after a lifetime.
+
+    Like functools.cached_property, the value is stored in the instance's __dict__, so a cache hit is a dict lookup
+    rather than a chain of wrapper calls. Without a lifetime the value is stored under the property's name, which
+    shadows this non-data descriptor and makes a hit a plain attribute access. With a lifetime the value and its
+    expiration are stored under a separate name and checked on each access.
+
+    Attributes:
+        func: The function which computes the value of the property.
+        lifetime: The period the value is cached for in seconds or None to cache until cleared.
+        attrname: The name of the property in its owner class.
+        cache_name: The name the timed value is stored under in the instance's __dict__.
+        disabled_name: The name of the flag in the instance's __dict__ which disables caching.
+
+    Args:
+        func: The function which computes the value of the property.
+        lifetime: The period the value is cached for in seconds or None to cache until cleared.
+        init: Determines if this object will construct.
+        *args: Arguments for inheritance.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    func: AnyCallable | None = None
+    lifetime: int | float | None = None
+    attrname: str | None = None
+    cache_name: str | None = None
+    disabled_name: str | None = None
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        func: AnyCallable | None = None,
+        lifetime: int | float | None = None,
+        init: bool = True,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(func=func, lifetime=lifetime, *args, **kwargs)
+
+    # Descriptor
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        """Sets the names used to store the value in instances when this property is assigned to a class.
+
+        Args:
+            owner: The class this property is assigned to.
+            name: The name of this property in the class.
+        """
+        if self.attrname is None:
+            self.attrname = name
+            self.cache_name = f"_{name}_cached_value_"
+            self.disabled_name = f"_{name}_caching_disabled_"
+        elif name != self.attrname:
+            raise TypeError(
+                f"Cannot assign the same TimedCachedProperty to two different names ({self.attrname!r} and {name!r})."
+            )
+
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> Any:
+        """Gets the cached value from the instance or computes and caches it.
+
+        Args:
+            instance: The object to get the value for.
+            owner: The class of the object.
+
+        Returns:
+            The value of this property or this object if accessed from the class.
+        """
+        if instance is None:
+            return self
+
+        instance_dict = instance.__dict__
+        cached = instance_dict.get(self.cache_name, None)
+        if cached is not None and perf_counter() < cached[1]:
+            return cached[0]
+
+        if self.attrname is None:
+            raise TypeError("Cannot use a TimedCachedProperty without calling __set_name__ on it.")
+
+        value = self.func(instance)
+        if self.disabled_name not in instance_dict:
+            if self.lifetime is None:
+                instance_dict[self.attrname] = value
+            else:
+                instance_dict[self.cache_name] = (value, perf_counter() + self.lifetime)
+        return value
+
+    # Instance Methods #
+    # Constructors
+    def construct(
+        self,
+        func: AnyCallable | None = None,
+        lifetime: int | float | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            func: The function which computes the value of the property.
+            lifetime: The period the value is cached for in seconds or None to cache until cleared.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if func is not None:
+            self.func = func
+            self.__doc__ = func.__doc__
+
+        if lifetime is not None:
+            self.lifetime = lifetime
+
+        super().construct(*args, **kwargs)
+
+    # Cache Control
+    def clear_cache(self, instance: Any) -> None:
+        """Clears the cached value in an instance.
+
+        Args:
+            instance: The object to clear the cached value of.
+        """
+        instance_dict = instance.__dict__
+        instance_dict.pop(self.attrname, None)
+        instance_dict.pop(self.cache_name, None)
+
+    def stop_caching(self, instance: Any) -> None:
+        """Stops caching the value in an instance and clears the cached value.
+
+        Args:
+            instance: The object to stop caching the value of.
+        """
+        instance.__dict__[self.disabled_name] = True
+        self.clear_cache(instance)
+
+    def resume_caching(self, instance: Any) -> None:
+        """Resumes caching the value in an instance.
+
+        Args:
+            instance: The object to resume caching the value of.
+        """
+        instance.__dict__.pop(self.disabled_name, None)
+
+
+# Functions #
+def timed_cached_property(lifetime: int | float | None = None) -> Callable[[AnyCallable], TimedCachedProperty]:
+    """A factory to be used a decorator that sets the parameters of timed cached property factory.
+
+    Args:
+        lifetime: The period the value is cached for in seconds or None to cache until cleared.
+
+    Returns:
+        The parameterized timed cached property factory.
+    """
+
+    def timed_cached_property_factory(func: AnyCallable) -> TimedCachedProperty:
+        """A factory for wrapping a function with a TimedCachedProperty object.
+
+        Args:
+            func: The function to wrap with a TimedCachedProperty.
+
+        Returns:
+            The TimedCachedProperty object which wraps the given function.
+        """
+        return TimedCachedProperty(func, lifetime=lifetime)
+
+    return timed_cached_property_factory
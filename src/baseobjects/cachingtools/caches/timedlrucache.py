@@ -13,21 +13,35 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
-from collections.abc import Callable
+from collections.abc import Callable, Hashable, Iterable
 from typing import Any
 
 # Third-Party Packages #
 
 # Local Packages #
 from ...typing import AnyCallable
-from ...bases import search_sentinel
+from ...bases import ObjectPool, search_sentinel
+from .basetimedcache import CacheItem
+from .cachecompressor import CacheCompressor
 from .timedcache import TimedCacheCallable, TimedCacheMethod, TimedCache
 
 
 # Definitions #
 # Classes #
-class TimedLRUCache(TimedCacheCallable):
-    """A periodically clearing Least Recently Used (LRU) cache wrapper object for a function."""
+class TimedLRUCacheCallable(TimedCacheCallable):
+    """A periodically clearing Least Recently Used (LRU) cache wrapper object for a function.
+
+    New cache items are created for new results unless an item pool is set, then the uncompressed items are acquired
+    from the pool and released back to it when they are evicted or removed. An item pool must only be set when the
+    cache items are not kept outside of this cache, which includes by evict, and when the pool is only used like this
+    cache is used.
+
+    Attributes:
+        item_pool: The pool which the cache items are acquired from and released to, if any.
+    """
+
+    # Attributes #
+    item_pool: ObjectPool | None = None
 
     # Instance Methods #
     # LRU Caching
@@ -48,10 +62,11 @@ class TimedLRUCache(TimedCacheCallable):
             self.priority.move_node_start(cache_item.priority_link)
             return cache_item.result
         else:
-            result = self.__func__(*args, **kwargs)
-            self.cache_container[key] = item = self.cache_item_type(key=key, result=result)
-            priority_link = self.priority.insert(item, 0)
-            item.priority_link = priority_link
+            result = self.miss(key, args, kwargs)
+            if not (self._is_negative_caching and self.is_negative_result(result)):
+                self.cache_container[key] = item = self.cache_item_type(key=key, result=result)
+                priority_link = self.priority.insert(item, 0)
+                item.priority_link = priority_link
             return result
 
     def limited_cache(self, *args: Any, **kwargs: Any) -> Any:
@@ -71,31 +86,89 @@ class TimedLRUCache(TimedCacheCallable):
             self.priority.move_node_start(cache_item.priority_link)
             return cache_item.result
         else:
-            result = self.__func__(*args, **kwargs)
-            if self.cache_container.__len__() <= self._maxsize:
+            result = self.miss(key, args, kwargs)
+            if self._is_negative_caching and self.is_negative_result(result):
+                return result
+            if self.cache_container.__len__() < self._maxsize:
                 self.cache_container[key] = item = self.cache_item_type(key=key, result=result)
                 priority_link = self.priority.insert(item, 0)
                 item.priority_link = priority_link
             else:
+                # Reuse the least recently used item's link for the new item.
                 priority_link = self.priority.last_node
-                old_key = priority_link.key
+                old_item = priority_link.data
+                del self.cache_container[old_item.key]
+                self.evict(old_item)
+                if self.item_pool is not None:
+                    self.item_pool.release(old_item)
 
                 item = self.cache_item_type(key=key, result=result, priority_link=priority_link)
                 priority_link.data = item
-
-                del cache_item[old_key]
                 self.cache_container[key] = item
 
                 self.priority.shift_right()
 
             return result
 
+    # Cache Control
+    def miss(self, key: Hashable, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Gets the result of a call whose key is not in the cache.
+
+        Args:
+            key: The cache key of the call.
+            args: Arguments of the wrapped function.
+            kwargs: Keyword Arguments of the wrapped function.
+
+        Returns:
+            The result of the wrapped function.
+        """
+        return self.__func__(*args, **kwargs)
+
+    def evict(self, cache_item: CacheItem) -> None:
+        """Handles an item which was removed from a full cache to make room for a new item.
+
+        Args:
+            cache_item: The least recently used item which was removed from the cache.
+        """
+        pass
+
+    def remove_item(self, key: Hashable) -> None:
+        """Removes an item and its priority from the cache if it is present.
+
+        Args:
+            key: The key of the item to remove.
+        """
+        cache_item = self.cache_container.pop(key, search_sentinel)
+        if cache_item is not search_sentinel:
+            self.priority.remove_node(cache_item.priority_link)
+            if self.item_pool is not None:
+                self.item_pool.release(cache_item)
+
+    def set_compressor(self, compressor: CacheCompressor | None) -> None:
+        """Sets the compressor of new results, which can be shared with other caches to share its statistics.
+
+        Args:
+            compressor: The compressor of the results or None for no compression.
+        """
+        super().set_compressor(compressor)
+        if compressor is None and self.item_pool is not None:
+            self.cache_item_type = self.item_pool.acquire
+
+    def set_item_pool(self, pool: ObjectPool | None) -> None:
+        """Sets the pool which the uncompressed cache items are acquired from and released to.
+
+        Args:
+            pool: The pool of CacheItems or None to create new items.
+        """
+        self.item_pool = pool
+        self.set_compressor(self.compressor)
+
 
-class TimedLRUCacheMethod(TimedLRUCache, TimedCacheMethod):
+class TimedLRUCacheMethod(TimedLRUCacheCallable, TimedCacheMethod):
     """A method class for TimeLRUCache."""
 
 
-class TimedLRUCache(TimedLRUCache, TimedCache):
+class TimedLRUCache(TimedLRUCacheCallable, TimedCache):
     """A function class for TimedLRUCache."""
 
     # Attributes #
@@ -109,6 +182,12 @@ def timed_lru_cache(
     lifetime: int | float | None = None,
     call_method: str | None = None,
     local: bool = False,
+    cache_exceptions: Iterable[type[BaseException]] | None = None,
+    negative_results: Iterable[Any] | None = None,
+    negative_lifetime: int | float | None = None,
+    compression: str | None = None,
+    compression_threshold: int | None = None,
+    replay: bool = False,
 ) -> Callable[[AnyCallable], TimedLRUCache]:
     """A factory to be used a decorator that sets the parameters of timed lru cache function factory.
 
@@ -118,6 +197,12 @@ def timed_lru_cache(
         lifetime: The period between cache resets in seconds.
         call_method: The default call method to use.
         local: Determines if the cache is local for all method bindings or for each instance.
+        cache_exceptions: The exception types which will be cached and raised on a cache hit.
+        negative_results: The results which are cached as negative results, compared by identity.
+        negative_lifetime: The period negative results and exceptions stay in the cache in seconds.
+        compression: The name of the codec to compress results with or None for no compression.
+        compression_threshold: The minimum length of a result before it is compressed.
+        replay: Determines if iterator results are cached as iterables which lazily replay their items.
 
     Returns:
         The parameterized timed lru cache function factory.
@@ -139,6 +224,12 @@ def timed_lru_cache(
             lifetime=lifetime,
             call_method=call_method,
             local=local,
+            cache_exceptions=cache_exceptions,
+            negative_results=negative_results,
+            negative_lifetime=negative_lifetime,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            replay=replay,
         )
 
     return timed_lru_cache_factory
@@ -0,0 +1,354 @@
+"""timedtieredcache.py
+A two-tier cache with an in-memory lru front tier which demotes evicted results to a larger second tier.
+"""
+# Package Header #
+from ...header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Callable, Hashable, Iterable, MutableMapping
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from ...typing import AnyCallable
+from ...bases import search_sentinel
+from .basetimedcache import CacheItem
+from .cachecompressor import CompressedPayload
+from .timedlrucache import TimedLRUCacheCallable, TimedLRUCacheMethod, TimedLRUCache
+
+
+# Definitions #
+# Classes #
+class TimedTieredCacheCallable(TimedLRUCacheCallable):
+    """A periodically clearing two-tier cache wrapper object for a function.
+
+    The front tier is the lru cache held in memory. When the front tier is full, the least recently used result is
+    demoted to the second tier instead of being discarded. Misses in the front tier check the second tier before the
+    wrapped function is evaluated and results found there are promoted back to the front tier. The second tier can be
+    any mutable mapping such as a dict, a shelve, or a shared-memory store. Mappings that require specific keys, like
+    shelve's str keys, can be supported by giving a function which converts cache keys to tier keys. Bound methods
+    share the second tier of the function they are bound from.
+
+    The second tier is only cleared with the front tier when it was created by this cache. A given second tier may be
+    shared with other caches or processes, so only the results which this cache demoted to it are removed when the
+    cache clears, which keeps results older than the lifetime from being promoted.
+
+    Class Attributes:
+        second_tier_type: The type of mapping to create when no second tier is given.
+
+    Attributes:
+        second_tier: The larger mapping which holds results demoted from the front tier.
+        _owns_second_tier: Determines if the second tier was created by this cache and is cleared with it.
+        demoted: The tier keys of the results this cache demoted to a given second tier.
+        tier_key: A function which converts a cache key into a key for the second tier.
+
+    Args:
+        func: The function to wrap.
+        maxsize: The max size of the front tier.
+        second_tier: The larger mapping which holds results demoted from the front tier.
+        tier_key: A function which converts a cache key into a key for the second tier.
+        typed: Determines if the function's arguments are type sensitive for caching.
+        lifetime: The period between cache resets in seconds.
+        call_method: The default call method to use.
+        local: Determines if the cache is local to each instance or all instances.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    second_tier_type: type[MutableMapping] = dict
+    second_tier: MutableMapping
+    _owns_second_tier: bool = True
+    demoted: set[Hashable]
+    tier_key: AnyCallable | None = None
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        func: AnyCallable | None = None,
+        maxsize: int | None = None,
+        second_tier: MutableMapping | None = None,
+        tier_key: AnyCallable | None = None,
+        typed: bool | None = None,
+        lifetime: int | float | None = None,
+        call_method: str | None = None,
+        local: bool | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.second_tier: MutableMapping = self.second_tier_type()
+        self.demoted: set[Hashable] = set()
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(
+                func=func,
+                maxsize=maxsize,
+                second_tier=second_tier,
+                tier_key=tier_key,
+                typed=typed,
+                lifetime=lifetime,
+                call_method=call_method,
+                local=local,
+                *args,
+                **kwargs,
+            )
+
+    # Instance Methods #
+    # Constructors
+    def construct(
+        self,
+        func: AnyCallable | None = None,
+        maxsize: int | None = None,
+        second_tier: MutableMapping | None = None,
+        tier_key: AnyCallable | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            func:  The function to wrap.
+            maxsize: The max size of the front tier.
+            second_tier: The larger mapping which holds results demoted from the front tier.
+            tier_key: A function which converts a cache key into a key for the second tier.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if second_tier is not None:
+            self.second_tier = second_tier
+            self._owns_second_tier = False
+
+        if tier_key is not None:
+            self.tier_key = tier_key
+
+        super().construct(func=func, maxsize=maxsize, *args, **kwargs)
+
+    # Cache Control
+    def create_tier_key(self, key: Hashable) -> Hashable:
+        """Creates the key of an item in the second tier from its cache key.
+
+        Args:
+            key: The cache key of the item.
+
+        Returns:
+            The key of the item in the second tier.
+        """
+        return key if self.tier_key is None else self.tier_key(key)
+
+    def miss(self, key: Hashable, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        """Gets the result of a call whose key is not in the front tier, promoting it from the second tier if present.
+
+        Args:
+            key: The cache key of the call.
+            args: Arguments of the wrapped function.
+            kwargs: Keyword Arguments of the wrapped function.
+
+        Returns:
+            The result from the second tier or of the wrapped function.
+        """
+        result = self.promote(key)
+        return super().miss(key, args, kwargs) if result is search_sentinel else result
+
+    def promote(self, key: Hashable) -> Any:
+        """Removes a result from the second tier so that it can be placed in the front tier.
+
+        Args:
+            key: The cache key of the result.
+
+        Returns:
+            The result from the second tier or the search sentinel if the result is not in the second tier.
+        """
+        tier_key = self.create_tier_key(key)
+        result = self.second_tier.pop(tier_key, search_sentinel)
+        self.demoted.discard(tier_key)
+        if type(result) is CompressedPayload:
+            compressor = self.compressor
+            if compressor is None or compressor.codec != result.codec:
+                compressor = self.compressor_type(codec=result.codec)
+            result = compressor.decompress(result.payload, result.result_type)
+        return result
+
+    def evict(self, cache_item: CacheItem) -> None:
+        """Demotes an item which was removed from the full front tier to the second tier.
+
+        A compressed result is moved as it is, so it is only decompressed if it is promoted.
+
+        Args:
+            cache_item: The least recently used item which was removed from the front tier.
+        """
+        tier_key = self.create_tier_key(cache_item.key)
+        self.second_tier[tier_key] = cache_item.get_stored_result()
+        if not self._owns_second_tier:
+            self.demoted.add(tier_key)
+
+    def remove_item(self, key: Hashable) -> None:
+        """Removes an item from both tiers if it is present.
+
+        Args:
+            key: The key of the item to remove.
+        """
+        super().remove_item(key)
+        tier_key = self.create_tier_key(key)
+        self.second_tier.pop(tier_key, None)
+        self.demoted.discard(tier_key)
+
+    def clear_cache(self) -> None:
+        """Clear the front tier and the results this cache put in the second tier, and update the expiration."""
+        if self._owns_second_tier:
+            self.second_tier.clear()
+        else:
+            for tier_key in self.demoted:
+                self.second_tier.pop(tier_key, None)
+        self.demoted.clear()
+        super().clear_cache()
+
+    def get_length(self) -> int:
+        """Gets the length of both tiers of the cache."""
+        return self.cache_container.__len__() + self.second_tier.__len__()
+
+
+class TimedTieredCacheMethod(TimedTieredCacheCallable, TimedLRUCacheMethod):
+    """A method class for TimedTieredCache."""
+
+
+class TimedTieredCache(TimedTieredCacheCallable, TimedLRUCache):
+    """A function class for TimedTieredCache."""
+
+    # Attributes #
+    method_type: type[TimedTieredCacheMethod] = TimedTieredCacheMethod
+
+    # Instance Methods #
+    # Binding
+    def bind(self, instance: Any = None, owner: type[Any] | None = None) -> TimedTieredCacheMethod:
+        """Creates a method of this function which is bound to another object.
+
+        Args:
+            instance: The object to bind the method to.
+            owner: The class of the object being bound to.
+
+        Returns:
+            The bound method of this function.
+        """
+        return self.method_type(
+            func=self,
+            instance=instance,
+            owner=owner,
+            typed=self.typed,
+            lifetime=self.lifetime,
+            call_method=self.call_method,
+            local=self.is_local,
+            maxsize=self.maxsize,
+            second_tier=self.second_tier,
+            tier_key=self.tier_key,
+            cache_exceptions=self.cache_exceptions,
+            negative_results=self.negative_results,
+            negative_lifetime=self.negative_lifetime,
+            compressor=self.compressor,
+        )
+
+    def bind_to_attribute(
+        self,
+        instance: Any = None,
+        owner: type[Any] | None = None,
+        name: str | None = None,
+    ) -> TimedTieredCacheMethod:
+        """Creates a method of this function which is bound to another object and sets the method an attribute.
+
+        Args:
+            instance: The object to bind the method to.
+            owner: The class of the object being bound to.
+            name: The name of the attribute to set the method to. Default is the function name.
+
+        Returns:
+            The bound method of this function.
+        """
+        if name is None:
+            name = self.__func__.__name__
+
+        method = self.bind(instance=instance, owner=owner)
+        setattr(instance, name, method)
+
+        return method
+
+
+# Functions #
+def timed_tiered_cache(
+    maxsize: int | None = None,
+    second_tier: MutableMapping | None = None,
+    tier_key: AnyCallable | None = None,
+    typed: bool = False,
+    lifetime: int | float | None = None,
+    call_method: str | None = None,
+    local: bool = False,
+    cache_exceptions: Iterable[type[BaseException]] | None = None,
+    negative_results: Iterable[Any] | None = None,
+    negative_lifetime: int | float | None = None,
+    compression: str | None = None,
+    compression_threshold: int | None = None,
+    replay: bool = False,
+) -> Callable[[AnyCallable], TimedTieredCache]:
+    """A factory to be used a decorator that sets the parameters of timed tiered cache function factory.
+
+    Args:
+        maxsize: The max size of the front tier.
+        second_tier: The larger mapping which holds results demoted from the front tier.
+        tier_key: A function which converts a cache key into a key for the second tier.
+        typed: Determines if the function's arguments are type sensitive for caching.
+        lifetime: The period between cache resets in seconds.
+        call_method: The default call method to use.
+        local: Determines if the cache is local for all method bindings or for each instance.
+        cache_exceptions: The exception types which will be cached and raised on a cache hit.
+        negative_results: The results which are cached as negative results, compared by identity.
+        negative_lifetime: The period negative results and exceptions stay in the cache in seconds.
+        compression: The name of the codec to compress results with or None for no compression.
+        compression_threshold: The minimum length of a result before it is compressed.
+        replay: Determines if iterator results are cached as iterables which lazily replay their items.
+
+    Returns:
+        The parameterized timed tiered cache function factory.
+    """
+
+    def timed_tiered_cache_factory(func: AnyCallable) -> TimedTieredCache:
+        """A factory for wrapping a function with a TimedTieredCache object.
+
+        Args:
+            func: The function to wrap with a TimedTieredCache.
+
+        Returns:
+            The TimedTieredCache object which wraps the given function.
+        """
+        return TimedTieredCache(
+            func,
+            maxsize=maxsize,
+            second_tier=second_tier,
+            tier_key=tier_key,
+            typed=typed,
+            lifetime=lifetime,
+            call_method=call_method,
+            local=local,
+            cache_exceptions=cache_exceptions,
+            negative_results=negative_results,
+            negative_lifetime=negative_lifetime,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            replay=replay,
+        )
+
+    return timed_tiered_cache_factory
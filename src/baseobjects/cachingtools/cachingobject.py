@@ -31,11 +31,13 @@ class CachingObject(BaseObject, metaclass=CachingObjectMeta):
     Attributes:
         _is_cache: Determines if the caching functions of this object will cache.
         _caches: All the caches within this object.
+        _cached_properties_: The names of all the timed cached properties within this class.
     """
 
     # Attributes #
     _is_cache: bool = True
     _caches: set[str]
+    _cached_properties_: set[str]
 
     # Properties #
     @property
@@ -62,11 +64,16 @@ class CachingObject(BaseObject, metaclass=CachingObjectMeta):
 
     # Pickling
     def __getstate__(self) -> dict[Any]:
-        """Delete all cache methods for pickling."""
+        """Delete all cache methods and cached property values for pickling."""
         state = self.__dict__.copy()
         for name in self.get_caches():
             if name in state:
                 del state[name]
+        cls = type(self)
+        for name in self._cached_properties_:
+            cached_property = getattr(cls, name)
+            state.pop(cached_property.attrname, None)
+            state.pop(cached_property.cache_name, None)
         return state
 
     # Instance Methods #
@@ -86,6 +93,17 @@ class CachingObject(BaseObject, metaclass=CachingObjectMeta):
 
         return self._caches
 
+    def get_cached_properties(self, exclude: set[str] | None = None) -> set[str]:
+        """Get the names of all the timed cached properties in this object.
+
+        Args:
+            exclude: The names of the cached properties to exclude.
+
+        Returns:
+            The names of the timed cached properties within this object.
+        """
+        return self._cached_properties_ if exclude is None else self._cached_properties_.difference(exclude)
+
     def enable_caching(self, exclude: set[str] | None = None, get_caches: bool = False) -> None:
         """Enables all caches to cache.
 
@@ -107,6 +125,10 @@ class CachingObject(BaseObject, metaclass=CachingObjectMeta):
         for name in caches:
             getattr(self, name).resume_caching()
 
+        # Enable cached properties in the set.
+        for name in self.get_cached_properties(exclude):
+            getattr(type(self), name).resume_caching(self)
+
         self._is_cache = True
 
     def disable_caching(self, exclude: set[str] | None = None, get_caches: bool = False) -> None:
@@ -130,6 +152,10 @@ class CachingObject(BaseObject, metaclass=CachingObjectMeta):
         for name in caches:
             getattr(self, name).stop_caching()
 
+        # Disable cached properties in the set.
+        for name in self.get_cached_properties(exclude):
+            getattr(type(self), name).stop_caching(self)
+
         self._is_cache = False
 
     def timeless_caching(self, exclude: set[str] | None = None, get_caches: bool = False) -> None:
@@ -221,3 +247,7 @@ class CachingObject(BaseObject, metaclass=CachingObjectMeta):
         # Clear caches in the set.
         for name in caches:
             getattr(self, name).clear_cache()
+
+        # Clear cached properties in the set.
+        for name in self.get_cached_properties(exclude):
+            getattr(type(self), name).clear_cache(self)
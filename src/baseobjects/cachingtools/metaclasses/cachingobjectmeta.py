@@ -18,7 +18,7 @@ from typing import Any
 
 # Local Packages #
 from ...bases import BaseMeta
-from ..caches import BaseTimedCache
+from ..caches import BaseTimedCache, TimedCachedProperty
 
 
 # Definitions #
@@ -28,6 +28,7 @@ class CachingObjectMeta(BaseMeta):
 
     Attributes:
         _caches_: A set of all the names of caches in this object.
+        _cached_properties_: A set of all the names of timed cached properties in this object.
 
     Args:
         name: The name of this class.
@@ -44,6 +45,13 @@ class CachingObjectMeta(BaseMeta):
         else:
             cls._caches_ = set()
 
+        if hasattr(cls, "_cached_properties_"):
+            cls._cached_properties_ = cls._cached_properties_.copy()
+        else:
+            cls._cached_properties_ = set()
+
         for name, cls_attribute in namespace.items():
             if isinstance(cls_attribute, BaseTimedCache):
                 cls._caches_.add(name)
+            elif isinstance(cls_attribute, TimedCachedProperty):
+                cls._cached_properties_.add(name)
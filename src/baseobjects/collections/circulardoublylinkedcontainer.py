@@ -22,12 +22,13 @@ import weakref
 # Third-Party Packages #
 
 # Local Packages #
-from ..bases import BaseObject
+from ..bases import BaseObject, ObjectPool, slotted
 from ..functions import singlekwargdispatch
 
 
 # Definitions #
 # Classes #
+@slotted
 class LinkedNode(BaseObject):
     """A node in a circular doubly linked container.
 
@@ -113,27 +114,38 @@ class LinkedNode(BaseObject):
             next_: The next node.
         """
         if previous is not None:
-            self.previous = weakref.ref(previous)
+            self.previous = previous
 
         if next_ is not None:
-            self.next = weakref.ref(next_)
+            self.next = next_
 
         self.data = data
 
         super().construct(*args, **kwargs)
 
+    def reset(self) -> None:
+        """Unlinks this node and drops its data, so it can be reused in a container."""
+        self._previous = self._next = weakref.ref(self)
+        self.data = None
+
 
 class CircularDoublyLinkedContainer(BaseObject):
     """A container that uses nodes which are doubly linked to one another to store data.
 
+    New nodes are created for new data unless a node pool is given, then they are acquired from the pool. Nodes are
+    only released to the pool by discard_node, so the pool must only be given by an owner which knows when its nodes
+    are no longer referenced.
+
     Attributes:
         first_node: The first linked node in this container.
         nodes: The set of nodes in this container.
+        node_pool: The pool which the nodes for new data are acquired from, if any.
     """
 
     # Attributes #
     first_node: LinkedNode | None = None
     nodes: set[LinkedNode] = set()
+    node_pool: ObjectPool | None = None
 
     # Properties #
     @property
@@ -165,12 +177,8 @@ class CircularDoublyLinkedContainer(BaseObject):
             A deep copy of this object.
         """
         new_obj = type(self)()
-        if not self.is_empty:
-            original_node = self.first_node
-            new_obj.append(data=copy.deepcopy(original_node.data))
-            while original_node.next is not self.first_node:
-                new_obj.append(data=copy.deepcopy(original_node.data))
-                original_node = original_node.next
+        for original_node in self.forward_iter():
+            new_obj.append(data=copy.deepcopy(original_node.data, memo))
 
         return new_obj
 
@@ -227,7 +235,7 @@ class CircularDoublyLinkedContainer(BaseObject):
         Returns:
             The number of nodes in this object.
         """
-        len(self.nodes)
+        return len(self.nodes)
 
     def get_item(self, index: int) -> LinkedNode:
         """Gets a node based on its index from the start node.
@@ -243,12 +251,12 @@ class CircularDoublyLinkedContainer(BaseObject):
         # Forward Indexing
         if index > 0:
             for i in range(index):
-                node = node.next()
+                node = node.next
         # Reverse Indexing
         elif index < 0:
             index *= -1
             for i in range(index):
-                node = node.previous()
+                node = node.previous
 
         return node
 
@@ -262,15 +270,16 @@ class CircularDoublyLinkedContainer(BaseObject):
         Returns:
             The LinkedNode added to the container.
         """
-        new_node = LinkedNode(data)
+        new_node = LinkedNode(data) if self.node_pool is None else self.node_pool.acquire(data)
         self.nodes.add(new_node)
-        weak_node = weakref.ref(new_node)
 
         if self.first_node is None:
             self.first_node = new_node
         else:
-            self.last_node.next = weak_node
-            self.first_node.previous = weak_node
+            new_node.previous = self.last_node
+            new_node.next = self.first_node
+            self.last_node.next = new_node
+            self.first_node.previous = new_node
 
         return new_node
 
@@ -285,13 +294,14 @@ class CircularDoublyLinkedContainer(BaseObject):
             The LinkedNode added to the container.
         """
         self.nodes.add(data)
-        weak_node = weakref.ref(data)
 
         if self.first_node is None:
             self.first_node = data
         else:
-            self.last_node.next = weak_node
-            self.first_node.previous = weak_node
+            data.previous = self.last_node
+            data.next = self.first_node
+            self.last_node.next = data
+            self.first_node.previous = data
 
         return data
 
@@ -306,7 +316,7 @@ class CircularDoublyLinkedContainer(BaseObject):
         Returns
             The LinkedNode added to the container.
         """
-        new_node = LinkedNode(data)
+        new_node = LinkedNode(data) if self.node_pool is None else self.node_pool.acquire(data)
         self.nodes.add(new_node)
 
         if self.first_node is None:
@@ -317,6 +327,8 @@ class CircularDoublyLinkedContainer(BaseObject):
             new_node.previous = point.previous
             new_node.previous.next = new_node
             point.previous = new_node
+            if index == 0:
+                self.first_node = new_node
 
         return new_node
 
@@ -341,6 +353,8 @@ class CircularDoublyLinkedContainer(BaseObject):
             data.previous = point.previous
             data.previous.next = data
             point.previous = data
+            if index == 0:
+                self.first_node = data
 
         return data
 
@@ -350,10 +364,22 @@ class CircularDoublyLinkedContainer(BaseObject):
         Args:
             node: The node to move.
         """
+        if node is self.first_node:
+            self.first_node = None if node.next is node else node.next
         node.next.previous = node.previous
         node.previous.next = node.next
         self.nodes.remove(node)
 
+    def discard_node(self, node: LinkedNode) -> None:
+        """Removes a node from the container and releases it to the node pool if there is one.
+
+        Args:
+            node: The node to remove, which must not be referenced or used by anything after it is discarded.
+        """
+        self.remove_node(node)
+        if self.node_pool is not None:
+            self.node_pool.release(node)
+
     def pop(self, index: int = -1) -> LinkedNode:
         """Removes a node at the index within the container and return it.
 
@@ -379,8 +405,9 @@ class CircularDoublyLinkedContainer(BaseObject):
         Args:
             node: The node to move.
         """
-        self.move_node_end(node)
-        self.first_node = node
+        if node is not self.first_node:
+            self.move_node_end(node)
+            self.first_node = node
 
     def move_node_end(self, node: LinkedNode) -> None:
         """Move a node to the end of container.
@@ -388,12 +415,16 @@ class CircularDoublyLinkedContainer(BaseObject):
         Args:
             node: The node to move.
         """
-        node.next.previous = node.previous
-        node.previous.next = node.next
-        node.next = self.first_node
-        node.previous = self.last_node
-        self.last_node.next = node
-        self.first_node.previous = node
+        if node is self.first_node:
+            # The container is circular, so the node after the first makes the first node last.
+            self.first_node = node.next
+        elif node is not self.last_node:
+            node.next.previous = node.previous
+            node.previous.next = node.next
+            node.next = self.first_node
+            node.previous = self.last_node
+            self.last_node.next = node
+            self.first_node.previous = node
 
     def move_node(self, node: LinkedNode, index: int) -> None:
         """Move a node to an index within the container.
@@ -445,7 +476,11 @@ class CircularDoublyLinkedContainer(BaseObject):
         Returns:
             The forward iterable.
         """
-        node = yield self.first_node
+        if self.first_node is None:
+            return
+
+        node = self.first_node
+        yield node
         node = node.next
         while node is not self.first_node:
             yield node
@@ -457,7 +492,11 @@ class CircularDoublyLinkedContainer(BaseObject):
         Returns:
             The reverse iterable.
         """
-        node = yield self.last_node
+        if self.first_node is None:
+            return
+
+        node = self.last_node
+        yield node
         node = node.previous
         while node is not self.last_node:
             yield node
@@ -469,9 +508,10 @@ class CircularDoublyLinkedContainer(BaseObject):
         Returns:
             The forward cycle.
         """
-        node = yield self.first_node
-        while True:
-            node = yield node.next
+        node = self.first_node
+        while node is not None:
+            yield node
+            node = node.next
 
     def reverse_cycle(self) -> Iterable:
         """Creates an iterable which cycles through the nodes from last to first.
@@ -479,6 +519,7 @@ class CircularDoublyLinkedContainer(BaseObject):
         Returns:
             The reverse cycle.
         """
-        node = yield self.last_node
-        while True:
-            node = yield node.previous
+        node = None if self.first_node is None else self.last_node
+        while node is not None:
+            yield node
+            node = node.previous
@@ -19,12 +19,13 @@ from weakref import ref
 # Third-Party Packages #
 
 # Local Packages #
-from ..bases import BaseObject
+from ..bases import BaseObject, slotted
 from .basecomposite import BaseComposite
 
 
 # Definitions #
 # Classes #
+@slotted
 class BaseComponent(BaseObject):
     """A basic component object.
 
@@ -14,8 +14,16 @@ __email__ = __email__
 # Imports #
 # Local Packages #
 from .basedecorator import BaseDecorator
+from .asyncbasedecorator import AsyncBaseDecorator
+from .microbatcher import MicroBatcher, micro_batch
+from .callprofiler import CallProfiler, profile_calls
+from .callinstrumenter import CallInstrumenter, call_instrumenter
 from .singlekwargdispatch import singlekwargdispatch
+from .multikwargdispatch import multikwargdispatch
 from .functionregister import FunctionRegister
 from .methodregister import MethodRegister
 from .callablemultiplexer import CallableMultiplexer, MethodMultiplexer, CallableMultiplexItem, CallableMultiplexObject
+from .autotuningmultiplexer import AutotuningMultiplexer
 from .dynamiccallable import DynamicCallable, DynamicMethod, DynamicFunction
+from .asyncdynamiccallable import AsyncDynamicCallable, AsyncDynamicMethod, AsyncDynamicFunction
+from .callpipeline import CallPipeline
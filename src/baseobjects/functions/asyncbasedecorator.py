@@ -0,0 +1,31 @@
+"""asyncbasedecorator.py
+An abstract class which implements the basic structure for creating decorators which are always awaited.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+
+# Third-Party Packages #
+
+# Local Packages #
+from .asyncdynamiccallable import AsyncDynamicFunction
+from .basedecorator import BaseDecorator
+
+
+# Definitions #
+# Classes #
+class AsyncBaseDecorator(AsyncDynamicFunction, BaseDecorator):
+    """An abstract class which implements the basic structure for creating decorators which are always awaited.
+
+    Decorating is synchronous like BaseDecorator, but once a function is set the call methods return awaitables. A
+    function which is not a coroutine function is run on the event loop, or in a thread if offload is set.
+    """
@@ -0,0 +1,201 @@
+"""asyncdynamiccallable.py
+Abstract classes for creating awaitable callable classes that has multiplexed callback.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from asyncio import to_thread, wrap_future
+from asyncio.coroutines import _is_coroutine
+from collections.abc import Awaitable, Coroutine
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from ..typing import AnyCallable
+from ..bases import BaseCallable, BaseMethod
+from .dynamiccallable import DynamicCallable, DynamicMethod, DynamicFunction
+
+
+# Definitions #
+# Classes #
+class AsyncDynamicCallable(DynamicCallable):
+    """An abstract callable class that has multiplexed callback and is always awaited.
+
+    The call methods return awaitables, so a call of this object is awaited whether the wrapped function is a
+    coroutine function or not. The call methods return the awaitable of the wrapped function directly when they can,
+    so awaiting a coroutine function does not add a coroutine frame.
+
+    Attributes:
+        _wraps_coroutine: Determines if the wrapped function is a coroutine function.
+
+    Args:
+        func: The function to wrap.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    _wraps_coroutine: bool = False
+
+    # Properties #
+    @property
+    def __func__(self) -> AnyCallable:
+        """The function which this callable wraps."""
+        return self.__wrapped__
+
+    @__func__.setter
+    def __func__(self, value: AnyCallable | None) -> None:
+        BaseCallable.__func__.fset(self, value)
+        self._wraps_coroutine = self._is_coroutine is not None
+        # Every call of this object is awaited, even when the wrapped function is not a coroutine function.
+        if value is not None:
+            self._is_coroutine = _is_coroutine
+
+    # Instance Methods #
+    # Calling
+    def call(self, *args: Any, **kwargs: Any) -> Awaitable[Any]:
+        """Calls the wrapped coroutine function.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The coroutine of the wrapped function.
+        """
+        return self.__wrapped__(*args, **kwargs)
+
+
+class AsyncDynamicMethod(AsyncDynamicCallable, DynamicMethod):
+    """An abstract method class that has multiplexed callback and is always awaited.
+
+    The wrapped function is an AsyncDynamicFunction or a coroutine function, so the call only has to give the instance.
+    """
+
+    # Instance Methods #
+    # Calling
+    def call(self, *args: Any, **kwargs: Any) -> Awaitable[Any]:
+        """Calls the wrapped function with the instance as an argument.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The awaitable of the wrapped function.
+        """
+        return self.__wrapped__(self._self_(), *args, **kwargs)
+
+
+class AsyncDynamicFunction(AsyncDynamicCallable, DynamicFunction):
+    """An abstract function class that has multiplexed callback and binding and is always awaited.
+
+    Coroutine functions are called with call. Other functions are called on the event loop with inline_call, or
+    offloaded to a thread with thread_call or to the executor with executor_call, so they do not block the event loop.
+    The call method for a function which is not a coroutine function is chosen by offload when the function is set.
+
+    Attributes:
+        offload: Determines if functions which are not coroutine functions are run in a thread.
+
+    Args:
+        func: The function to wrap.
+        offload: Determines if functions which are not coroutine functions are run in a thread.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    method_type: type[BaseMethod] = AsyncDynamicMethod
+
+    offload: bool = False
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        func: AnyCallable | None = None,
+        offload: bool | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(func=func, offload=offload, *args, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        func: AnyCallable | None = None,
+        offload: bool | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            func: The function to wrap.
+            offload: Determines if functions which are not coroutine functions are run in a thread.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if offload is not None:
+            self.offload = offload
+
+        super().construct(func=func, *args, **kwargs)
+
+        if func is not None and self._call_method == "call" and not self._wraps_coroutine:
+            self.call_method = "thread_call" if self.offload else "inline_call"
+
+    # Calling
+    async def inline_call(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the wrapped function on the event loop.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The output of the wrapped function.
+        """
+        return self.__wrapped__(*args, **kwargs)
+
+    def thread_call(self, *args: Any, **kwargs: Any) -> Coroutine[Any, Any, Any]:
+        """Calls the wrapped function in a thread with asyncio.to_thread.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The coroutine of the output of the wrapped function.
+        """
+        return to_thread(self.__wrapped__, *args, **kwargs)
+
+    async def executor_call(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the wrapped function on the executor.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The output of the wrapped function.
+        """
+        return await wrap_future(self.get_executor().submit(self.__wrapped__, *args, **kwargs))
@@ -0,0 +1,394 @@
+"""autotuningmultiplexer.py
+A multiplexer which measures its registered alternatives and selects the fastest.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from statistics import fmean, median
+from time import perf_counter
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from ..typing import AnyCallable
+from .functionregister import FunctionRegister
+from .callablemultiplexer import CallableMultiplexer
+
+
+# Definitions #
+# Classes #
+class AutotuningMultiplexer(CallableMultiplexer):
+    """A multiplexer which measures its registered alternatives and selects the fastest.
+
+    While tuning, each call is routed to the candidate with the fewest measurements and its latency is recorded. Once
+    every candidate has been measured for the number of samples, the candidate with the lowest median latency is
+    selected, after which calls go directly to it. Candidates can also be measured with a supplied workload using tune.
+
+    A size key can be given to tune separately for input sizes. The size key takes the call's arguments and returns a
+    size, which is placed in a bucket by the bucket boundaries. Each bucket is measured and selected on its own, so
+    calls keep the cost of finding their bucket.
+
+    Attributes:
+        candidates: The names of the registered functions to choose from or None for all of them.
+        samples: The number of measurements of each candidate before selecting the fastest.
+        size_key: A function which gets the size of a call's input from its arguments.
+        buckets: The boundaries of the input size buckets.
+        is_tuning: Determines if calls are being measured to select a candidate.
+        measurements: The latencies in seconds of each candidate in each bucket.
+        bucket_selected: The name of the candidate selected for each bucket.
+        pinned: The buckets whose candidate was pinned and will not be tuned.
+
+    Args:
+        register: The function register to use for selecting a function/method.
+        instance: An object to wrap which will be used to find functions/methods.
+        owner: The class of the object used for finding functions/methods.
+        select: The name of the function/method to select for use.
+        binding: Determines if this object will bind the selected function as a method.
+        candidates: The names of the registered functions to choose from or None for all of them.
+        samples: The number of measurements of each candidate before selecting the fastest.
+        size_key: A function which gets the size of a call's input from its arguments.
+        buckets: The boundaries of the input size buckets.
+        tuning: Determines if calls will be measured to select a candidate.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    candidates: tuple[str, ...] | None = None
+    samples: int = 10
+    size_key: AnyCallable | None = None
+    buckets: tuple[int | float, ...] = ()
+    is_tuning: bool = False
+
+    measurements: dict[int | None, dict[str, list[float]]]
+    bucket_selected: dict[int | None, str]
+    pinned: set[int | None]
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        register: FunctionRegister | None = None,
+        instance: Any = None,
+        owner: type[Any] | None = None,
+        select: str | None = None,
+        binding: bool = False,
+        candidates: Iterable[str] | None = None,
+        samples: int | None = None,
+        size_key: AnyCallable | None = None,
+        buckets: Sequence[int | float] | None = None,
+        tuning: bool = True,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.measurements = {}
+        self.bucket_selected = {}
+        self.pinned = set()
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(
+                register=register,
+                instance=instance,
+                owner=owner,
+                select=select,
+                binding=binding,
+                candidates=candidates,
+                samples=samples,
+                size_key=size_key,
+                buckets=buckets,
+                tuning=tuning,
+                *args,
+                **kwargs,
+            )
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        register: FunctionRegister | None = None,
+        instance: Any = None,
+        owner: type[Any] | None = None,
+        select: str | None = None,
+        binding: bool | None = None,
+        candidates: Iterable[str] | None = None,
+        samples: int | None = None,
+        size_key: AnyCallable | None = None,
+        buckets: Sequence[int | float] | None = None,
+        tuning: bool | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            register: The function register to use for selecting a function/method.
+            instance: An object to wrap which will be used to find functions/methods.
+            owner: The class of the object used for finding functions/methods.
+            select: The name of the function/method to select for use.
+            binding: Determines if this object will bind the selected function as a method.
+            candidates: The names of the registered functions to choose from or None for all of them.
+            samples: The number of measurements of each candidate before selecting the fastest.
+            size_key: A function which gets the size of a call's input from its arguments.
+            buckets: The boundaries of the input size buckets.
+            tuning: Determines if calls will be measured to select a candidate.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if candidates is not None:
+            self.candidates = tuple(candidates)
+
+        if samples is not None:
+            self.samples = samples
+
+        if size_key is not None:
+            self.size_key = size_key
+
+        if buckets is not None:
+            self.buckets = tuple(sorted(buckets))
+
+        if tuning is not None:
+            self.is_tuning = tuning
+
+        super().construct(
+            register=register,
+            instance=instance,
+            owner=owner,
+            select=select,
+            binding=binding,
+            *args,
+            **kwargs,
+        )
+
+        self.update_target()
+
+    # Callable Selection
+    def update_target(self) -> None:
+        """Sets the target to the measuring call while tuning or with buckets, otherwise to the selected function."""
+        if self.is_tuning or self.size_key is not None:
+            self.target = self.tuning_call
+        else:
+            super().update_target()
+
+    def get_candidate_names(self) -> tuple[str, ...]:
+        """Gets the names of the candidates.
+
+        Returns:
+            The names of the candidates.
+        """
+        return tuple(self.register.keys()) if self.candidates is None else self.candidates
+
+    def get_default_name(self) -> str:
+        """Gets the name of the candidate used for a bucket without a choice when not tuning.
+
+        Returns:
+            The name of the selected function or the first candidate if no function is selected.
+
+        Raises:
+            ValueError: If no function is selected and there are no candidates.
+        """
+        if self._selected is not None:
+            return self._selected
+        elif names := self.get_candidate_names():
+            return names[0]
+        else:
+            raise ValueError("There is no selected function and there are no candidates to fall back to.")
+
+    def get_candidate(self, name: str) -> AnyCallable:
+        """Gets a candidate bound to the instance if required.
+
+        Args:
+            name: The name of the candidate.
+
+        Returns:
+            The candidate.
+        """
+        if (func := self.register.get(name, None)) is None:
+            return getattr(self._self_(), name)
+        elif self._is_binding:
+            return func.__get__(self.__self__, self.__owner__)
+        else:
+            return func
+
+    def get_bucket(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> int | None:
+        """Gets the input size bucket of a call.
+
+        Args:
+            args: The arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            The index of the bucket or None if there is no size key.
+        """
+        return None if self.size_key is None else bisect_right(self.buckets, self.size_key(*args, **kwargs))
+
+    # Measurement
+    def record(self, bucket: int | None, name: str, latency: float) -> None:
+        """Records a latency of a candidate and selects the fastest candidate once all candidates have enough samples.
+
+        Args:
+            bucket: The input size bucket of the measurement.
+            name: The name of the candidate.
+            latency: The latency in seconds.
+        """
+        bucket_measurements = self.measurements.setdefault(bucket, {})
+        bucket_measurements.setdefault(name, []).append(latency)
+        names = self.get_candidate_names()
+        if all(len(bucket_measurements.get(n, ())) >= self.samples for n in names):
+            self.select_fastest(bucket)
+
+    def select_fastest(self, bucket: int | None = None) -> str:
+        """Selects the candidate with the lowest median latency for a bucket.
+
+        Args:
+            bucket: The input size bucket to select for.
+
+        Returns:
+            The name of the selected candidate.
+        """
+        bucket_measurements = self.measurements.get(bucket, {})
+        names = [n for n in self.get_candidate_names() if bucket_measurements.get(n, None)]
+        if not names:
+            raise ValueError(f"There are no measurements for bucket {bucket}.")
+
+        fastest = min(names, key=lambda n: median(bucket_measurements[n]))
+        self.set_bucket_choice(bucket, fastest)
+        return fastest
+
+    def set_bucket_choice(self, bucket: int | None, name: str) -> None:
+        """Sets the candidate used for a bucket, which also selects it when there are no buckets.
+
+        Args:
+            bucket: The input size bucket.
+            name: The name of the candidate.
+        """
+        self.bucket_selected[bucket] = name
+        if self.size_key is None:
+            self.is_tuning = False
+            self.select(name)
+
+    def tuning_call(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the selected candidate of the call's bucket or measures the least measured candidate.
+
+        The candidates are bound when they are called, so the choices follow this object when it is rebound and do not
+        keep the instance alive.
+
+        Args:
+            *args: The arguments of the candidate.
+            **kwargs: The keyword arguments of the candidate.
+
+        Returns:
+            The output of the candidate.
+        """
+        bucket = self.get_bucket(args, kwargs)
+        if (name := self.bucket_selected.get(bucket, None)) is not None:
+            return self.get_candidate(name)(*args, **kwargs)
+        elif not self.is_tuning:
+            return self.get_candidate(self.get_default_name())(*args, **kwargs)
+
+        bucket_measurements = self.measurements.get(bucket, {})
+        name = min(self.get_candidate_names(), key=lambda n: len(bucket_measurements.get(n, ())))
+        candidate = self.get_candidate(name)
+
+        start = perf_counter()
+        result = candidate(*args, **kwargs)
+        self.record(bucket, name, perf_counter() - start)
+        return result
+
+    def tune(
+        self,
+        workload: Iterable[tuple[Any, ...]],
+        kwargs: dict[str, Any] | None = None,
+        repeats: int = 3,
+    ) -> dict[int | None, str]:
+        """Measures every candidate with a workload and selects the fastest for each bucket in the workload.
+
+        Args:
+            workload: The arguments of each call in the workload.
+            kwargs: The keyword arguments given to every call in the workload.
+            repeats: The number of times each candidate is called with each input, the fastest time is recorded.
+
+        Returns:
+            The name of the selected candidate for each bucket in the workload.
+        """
+        if kwargs is None:
+            kwargs = {}
+
+        buckets = set()
+        candidates = {n: self.get_candidate(n) for n in self.get_candidate_names()}
+        for args in workload:
+            bucket = self.get_bucket(args, kwargs)
+            if bucket in self.pinned:
+                continue
+            buckets.add(bucket)
+            bucket_measurements = self.measurements.setdefault(bucket, {})
+            for name, candidate in candidates.items():
+                latencies = []
+                for _ in range(repeats):
+                    start = perf_counter()
+                    candidate(*args, **kwargs)
+                    latencies.append(perf_counter() - start)
+                bucket_measurements.setdefault(name, []).append(min(latencies))
+
+        return {bucket: self.select_fastest(bucket) for bucket in buckets}
+
+    def pin(self, name: str, bucket: int | None = None) -> None:
+        """Pins a candidate so that it is used without tuning.
+
+        Args:
+            name: The name of the candidate.
+            bucket: The input size bucket to pin the candidate for, which is ignored when there are no buckets.
+        """
+        if self.size_key is None:
+            bucket = None
+            self.is_tuning = False
+        self.pinned.add(bucket)
+        self.set_bucket_choice(bucket, name)
+
+    def retune(self) -> None:
+        """Clears the measurements and choices of the buckets which are not pinned and resumes tuning."""
+        for bucket in set(self.bucket_selected) - self.pinned:
+            del self.bucket_selected[bucket]
+        for bucket in set(self.measurements) - self.pinned:
+            del self.measurements[bucket]
+        if self.size_key is not None or None not in self.pinned:
+            self.is_tuning = True
+            self.update_target()
+
+    def get_stats(self) -> dict[int | None, dict[str, dict[str, Any]]]:
+        """Gets the statistics of the measurements of each candidate in each bucket.
+
+        Returns:
+            The count, median, mean, and minimum latency in seconds of each candidate in each bucket.
+        """
+        return {
+            bucket: {
+                name: {
+                    "count": len(latencies),
+                    "median": median(latencies),
+                    "mean": fmean(latencies),
+                    "min": min(latencies),
+                    "selected": self.bucket_selected.get(bucket, None) == name,
+                }
+                for name, latencies in bucket_measurements.items()
+            }
+            for bucket, bucket_measurements in self.measurements.items()
+        }
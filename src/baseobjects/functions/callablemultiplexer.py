@@ -14,9 +14,11 @@ __email__ = __email__
 # Imports #
 # Standard Libraries #
 from asyncio import iscoroutinefunction
+from inspect import Signature, signature
 from typing import Any, NamedTuple, ClassVar
 from types import MethodType
 from warnings import warn
+import weakref
 
 # Third-Party Packages #
 
@@ -36,12 +38,17 @@ class CallableMultiplexer(BaseMethod):
     directly multiplexed allows more dynamic interaction as the object's methods may change during runtime. Note that
     the register's functions/methods take priority in selection.
 
+    The selected function is bound, when binding is required, at the time it is selected rather than on every call.
+    The resulting target is stored and rebuilt whenever the selection, the binding, or the bound object changes, so
+    owners of this object, like DynamicCallable, can call the target directly.
+
     Attributes:
         register: The function register to use for selecting a function/method.
         _selected: The name of the function/method to select for use.
-        is_binding: Determines if this callable will bind the selected function to a different object.
+        _is_binding: Determines if this callable will bind the selected function to a different object.
         is_self_bound: Determines if this callable will bind the selected function to the contained object, self.
         is_coroutine: Checks if this callable is a coroutine.
+        target: The selected function, bound to the instance if required, which is called when this object is called.
 
     Args:
         register: The function register to use for selecting a function/method.
@@ -58,10 +65,31 @@ class CallableMultiplexer(BaseMethod):
     register: FunctionRegister | None = None
     _selected: str | None = None
 
-    is_binding: bool = False
+    _is_binding: bool = False
     is_self_bound: bool = False
+    target: AnyCallable | None = None
 
     # Properties #
+    @property
+    def __func__(self) -> AnyCallable:
+        """The function which this callable wraps."""
+        return self.__wrapped__
+
+    @__func__.setter
+    def __func__(self, value: AnyCallable | None) -> None:
+        BaseCallable.__func__.fset(self, value)
+        self.update_target()
+
+    @property
+    def is_binding(self) -> bool:
+        """Determines if this callable will bind the selected function to a different object."""
+        return self._is_binding
+
+    @is_binding.setter
+    def is_binding(self, value: bool) -> None:
+        self._is_binding = value
+        self.update_target()
+
     @property
     def selected(self) -> str | None:
         """The name of the selected function/method."""
@@ -103,12 +131,13 @@ class CallableMultiplexer(BaseMethod):
     def __getstate__(self) -> dict[str, Any]:
         state = super().__getstate__()
         del state["_self_"]
+        state.pop("target", None)
         warn("CallableMultiplexer Weak reference deleted for pickle, may not work as intended.")
         return state
 
     # Calling
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        """Calls the wrapped function with the instance as an argument if is_binding is True.
+        """Calls the target, which is the wrapped function bound to the instance if binding is required.
 
         Args:
             *args: The arguments of the wrapped function.
@@ -117,10 +146,7 @@ class CallableMultiplexer(BaseMethod):
         Returns:
             The output of the wrapped function.
         """
-        if self.is_self_bound or self.is_binding:
-            return self.__wrapped__.__get__(self._self_(), self.__owner__)(*args, **kwargs)
-        else:
-            return self.__wrapped__(*args, **kwargs)
+        return self.target(*args, **kwargs)
 
     # Instance Methods #
     # Constructors/Destructors
@@ -193,7 +219,47 @@ class CallableMultiplexer(BaseMethod):
         """
         return self if instance is None else MethodType(self.__wrapped__, instance)
 
+    def bind(self, instance: Any = None, owner: type[Any] | None = None) -> "CallableMultiplexer":
+        """Binds this object to another and rebinds the selected function to it.
+
+        Args:
+            instance: The object to bind this object to.
+            owner: The class of the object being bound to.
+
+        Returns:
+            This object.
+        """
+        super().bind(instance=instance, owner=owner)
+        self.update_target()
+        return self
+
+    # Casting
+    def get_call_signature(self) -> Signature:
+        """Gets the signature of calling this object, which is the signature of the target.
+
+        Returns:
+            The signature of calling this object.
+        """
+        return signature(self.target)
+
+    def get_exact_call(self) -> tuple[AnyCallable, weakref.ref | None]:
+        """Gets the implementation which calls of this object are delegated to, which is the target.
+
+        Returns:
+            The target and None because the target is already bound to the instance.
+        """
+        return self.target, None
+
     # Callable Selection
+    def update_target(self) -> None:
+        """Binds the selected function to the instance if required and stores it as the target."""
+        if self.__wrapped__ is None:
+            self.target = None
+        elif self.is_self_bound or self._is_binding:
+            self.target = self.__wrapped__.__get__(self.__self__, self.__owner__)
+        else:
+            self.target = self.__wrapped__
+
     def select(self, name: str | None) -> None:
         """Selects a function/method to use within the register or the wrapped object.
 
@@ -230,6 +296,10 @@ class CallableMultiplexer(BaseMethod):
         self.register[name] = self.__func__ = getattr(method, "__func__")
         self._selected = name
 
+    # Method Overrides #
+    # Special method overriding which leads to less overhead.
+    __get__: GetObjectMethod = bind
+
 
 class MethodMultiplexer(CallableMultiplexer):
     """A callable which only uses methods to be used as the call method.
@@ -240,19 +310,14 @@ class MethodMultiplexer(CallableMultiplexer):
     priority in selection.
     """
 
-    # Magic Methods #
-    # Calling
-    def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        """Calls the wrapped function with the instance as an argument.
-
-        Args:
-            *args: The arguments of the wrapped function.
-            **kwargs: The keyword arguments of the wrapped function.
-
-        Returns:
-            The output of the wrapped function.
-        """
-        return self.__wrapped__.__get__(self._self_(), self.__owner__)(*args, **kwargs)
+    # Instance Methods #
+    # Callable Selection
+    def update_target(self) -> None:
+        """Binds the selected function to the instance and stores it as the target."""
+        if self.__wrapped__ is None:
+            self.target = None
+        else:
+            self.target = self.__wrapped__.__get__(self.__self__, self.__owner__)
 
 
 class CallableMultiplexItem(NamedTuple):
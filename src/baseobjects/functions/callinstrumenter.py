@@ -0,0 +1,458 @@
+"""callinstrumenter.py
+An opt-in instrumentation which records the calls of all DynamicCallables and CallableMultiplexers in a process.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Iterable
+from inspect import unwrap
+import json
+import marshal
+import pathlib
+from threading import local
+from time import perf_counter
+from types import MethodType
+from typing import Any
+from weakref import WeakKeyDictionary
+
+# Third-Party Packages #
+
+# Local Packages #
+from ..typing import AnyCallable
+from ..bases import BaseObject
+from .callablemultiplexer import CallableMultiplexer
+from .dynamiccallable import DynamicCallable
+
+
+# Definitions #
+# Classes #
+class CallInstrumenter(BaseObject):
+    """An opt-in instrumentation which records the calls of all DynamicCallables and CallableMultiplexers in a process.
+
+    Enabling replaces the __call__ of the instrumented types with one which measures the call, so every existing and
+    future instance is recorded, and disabling puts the original __call__ back. Owners of multiplexers, like
+    DynamicCallable, call the target of the multiplexer directly, so the target of the instrumented target types is
+    replaced with a property which gives a measuring wrapper of the target. While disabled, there is no
+    instrumentation code in the call path at all.
+
+    The calls are recorded by the function each callable wraps and every thread records into its own records, which are
+    combined when exported. Like a profiler, the internal time of a call excludes the time of the instrumented calls it
+    makes and the cumulative time of recursive calls is only counted once. A target call of a multiplexer is recorded
+    by the function the multiplexer selected, but it is transparent to the calls it makes: they are attributed to the
+    caller of the multiplexer and their time is excluded from the internal time of that caller. The statistics can be
+    exported as JSON or in the format of pstats, so pstats.Stats can load this object or the file written by
+    dump_stats.
+
+    Attributes:
+        instrumented_types: The types whose __call__ is replaced when enabled.
+        instrumented_target_types: The multiplexer types whose target is replaced when enabled.
+        original_calls: The original __call__ of each instrumented type while enabled.
+        original_targets: The original target class attribute of each instrumented target type while enabled.
+        target_wrappers: The target and its measuring wrapper of each multiplexer whose target was called.
+        local: The thread local data which holds the records and call stack of each thread.
+        thread_records: The records of each thread.
+        stats: The statistics in the pstats format after create_stats is called.
+
+    Args:
+        instrumented_types: The types whose __call__ is replaced when enabled.
+        instrumented_target_types: The multiplexer types whose target is replaced when enabled.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    instrumented_types: tuple[type, ...] = (DynamicCallable,)
+    instrumented_target_types: tuple[type, ...] = (CallableMultiplexer,)
+
+    original_calls: dict[type, AnyCallable]
+    original_targets: dict[type, Any]
+    target_wrappers: WeakKeyDictionary[CallableMultiplexer, tuple[AnyCallable, AnyCallable]]
+    local: local
+    thread_records: list[dict[Any, list]]
+    stats: dict[tuple[str, int, str], tuple]
+
+    # Properties #
+    @property
+    def is_enabled(self) -> bool:
+        """Determines if the calls are being instrumented."""
+        return bool(self.original_calls or self.original_targets)
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        instrumented_types: Iterable[type] | None = None,
+        instrumented_target_types: Iterable[type] | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.original_calls: dict[type, AnyCallable] = {}
+        self.original_targets: dict[type, Any] = {}
+        self.target_wrappers: WeakKeyDictionary[CallableMultiplexer, tuple[AnyCallable, AnyCallable]] = (
+            WeakKeyDictionary()
+        )
+        self.local: local = local()
+        self.thread_records: list[dict[Any, list]] = []
+        self.stats: dict[tuple[str, int, str], tuple] = {}
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(
+                instrumented_types=instrumented_types,
+                instrumented_target_types=instrumented_target_types,
+                *args,
+                **kwargs,
+            )
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        instrumented_types: Iterable[type] | None = None,
+        instrumented_target_types: Iterable[type] | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            instrumented_types: The types whose __call__ is replaced when enabled.
+            instrumented_target_types: The multiplexer types whose target is replaced when enabled.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if instrumented_types is not None:
+            self.instrumented_types = tuple(instrumented_types)
+
+        if instrumented_target_types is not None:
+            self.instrumented_target_types = tuple(instrumented_target_types)
+
+        super().construct(*args, **kwargs)
+
+    # Switching
+    def enable(self) -> None:
+        """Starts instrumenting the calls of the instrumented types and the targets of the instrumented target types."""
+        if self.is_enabled:
+            return
+
+        original_calls = {}
+        for type_ in self.instrumented_types:
+            call = type_.__dict__.get("__call__", None)
+            if call is None:
+                raise TypeError(f"{type_.__name__} does not define __call__ and cannot be instrumented.")
+            if getattr(call, "__instrumenter__", None) is not None:
+                raise RuntimeError(f"{type_.__name__} is already instrumented by another instrumenter.")
+            original_calls[type_] = call
+
+        original_targets = {}
+        for type_ in self.instrumented_target_types:
+            if "target" not in type_.__dict__:
+                raise TypeError(f"{type_.__name__} does not define target and cannot be instrumented.")
+            target = type_.__dict__["target"]
+            if getattr(getattr(target, "fget", None), "__instrumenter__", None) is not None:
+                raise RuntimeError(f"{type_.__name__} is already instrumented by another instrumenter.")
+            original_targets[type_] = target
+
+        self.original_calls.update(original_calls)
+        self.original_targets.update(original_targets)
+        for type_, call in original_calls.items():
+            type_.__call__ = self.create_instrumented_call(call)
+        for type_ in original_targets:
+            type_.target = self.create_instrumented_target_property()
+
+    def disable(self) -> None:
+        """Stops instrumenting the calls by restoring the original __call__ and target of the instrumented types."""
+        for type_, call in self.original_calls.items():
+            type_.__call__ = call
+        for type_, target in self.original_targets.items():
+            type_.target = target
+        self.original_calls.clear()
+        self.original_targets.clear()
+        self.target_wrappers = WeakKeyDictionary()
+
+    # Recording
+    def create_thread_records(self) -> tuple[dict[Any, list], list[list]]:
+        """Creates the records and call stack of the current thread.
+
+        Returns:
+            The records and call stack of the current thread.
+        """
+        records = self.local.records = {}
+        stack = self.local.stack = []
+        self.thread_records.append(records)
+        return records, stack
+
+    def measure_call(
+        self,
+        callable_: Any,
+        key: Any,
+        is_dispatch: bool,
+        call: AnyCallable,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Calls a function and records the call by a key.
+
+        Args:
+            callable_: The callable being called, which identifies it in the call stack.
+            key: The function to record the call by.
+            is_dispatch: Determines if the call is a dispatch, which is transparent to the calls it makes.
+            call: The function to call.
+            args: The arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            The output of the call.
+        """
+        thread_local = self.local
+        try:
+            records = thread_local.records
+            stack = thread_local.stack
+        except AttributeError:
+            records, stack = self.create_thread_records()
+
+        # A callable called by the callable which wraps it, like a bound method, is part of the wrapper's call, which
+        # can have dispatched the call.
+        if stack:
+            if (parent := stack[-1])[2] is callable_:
+                parent[2] = key
+                return call(*args, **kwargs)
+            elif parent[4] and len(stack) > 1 and (parent := stack[-2])[2] is callable_:
+                parent[2] = key
+                return call(*args, **kwargs)
+
+        # The record holds the primitive call count, call count, internal time, cumulative time, caller counts,
+        # and the number of active calls, which determines if a call is recursive.
+        if (record := records.get(key, None)) is None:
+            record = records[key] = [0, 0, 0.0, 0.0, {}, 0]
+        is_recursive = record[5]
+        record[5] += 1
+
+        # The frame holds the key, the time spent in instrumented calls made by this call, the innermost callable of
+        # the call which is wrapped by the callables already in the frame, the key its calls are attributed to, and
+        # if it is a dispatch.
+        caller = stack[-1][3] if is_dispatch and stack else key
+        frame = [key, 0.0, callable_ if is_dispatch else key, caller, is_dispatch]
+        stack.append(frame)
+        start = perf_counter()
+        try:
+            return call(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            stack.pop()
+            record[5] -= 1
+            record[1] += 1
+            record[2] += elapsed - frame[1]
+            if not is_recursive:
+                record[0] += 1
+                record[3] += elapsed
+            if stack:
+                parent = stack[-1]
+                parent[1] += frame[1] if is_dispatch else elapsed
+                callers = record[4]
+                callers[parent[3]] = callers.get(parent[3], 0) + 1
+
+    def create_instrumented_call(self, call: AnyCallable) -> AnyCallable:
+        """Creates a __call__ which measures the calls of an original __call__.
+
+        Args:
+            call: The original __call__ to instrument.
+
+        Returns:
+            The instrumented __call__.
+        """
+        measure_call = self.measure_call
+
+        def __call__(self_: Any, *args: Any, **kwargs: Any) -> Any:
+            """Calls the original __call__ and records the call by the function which the callable wraps."""
+            if (key := self_.__wrapped__) is None:
+                return call(self_, *args, **kwargs)
+            return measure_call(self_, key, False, call, (self_, *args), kwargs)
+
+        __call__.__instrumenter__ = self
+        __call__.__wrapped__ = call
+        return __call__
+
+    def create_instrumented_target_property(self) -> property:
+        """Creates a target property which gives a wrapper of the target that measures the target's calls.
+
+        Returns:
+            The target property.
+        """
+        instrumenter = self
+
+        def get_target(self_: Any) -> AnyCallable | None:
+            """Gets the measuring wrapper of the target, which is created once for each target."""
+            target = self_.__dict__.get("target", None)
+            if target is None:
+                return None
+
+            wrappers = instrumenter.target_wrappers
+            if (entry := wrappers.get(self_, None)) is None or entry[0] is not target:
+                key = target if (key := self_.__wrapped__) is None else key
+                entry = wrappers[self_] = (target, MethodType(instrumenter.create_target_call(target, key), target))
+            return entry[1]
+
+        def set_target(self_: Any, value: AnyCallable | None) -> None:
+            """Sets the target of the multiplexer."""
+            self_.__dict__["target"] = value
+
+        get_target.__instrumenter__ = self
+        return property(get_target, set_target, doc="The measuring wrapper of the target.")
+
+    def create_target_call(self, target: AnyCallable, key: Any) -> AnyCallable:
+        """Creates a function which measures the calls of a target of a multiplexer as dispatches.
+
+        Args:
+            target: The target to measure.
+            key: The function to record the calls by.
+
+        Returns:
+            The function which measures the calls, which takes the target as its first argument.
+        """
+        measure_call = self.measure_call
+
+        def target_call(target_: AnyCallable, *args: Any, **kwargs: Any) -> Any:
+            """Calls the target and records the call as a dispatch."""
+            return measure_call(target_, key, True, target_, args, kwargs)
+
+        target_call.__instrumenter__ = self
+        target_call.__wrapped__ = target
+        return target_call
+
+    def reset(self) -> None:
+        """Clears the records of all threads."""
+        self.local = local()
+        self.thread_records = []
+        self.stats = {}
+
+    # Exporting
+    def collect_records(self) -> dict[Any, list]:
+        """Combines the records of all threads.
+
+        Returns:
+            The primitive call count, call count, internal time, cumulative time, and caller counts of each function.
+        """
+        combined = {}
+        for records in list(self.thread_records):
+            for key, (primitive, count, internal, cumulative, callers, _) in tuple(records.items()):
+                if (record := combined.get(key, None)) is None:
+                    record = combined[key] = [0, 0, 0.0, 0.0, {}]
+                record[0] += primitive
+                record[1] += count
+                record[2] += internal
+                record[3] += cumulative
+                for caller, caller_count in tuple(callers.items()):
+                    record[4][caller] = record[4].get(caller, 0) + caller_count
+        return combined
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Gets the statistics of the calls of each function by qualified name, from the most to least total time.
+
+        Returns:
+            The call counts, internal and total time in seconds, location, and caller counts of each function.
+        """
+        stats = {}
+        for key, (primitive, count, internal, cumulative, callers) in self.collect_records().items():
+            filename, line, name = get_label(key)
+            if (entry := stats.get(name, None)) is None:
+                entry = stats[name] = {
+                    "count": 0,
+                    "primitive_count": 0,
+                    "internal_time": 0.0,
+                    "total_time": 0.0,
+                    "file": filename,
+                    "line": line,
+                    "callers": {},
+                }
+            entry["count"] += count
+            entry["primitive_count"] += primitive
+            entry["internal_time"] += internal
+            entry["total_time"] += cumulative
+            for caller, caller_count in callers.items():
+                caller_name = get_label(caller)[2]
+                entry["callers"][caller_name] = entry["callers"].get(caller_name, 0) + caller_count
+
+        return dict(sorted(stats.items(), key=lambda item: item[1]["total_time"], reverse=True))
+
+    def to_json(self, path: pathlib.Path | str | None = None, **kwargs: Any) -> str:
+        """Exports the statistics as JSON and optionally writes them to a file.
+
+        Args:
+            path: The path of the file to write the JSON to.
+            **kwargs: The keyword arguments for json.dumps.
+
+        Returns:
+            The statistics as JSON.
+        """
+        text = json.dumps(self.get_stats(), **kwargs)
+        if path is not None:
+            pathlib.Path(path).write_text(text)
+        return text
+
+    def create_stats(self) -> None:
+        """Creates the statistics in the pstats format, which allows pstats.Stats to load this object."""
+        stats = {}
+        for key, (primitive, count, internal, cumulative, callers) in self.collect_records().items():
+            label = get_label(key)
+            pstats_callers = {}
+            for caller, caller_count in callers.items():
+                caller_label = get_label(caller)
+                pstats_callers[caller_label] = pstats_callers.get(caller_label, 0) + caller_count
+
+            if (entry := stats.get(label, None)) is not None:
+                for caller_label, caller_count in entry[4].items():
+                    pstats_callers[caller_label] = pstats_callers.get(caller_label, 0) + caller_count
+                primitive += entry[0]
+                count += entry[1]
+                internal += entry[2]
+                cumulative += entry[3]
+            stats[label] = (primitive, count, internal, cumulative, pstats_callers)
+        self.stats = stats
+
+    def dump_stats(self, path: pathlib.Path | str) -> None:
+        """Writes the statistics in the pstats format to a file which pstats.Stats can load.
+
+        Args:
+            path: The path of the file to write the statistics to.
+        """
+        self.create_stats()
+        with pathlib.Path(path).open("wb") as file:
+            marshal.dump(self.stats, file)
+
+
+# Functions #
+def get_label(func: Any) -> tuple[str, int, str]:
+    """Gets the file, line number, and qualified name which identify a function.
+
+    Args:
+        func: The function to get the label of.
+
+    Returns:
+        The file, first line number, and module qualified name of the function.
+    """
+    code = getattr(unwrap(func), "__code__", None)
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None) or repr(func)
+    module = getattr(func, "__module__", None)
+    if module is not None:
+        name = f"{module}.{name}"
+    return ("~", 0, name) if code is None else (code.co_filename, code.co_firstlineno, name)
+
+
+# Names #
+call_instrumenter = CallInstrumenter()
@@ -0,0 +1,304 @@
+"""callpipeline.py
+A pipeline which fuses a sequence of callables into a single function.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import Any
+import weakref
+
+# Third-Party Packages #
+
+# Local Packages #
+from ..typing import AnyCallable
+from ..bases import BaseObject, BaseCallable
+from .callablemultiplexer import CallableMultiplexer
+from .dynamiccallable import DynamicCallable
+
+
+# Definitions #
+# Classes #
+class CallPipeline(BaseObject):
+    """A pipeline which fuses a sequence of callables into a single function.
+
+    Each stage takes the output of the previous stage. When the pipeline is built, the implementation each stage would
+    call is resolved once, which is the selected call method of a DynamicCallable or the target of a multiplexer, and
+    a single function which calls the implementations in order is generated. This removes the multiplexing and binding
+    of each stage from every call.
+
+    The generated functions check that the resolved implementations are still selected, so when the call method of a
+    stage changes, the pipeline is rebuilt on its next call. Records can be evaluated one at a time, as a list, or
+    lazily from an iterable. A list is checked once before its records are evaluated, while a lazy iteration is
+    checked before each record, so a change between records is followed by the rest of the iteration. A bound stage
+    only holds a weak reference to its instance, so calling it after the instance is deleted raises a ReferenceError.
+
+    Attributes:
+        stages: The callables of the pipeline in the order they are called.
+        guards: The objects, attributes, and values which must be unchanged for the built functions to be current.
+        fused_call: The generated function which evaluates one record.
+        fused_batch: The generated function which evaluates an iterable of records into a list.
+        fused_iterate: The generated function which lazily evaluates an iterable of records.
+
+    Args:
+        stages: The callables of the pipeline in the order they are called.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    stages: list[AnyCallable]
+    guards: tuple[tuple[Any, str, Any], ...] = ()
+
+    fused_call: AnyCallable
+    fused_batch: AnyCallable
+    fused_iterate: AnyCallable
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        stages: Iterable[AnyCallable] | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.stages: list[AnyCallable] = []
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(stages=stages, *args, **kwargs)
+
+    # Pickling
+    def __getstate__(self) -> dict[str, Any]:
+        """Creates a dictionary of attributes which can be used to rebuild this object
+
+        Returns:
+            A dictionary of this object's attributes.
+        """
+        state = super().__getstate__()
+        for name in ("guards", "fused_call", "fused_batch", "fused_iterate"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Builds this object based on a dictionary of corresponding attributes.
+
+        Args:
+            state: The attributes to build this object from.
+        """
+        super().__setstate__(state)
+        self.build()
+
+    # Calling
+    def __call__(self, record: Any) -> Any:
+        """Evaluates a record with the pipeline.
+
+        Args:
+            record: The input of the first stage.
+
+        Returns:
+            The output of the last stage.
+        """
+        return self.fused_call(record)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, stages: Iterable[AnyCallable] | None = None, *args: Any, **kwargs: Any) -> None:
+        """The constructor for this object.
+
+        Args:
+            stages: The callables of the pipeline in the order they are called.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if stages is not None:
+            self.stages = list(stages)
+
+        super().construct(*args, **kwargs)
+
+        self.build()
+
+    # Stages
+    def append(self, stage: AnyCallable) -> None:
+        """Adds a stage to the end of the pipeline.
+
+        Args:
+            stage: The callable to add.
+        """
+        self.stages.append(stage)
+        self.build()
+
+    def extend(self, stages: Iterable[AnyCallable]) -> None:
+        """Adds stages to the end of the pipeline.
+
+        Args:
+            stages: The callables to add.
+        """
+        self.stages.extend(stages)
+        self.build()
+
+    # Building
+    def is_current(self) -> bool:
+        """Determines if the implementations the pipeline was built with are still selected.
+
+        Returns:
+            True if the built functions are current.
+        """
+        return all(getattr(obj, name) is value for obj, name, value in self.guards)
+
+    def build(self) -> None:
+        """Resolves the implementation of each stage and generates the fused functions."""
+        namespace = {"__pipeline__": self, "__chain__": chain}
+        guards = []
+        expression = "record"
+        for i, stage in enumerate(self.stages):
+            if isinstance(stage, BaseCallable):
+                target, instance_ref = stage.get_exact_call()
+                guards.append((stage, "__wrapped__", stage.__wrapped__))
+                if isinstance(stage, DynamicCallable):
+                    guards.append((stage.call_multiplexer, "target", stage.call_multiplexer.target))
+                elif isinstance(stage, CallableMultiplexer):
+                    guards.append((stage, "target", stage.target))
+            else:
+                target, instance_ref = stage, None
+
+            namespace[f"__stage_{i}__"] = target
+            if instance_ref is None:
+                expression = f"__stage_{i}__({expression})"
+            else:
+                namespace[f"__instance_{i}__"] = self.create_instance_ref(namespace, i, instance_ref)
+                expression = f"__stage_{i}__(__instance_{i}__(), {expression})"
+
+        checks = []
+        for i, (obj, name, value) in enumerate(guards):
+            namespace[f"__guard_object_{i}__"] = obj
+            namespace[f"__guard_value_{i}__"] = value
+            checks.append(f"__guard_object_{i}__.{name} is not __guard_value_{i}__")
+        stale = " or ".join(checks) if checks else "False"
+
+        source = (
+            f"def fused_call(record):\n"
+            f"    if {stale}:\n"
+            f"        return __pipeline__.rebuild_call(record)\n"
+            f"    return {expression}\n"
+            f"def fused_batch(records):\n"
+            f"    if {stale}:\n"
+            f"        return __pipeline__.rebuild_batch(records)\n"
+            f"    return [{expression} for record in records]\n"
+            f"def fused_iterate(records):\n"
+            f"    records = iter(records)\n"
+            f"    for record in records:\n"
+            f"        if {stale}:\n"
+            f"            yield from __pipeline__.rebuild_iterate(__chain__((record,), records))\n"
+            f"            return\n"
+            f"        yield {expression}\n"
+        )
+        exec(source, namespace)
+
+        self.guards = tuple(guards)
+        self.fused_call = namespace["fused_call"]
+        self.fused_batch = namespace["fused_batch"]
+        self.fused_iterate = namespace["fused_iterate"]
+
+    def create_instance_ref(self, namespace: dict[str, Any], index: int, instance_ref: weakref.ref) -> weakref.ref:
+        """Creates the weak reference to the instance of a bound stage which the generated functions call.
+
+        When the instance is deleted, the reference in the namespace of the generated functions is replaced with a
+        function which raises a ReferenceError, so the stage is not called with None.
+
+        Args:
+            namespace: The namespace of the generated functions.
+            index: The index of the stage.
+            instance_ref: The weak reference to the instance the stage is bound to.
+
+        Returns:
+            The weak reference to the instance.
+        """
+        name = f"__instance_{index}__"
+        stage = self.stages[index]
+
+        def deleted_instance() -> None:
+            raise ReferenceError(f"The instance which stage {index} ({stage!r}) is bound to was deleted.")
+
+        instance = instance_ref()
+        if instance is None:
+            deleted_instance()
+        return weakref.ref(instance, lambda ref: namespace.__setitem__(name, deleted_instance))
+
+    def rebuild_call(self, record: Any) -> Any:
+        """Rebuilds the pipeline if it is not current and evaluates a record.
+
+        Args:
+            record: The input of the first stage.
+
+        Returns:
+            The output of the last stage.
+        """
+        if not self.is_current():
+            self.build()
+        return self.fused_call(record)
+
+    def rebuild_batch(self, records: Iterable[Any]) -> list[Any]:
+        """Rebuilds the pipeline if it is not current and evaluates records into a list.
+
+        Args:
+            records: The inputs of the first stage.
+
+        Returns:
+            The outputs of the last stage.
+        """
+        if not self.is_current():
+            self.build()
+        return self.fused_batch(records)
+
+    def rebuild_iterate(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Rebuilds the pipeline if it is not current and lazily evaluates records.
+
+        Args:
+            records: The inputs of the first stage.
+
+        Returns:
+            An iterator of the outputs of the last stage.
+        """
+        if not self.is_current():
+            self.build()
+        return self.fused_iterate(records)
+
+    # Calling
+    def call_batch(self, records: Iterable[Any]) -> list[Any]:
+        """Evaluates records with the pipeline into a list.
+
+        Args:
+            records: The inputs of the first stage.
+
+        Returns:
+            The outputs of the last stage.
+        """
+        return self.fused_batch(records)
+
+    def iterate(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Lazily evaluates records with the pipeline.
+
+        Args:
+            records: The inputs of the first stage.
+
+        Returns:
+            An iterator of the outputs of the last stage.
+        """
+        return self.fused_iterate(records)
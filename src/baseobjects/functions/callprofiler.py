@@ -0,0 +1,402 @@
+"""callprofiler.py
+A decorator which records the call counts, latencies, and sampled stacks of a function with low overhead.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections import deque
+from collections.abc import Callable, Iterable
+from sys import _getframe
+from threading import current_thread, local
+from time import perf_counter
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from ..typing import AnyCallable
+from .basedecorator import BaseDecorator
+
+
+# Definitions #
+# Classes #
+class CallProfileBuffer:
+    """The measurements of the calls of a profiled function made by one thread.
+
+    Attributes:
+        thread_name: The name of the thread which made the calls.
+        count: The number of calls.
+        total: The total latency of the calls in seconds.
+        minimum: The lowest latency in seconds.
+        maximum: The highest latency in seconds.
+        latencies: The latencies in seconds of the most recent calls.
+        stacks: The number of times each sampled stack was seen.
+
+    Args:
+        thread_name: The name of the thread which made the calls.
+        size: The number of recent latencies to keep.
+    """
+
+    __slots__ = ("thread_name", "count", "total", "minimum", "maximum", "latencies", "stacks")
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, thread_name: str, size: int) -> None:
+        self.thread_name: str = thread_name
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: float = float("inf")
+        self.maximum: float = 0.0
+        self.latencies: deque[float] = deque(maxlen=size)
+        self.stacks: dict[tuple[tuple[str, int, str], ...], int] = {}
+
+
+class CallProfiler(BaseDecorator):
+    """A decorator which records the call counts, latencies, and sampled stacks of a function with low overhead.
+
+    Each thread records into its own buffer, so calls do not take locks and the buffers are only combined when the
+    statistics are requested. The buffers keep exact counts and totals, but percentiles are computed from the most
+    recent latencies which fit in the buffers. Every stack sample rate calls, the stack of the caller is recorded.
+
+    Profiling is switched with the call method, so disabling it sets the call method to the plain call and calls of
+    the disabled profiler have no profiling overhead.
+
+    Attributes:
+        buffer_size: The number of recent latencies each thread keeps for computing percentiles.
+        stack_sample_rate: The number of calls between stack samples or zero to not sample stacks.
+        stack_limit: The max number of frames in a sampled stack.
+        percentiles: The percentiles of the latencies to compute.
+        local: The thread local data which holds the buffer of each thread.
+        buffers: The buffers of all the threads.
+
+    Args:
+        func: The function to profile.
+        buffer_size: The number of recent latencies each thread keeps for computing percentiles.
+        stack_sample_rate: The number of calls between stack samples or zero to not sample stacks.
+        stack_limit: The max number of frames in a sampled stack.
+        percentiles: The percentiles of the latencies to compute.
+        enabled: Determines if the calls will be profiled.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    _wrapper_method: str = "profile_call"
+
+    buffer_size: int = 10000
+    stack_sample_rate: int = 0
+    stack_limit: int = 16
+    percentiles: tuple[float, ...] = (50.0, 90.0, 99.0)
+
+    local: local
+    buffers: list[CallProfileBuffer]
+
+    # Properties #
+    @property
+    def is_enabled(self) -> bool:
+        """Determines if the calls are being profiled."""
+        return self._call_method == self._wrapper_method
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        func: AnyCallable | None = None,
+        buffer_size: int | None = None,
+        stack_sample_rate: int | None = None,
+        stack_limit: int | None = None,
+        percentiles: Iterable[float] | None = None,
+        enabled: bool | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.local: local = local()
+        self.buffers: list[CallProfileBuffer] = []
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(
+                func=func,
+                buffer_size=buffer_size,
+                stack_sample_rate=stack_sample_rate,
+                stack_limit=stack_limit,
+                percentiles=percentiles,
+                enabled=enabled,
+                *args,
+                **kwargs,
+            )
+
+    # Pickling
+    def __getstate__(self) -> dict[str, Any]:
+        """Creates a dictionary of attributes which can be used to rebuild this object
+
+        Returns:
+            A dictionary of this object's attributes.
+        """
+        state = super().__getstate__()
+        del state["local"]
+        del state["buffers"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Builds this object based on a dictionary of corresponding attributes.
+
+        Args:
+            state: The attributes to build this object from.
+        """
+        super().__setstate__(state)
+        self.local = local()
+        self.buffers = []
+
+    # Instance Methods #
+    # Constructors
+    def construct(
+        self,
+        func: AnyCallable | None = None,
+        buffer_size: int | None = None,
+        stack_sample_rate: int | None = None,
+        stack_limit: int | None = None,
+        percentiles: Iterable[float] | None = None,
+        enabled: bool | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            func: The function to profile.
+            buffer_size: The number of recent latencies each thread keeps for computing percentiles.
+            stack_sample_rate: The number of calls between stack samples or zero to not sample stacks.
+            stack_limit: The max number of frames in a sampled stack.
+            percentiles: The percentiles of the latencies to compute.
+            enabled: Determines if the calls will be profiled.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if buffer_size is not None:
+            self.buffer_size = buffer_size
+
+        if stack_sample_rate is not None:
+            self.stack_sample_rate = stack_sample_rate
+
+        if stack_limit is not None:
+            self.stack_limit = stack_limit
+
+        if percentiles is not None:
+            self.percentiles = tuple(percentiles)
+
+        super().construct(func=func, *args, **kwargs)
+
+        # Coroutines are timed until they finish rather than until they are created.
+        if self._is_coroutine is not None:
+            self.wrapper_method = "async_profile_call"
+
+        if enabled is True:
+            self.enable()
+        elif enabled is False:
+            self.disable()
+
+    # Switching
+    def enable(self) -> None:
+        """Starts profiling the calls."""
+        self.call_method = self._wrapper_method
+
+    def disable(self) -> None:
+        """Stops profiling the calls, which are then passed directly to the function."""
+        self.call_method = "call"
+
+    # Buffers
+    def create_buffer(self) -> CallProfileBuffer:
+        """Creates the buffer of the current thread.
+
+        Returns:
+            The buffer of the current thread.
+        """
+        buffer = CallProfileBuffer(current_thread().name, self.buffer_size)
+        self.local.buffer = buffer
+        self.buffers.append(buffer)
+        return buffer
+
+    def record(self, buffer: CallProfileBuffer, latency: float) -> None:
+        """Records the latency of a call into a buffer and samples the stack if it is the call to sample.
+
+        Args:
+            buffer: The buffer of the thread which made the call.
+            latency: The latency of the call in seconds.
+        """
+        buffer.count += 1
+        buffer.total += latency
+        buffer.latencies.append(latency)
+        if latency < buffer.minimum:
+            buffer.minimum = latency
+        if latency > buffer.maximum:
+            buffer.maximum = latency
+
+        if self.stack_sample_rate and buffer.count % self.stack_sample_rate == 0:
+            # Skip the frames of this method, the profiling call, and __call__.
+            frame = _getframe(3)
+            stack = []
+            while frame is not None and len(stack) < self.stack_limit:
+                code = frame.f_code
+                stack.append((code.co_filename, frame.f_lineno, code.co_name))
+                frame = frame.f_back
+            stack = tuple(stack)
+            buffer.stacks[stack] = buffer.stacks.get(stack, 0) + 1
+
+    def reset(self) -> None:
+        """Clears the measurements of all threads."""
+        self.local = local()
+        self.buffers = []
+
+    # Statistics
+    def get_stats(self) -> dict[str, Any]:
+        """Combines the buffers of all threads into the statistics of the calls.
+
+        Returns:
+            The count, total, mean, min, max, and percentile latencies in seconds, the count of each thread, and the
+            sampled stacks with their counts from the most to the least seen.
+        """
+        buffers = list(self.buffers)
+        count = sum(b.count for b in buffers)
+        total = sum(b.total for b in buffers)
+        latencies = sorted(latency for b in buffers for latency in tuple(b.latencies))
+
+        stacks = {}
+        for buffer in buffers:
+            for stack, stack_count in tuple(buffer.stacks.items()):
+                stacks[stack] = stacks.get(stack, 0) + stack_count
+
+        threads = {}
+        for buffer in buffers:
+            threads[buffer.thread_name] = threads.get(buffer.thread_name, 0) + buffer.count
+
+        return {
+            "name": self.__qualname__,
+            "count": count,
+            "total": total,
+            "mean": total / count if count else 0.0,
+            "min": min((b.minimum for b in buffers if b.count), default=0.0),
+            "max": max((b.maximum for b in buffers), default=0.0),
+            "percentiles": {p: get_percentile(latencies, p) for p in self.percentiles},
+            "threads": threads,
+            "stacks": sorted(stacks.items(), key=lambda item: item[1], reverse=True),
+        }
+
+    # Calling
+    def profile_call(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the wrapped function and records the latency of the call.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The output of the wrapped function.
+        """
+        try:
+            buffer = self.local.buffer
+        except AttributeError:
+            buffer = self.create_buffer()
+
+        start = perf_counter()
+        try:
+            return self.__wrapped__(*args, **kwargs)
+        finally:
+            self.record(buffer, perf_counter() - start)
+
+    async def async_profile_call(self, *args: Any, **kwargs: Any) -> Any:
+        """Awaits the wrapped coroutine function and records the latency of the call.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The output of the wrapped function.
+        """
+        try:
+            buffer = self.local.buffer
+        except AttributeError:
+            buffer = self.create_buffer()
+
+        start = perf_counter()
+        try:
+            return await self.__wrapped__(*args, **kwargs)
+        finally:
+            self.record(buffer, perf_counter() - start)
+
+
+# Functions #
+def get_percentile(ordered: list[float], percentile: float) -> float:
+    """Gets a percentile of sorted values by linear interpolation.
+
+    Args:
+        ordered: The values sorted from lowest to highest.
+        percentile: The percentile to get from 0 to 100.
+
+    Returns:
+        The value at the percentile or zero if there are no values.
+    """
+    if not ordered:
+        return 0.0
+
+    position = (len(ordered) - 1) * percentile / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def profile_calls(
+    buffer_size: int | None = None,
+    stack_sample_rate: int | None = None,
+    stack_limit: int | None = None,
+    percentiles: Iterable[float] | None = None,
+    enabled: bool | None = None,
+) -> Callable[[AnyCallable], CallProfiler]:
+    """A factory to be used a decorator that sets the parameters of call profiler factory.
+
+    Args:
+        buffer_size: The number of recent latencies each thread keeps for computing percentiles.
+        stack_sample_rate: The number of calls between stack samples or zero to not sample stacks.
+        stack_limit: The max number of frames in a sampled stack.
+        percentiles: The percentiles of the latencies to compute.
+        enabled: Determines if the calls will be profiled.
+
+    Returns:
+        The parameterized call profiler factory.
+    """
+
+    def call_profiler_factory(func: AnyCallable) -> CallProfiler:
+        """A factory for wrapping a function with a CallProfiler object.
+
+        Args:
+            func: The function to wrap with a CallProfiler.
+
+        Returns:
+            The CallProfiler object which wraps the given function.
+        """
+        return CallProfiler(
+            func,
+            buffer_size=buffer_size,
+            stack_sample_rate=stack_sample_rate,
+            stack_limit=stack_limit,
+            percentiles=percentiles,
+            enabled=enabled,
+        )
+
+    return call_profiler_factory
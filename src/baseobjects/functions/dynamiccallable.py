@@ -13,15 +13,23 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from importlib import import_module
+from itertools import islice
+import sys
+import time
 from typing import Any
 from types import FunctionType, MethodType
+import weakref
 
 # Third-Party Packages #
 
 # Local Packages #
 from ..typing import AnyCallable
 from ..bases import BaseCallable, BaseFunction, BaseMethod
-from .callablemultiplexer import CallableMultiplexer, MethodMultiplexer
+from .callablemultiplexer import MethodMultiplexer
 
 
 # Definitions #
@@ -98,7 +106,7 @@ class DynamicCallable(BaseCallable):
 
     # Calling
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        """This call delegates callback to a MethodMultiplexer.
+        """This call delegates callback to the target of a MethodMultiplexer.
 
         Args:
             *args: The arguments of the wrapped function.
@@ -107,9 +115,21 @@ class DynamicCallable(BaseCallable):
         Returns:
             The output of the wrapped function.
         """
-        return self.call_multiplexer(*args, **kwargs)
+        return self.call_multiplexer.target(*args, **kwargs)
 
     # Instance Methods #
+    # Casting
+    def get_exact_call(self) -> tuple[AnyCallable, weakref.ref | None]:
+        """Gets the implementation which calls of this object are delegated to, which is the selected call method.
+
+        Returns:
+            The implementation and a weak reference to the instance given to it as the first argument, if any.
+        """
+        if getattr(type(self), self._call_method, None) is DynamicCallable.call:
+            return self.__wrapped__, None
+        else:
+            return self.call_multiplexer.target, None
+
     # Calling
     def call(self, *args: Any, **kwargs: Any) -> Any:
         """Calls the wrapped function.
@@ -131,6 +151,25 @@ class DynamicMethod(DynamicCallable, BaseMethod):
     _call_method: str = "call"
 
     # Instance Methods #
+    # Constructors/Destructors
+    def reset(self) -> None:
+        """Unbinds this method and selects the default call method, so it can be bound to another object."""
+        if self._call_method != type(self)._call_method:
+            self.call_method = type(self)._call_method
+        super().reset()
+
+    # Casting
+    def get_exact_call(self) -> tuple[AnyCallable, weakref.ref | None]:
+        """Gets the implementation which calls of this object are delegated to, which is the selected call method.
+
+        Returns:
+            The implementation and a weak reference to the instance given to it as the first argument, if any.
+        """
+        if getattr(type(self), self._call_method, None) is DynamicMethod.call and self._self_ is not None:
+            return self.__wrapped__, self._self_
+        else:
+            return self.call_multiplexer.target, None
+
     # Calling
     def call(self, *args: Any, **kwargs: Any) -> Any:
         """Calls the wrapped function with the instance as an argument.
@@ -148,9 +187,20 @@ class DynamicMethod(DynamicCallable, BaseMethod):
 class DynamicFunction(DynamicCallable, BaseFunction):
     """An abstract function class that has multiplexed callback and binding.
 
+    The call methods submit_call and map_call run the wrapped function on an executor, so any DynamicFunction can be
+    switched to parallel execution at runtime by setting its call method. The executor can be given with set_executor,
+    otherwise one of the executor type is created when it is first needed. Process pools require the wrapped function
+    and its arguments to be picklable. A function which is decorated where it is defined is replaced there by this
+    object, so it cannot be pickled by reference, then the workers find it by its qualified name instead.
+
     Attributes:
         _bind_method: The name of the method used when binding this object.
         bind_multiplexer: The multiplexer which control the binding method being use.
+        executor_type: The type of executor to create when no executor is given.
+        max_workers: The max number of workers of a created executor.
+        chunksize: The number of items map_call gives to a worker at a time.
+        executor: The executor which runs the wrapped function for the executor call methods.
+        _owns_executor: Determines if the executor was created by this object and should be shutdown by it.
 
     Args:
         func: The function to wrap.
@@ -166,6 +216,12 @@ class DynamicFunction(DynamicCallable, BaseFunction):
     _bind_method: str = "bind"
     bind_multiplexer: MethodMultiplexer
 
+    executor_type: type[Executor] = ThreadPoolExecutor
+    max_workers: int | None = None
+    chunksize: int = 1
+    executor: Executor | None = None
+    _owns_executor: bool = False
+
     # Properties #
     @property
     def bind_method(self) -> str | None:
@@ -205,6 +261,8 @@ class DynamicFunction(DynamicCallable, BaseFunction):
         """
         state = super().__getstate__()
         state["bind_multiplexer"] = (self.bind_multiplexer.register, self.bind_multiplexer.selected)
+        state.pop("executor", None)
+        state.pop("_owns_executor", None)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
@@ -219,7 +277,7 @@ class DynamicFunction(DynamicCallable, BaseFunction):
 
     # Descriptor
     def __get__(self, *args: Any, **kwargs: Any) -> Any:
-        """This call delegates callback to a CallableMultiplexer.
+        """This call delegates callback to the target of a MethodMultiplexer.
 
         Args:
             *args: The arguments of the wrapped function.
@@ -228,7 +286,7 @@ class DynamicFunction(DynamicCallable, BaseFunction):
         Returns:
             The output of the wrapped function.
         """
-        return self.bind_multiplexer(*args, **kwargs)
+        return self.bind_multiplexer.target(*args, **kwargs)
 
     # Instance Methods #
     # Binding
@@ -243,3 +301,181 @@ class DynamicFunction(DynamicCallable, BaseFunction):
             The bound method of this function.
         """
         return self if instance is None else MethodType(self.__wrapped__, instance)
+
+    # Executor
+    def set_executor(
+        self,
+        executor: Executor | None = None,
+        executor_type: type[Executor] | None = None,
+        max_workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> None:
+        """Sets the executor which runs the wrapped function for the executor call methods.
+
+        Args:
+            executor: The executor to use or None to create one of the executor type when it is needed.
+            executor_type: The type of executor to create when no executor is given.
+            max_workers: The max number of workers of a created executor.
+            chunksize: The number of items map_call gives to a worker at a time.
+        """
+        self.shutdown_executor(wait=False)
+
+        if executor is not None:
+            self.executor = executor
+
+        if executor_type is not None:
+            self.executor_type = executor_type
+
+        if max_workers is not None:
+            self.max_workers = max_workers
+
+        if chunksize is not None:
+            self.chunksize = chunksize
+
+    def get_executor(self) -> Executor:
+        """Gets the executor, creating one of the executor type if there is no executor.
+
+        Returns:
+            The executor which runs the wrapped function.
+        """
+        if self.executor is None:
+            self.executor = self.executor_type(max_workers=self.max_workers)
+            self._owns_executor = True
+        return self.executor
+
+    def shutdown_executor(self, wait: bool = True) -> None:
+        """Shuts down the executor if it was created by this object and removes the executor.
+
+        Args:
+            wait: Determines if this call will wait for the pending calls to finish.
+        """
+        if self.executor is not None and self._owns_executor:
+            self.executor.shutdown(wait=wait)
+        self.executor = None
+        self._owns_executor = False
+
+    def get_executor_call(self, executor: Executor) -> AnyCallable:
+        """Gets the callable of the wrapped function to give to an executor.
+
+        Executors other than thread pools can pickle the callable. When this object replaced the wrapped function at
+        its qualified name, the function cannot be pickled by reference, so a partial which finds this object by its
+        qualified name in the worker and calls its wrapped function is given instead.
+
+        Args:
+            executor: The executor which the callable will be given to.
+
+        Returns:
+            The callable which calls the wrapped function.
+        """
+        func = self.__wrapped__
+        if isinstance(executor, ThreadPoolExecutor):
+            return func
+
+        module = getattr(func, "__module__", None)
+        qualname = getattr(func, "__qualname__", "<locals>")
+        if module is None or "<locals>" in qualname:
+            return func
+
+        obj = sys.modules.get(module)
+        for name in qualname.split("."):
+            obj = getattr(obj, name, None)
+        return partial(call_qualified_wrapped, module, qualname) if obj is self else func
+
+    # Calling
+    def submit_call(self, *args: Any, **kwargs: Any) -> Future:
+        """Submits a call of the wrapped function to the executor.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The future of the output of the wrapped function.
+        """
+        executor = self.get_executor()
+        return executor.submit(self.get_executor_call(executor), *args, **kwargs)
+
+    def map_call(
+        self,
+        *iterables: Iterable[Any],
+        chunksize: int | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[Any]:
+        """Calls the wrapped function for each set of items of the iterables on the executor, like map.
+
+        The calls are submitted in chunks, so each worker call evaluates several items, which reduces the overhead of
+        the executor for many small calls. Like Executor.map, the timeout is one deadline for all the results which
+        starts when this method is called.
+
+        Args:
+            *iterables: The iterables which give the arguments of each call.
+            chunksize: The number of items to give to a worker at a time, the default is the chunksize attribute.
+            timeout: The max number of seconds to wait for all the results.
+
+        Returns:
+            An iterator of the outputs of the calls in the order of the items.
+        """
+        end_time = None if timeout is None else time.monotonic() + timeout
+        executor = self.get_executor()
+        func = self.get_executor_call(executor)
+        if chunksize is None:
+            chunksize = self.chunksize
+
+        if chunksize <= 1:
+            return executor.map(func, *iterables, timeout=timeout)
+
+        arguments = zip(*iterables)
+        futures = []
+        while chunk := tuple(islice(arguments, chunksize)):
+            futures.append(executor.submit(call_chunk, func, chunk))
+        return iterate_chunk_results(futures, end_time)
+
+
+# Functions #
+def call_chunk(func: AnyCallable, chunk: Iterable[tuple[Any, ...]]) -> list[Any]:
+    """Calls a function with each set of arguments in a chunk.
+
+    Args:
+        func: The function to call.
+        chunk: The sets of arguments to call the function with.
+
+    Returns:
+        The outputs of the calls.
+    """
+    return [func(*arguments) for arguments in chunk]
+
+
+def call_qualified_wrapped(module: str, qualname: str, *args: Any, **kwargs: Any) -> Any:
+    """Calls the function wrapped by the object at a qualified name, which is how workers call decorated functions.
+
+    Args:
+        module: The name of the module of the object.
+        qualname: The qualified name of the object in its module.
+        *args: The arguments of the wrapped function.
+        **kwargs: The keyword arguments of the wrapped function.
+
+    Returns:
+        The output of the wrapped function.
+    """
+    obj = import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj.__wrapped__(*args, **kwargs)
+
+
+def iterate_chunk_results(futures: list[Future], end_time: float | None = None) -> Iterator[Any]:
+    """Iterates over the results of futures of chunks, cancelling the remaining futures if the iteration stops early.
+
+    Args:
+        futures: The futures of the chunks in order.
+        end_time: The monotonic time to stop waiting for the results at or None to wait without a limit.
+
+    Yields:
+        The results of the chunks in order.
+    """
+    try:
+        for future in futures:
+            yield from future.result(None if end_time is None else end_time - time.monotonic())
+    finally:
+        for future in futures:
+            future.cancel()
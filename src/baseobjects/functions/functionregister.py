@@ -13,8 +13,10 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
-from collections.abc import Iterable
-from typing import Any
+from collections.abc import Iterable, Iterator
+from types import ClassMethodDescriptorType, FunctionType, MethodDescriptorType, WrapperDescriptorType
+from typing import Any, ClassVar, NamedTuple
+from weakref import WeakKeyDictionary, ref
 
 # Third-Party Packages #
 
@@ -24,19 +26,132 @@ from ..bases import BaseDict
 
 
 # Definitions #
+# Constants #
+IMMUTABLE_TYPE_FLAG = 1 << 8
+CLASS_DESCRIPTOR = object.__dict__["__class__"]
+
+
 # Classes #
+class CallableTable(NamedTuple):
+    """The callable attributes of a type, which are shared by all of its instances.
+
+    A table only holds the identities of the classes and attributes and weak references to the functions, so it does
+    not keep the type or the values of its attributes alive.
+
+    Attributes:
+        snapshot: The ids of the classes in the MRO and the names and ids of the attributes of each mutable class when
+            the table was made, to check if it is current.
+        functions: The weak references to the functions of the attributes which resolve to the same function for every
+            instance.
+        descriptors: The unbound methods of builtin types, which do not support weak references.
+        dynamic: The names of the attributes which must be resolved for each instance, like properties.
+    """
+
+    snapshot: tuple[int | tuple[int, tuple[str, ...], tuple[int, ...]], ...]
+    functions: dict[str, ref]
+    descriptors: dict[str, AnyCallable]
+    dynamic: frozenset[str]
+
+
 class FunctionRegister(BaseDict):
     """A register which holds functions.
 
+    The callable attributes of a type are found once and cached in a table, which is used for each instance of the type
+    added to a register until the type or one of its bases changes. When lazy, objects added to a register are not
+    searched until a name is looked up, and then only for that name. Iterating or getting the size of a lazy register
+    resolves all the remaining names. The functions which are explicitly set take precedence over the functions of the
+    lazily resolved objects.
+
+    Attributes:
+        _type_tables: The cached callable tables of the types.
+        is_lazy: Determines if the functions of objects are resolved when they are looked up.
+        pending_objects: The objects whose functions have not been resolved.
+
     Args:
         functions: The functions and their keys to add to the register.
         object_: An object whose functions will be added to the register.
         objects: An iterable of objects whose functions will be added to the register.
+        lazy: Determines if the functions of objects are resolved when they are looked up.
         *args: Arguments for inheritance.
         init: Determines if this object will construct.
         **kwargs: Keyword arguments for inheritance.
     """
 
+    # Attributes #
+    _type_tables: ClassVar[WeakKeyDictionary[type, CallableTable]] = WeakKeyDictionary()
+
+    is_lazy: bool = False
+    pending_objects: list[Any]
+
+    # Class Methods #
+    @classmethod
+    def get_callable_table(cls, type_: type) -> CallableTable | None:
+        """Gets the cached callable table of a type, creating it if it is missing or the type has changed.
+
+        Args:
+            type_: The type to get the table of.
+
+        Returns:
+            The table of the type or None if the attribute access of the type is customized and cannot be tabled.
+        """
+        if type_.__getattribute__ is not object.__getattribute__ or type_.__dir__ is not object.__dir__:
+            return None
+
+        mro = type_.__mro__
+        snapshot = get_snapshot(mro)
+        table = cls._type_tables.get(type_, None)
+        if table is not None and table.snapshot == snapshot:
+            return table
+
+        # The table is dropped when a function dies, so an id in the snapshot cannot be reused by a new attribute.
+        type_ref = ref(type_)
+        tables = cls._type_tables
+
+        def drop_table(_: ref) -> None:
+            """Drops the table of the type after one of its functions dies."""
+            if (dead_type := type_ref()) is not None:
+                tables.pop(dead_type, None)
+
+        functions = {}
+        descriptors = {}
+        dynamic = set()
+        for name in {name for c in mro for name in c.__dict__}:
+            raw = next(c.__dict__[name] for c in mro if name in c.__dict__)
+            raw_type = type(raw)
+            if raw_type is FunctionType:
+                func = raw
+            elif raw_type is staticmethod:
+                func = get_function(raw.__func__)
+            elif raw_type is classmethod and type(raw.__func__) is FunctionType:
+                func = raw.__func__
+            elif raw_type is WrapperDescriptorType or raw_type is MethodDescriptorType:
+                # The unbound builtin method is the builtin equivalent of the underlying function of a method.
+                if raw.__objclass__.__flags__ & IMMUTABLE_TYPE_FLAG:
+                    descriptors[name] = raw
+                else:
+                    dynamic.add(name)
+                continue
+            elif raw_type is ClassMethodDescriptorType or raw is CLASS_DESCRIPTOR or hasattr(raw_type, "__get__"):
+                # These are bound to the type or the instance, so they are resolved for each instance.
+                dynamic.add(name)
+                continue
+            else:
+                func = get_function(raw)
+
+            if func is not None:
+                try:
+                    functions[name] = ref(func, drop_table)
+                except TypeError:
+                    dynamic.add(name)
+
+        table = tables[type_] = CallableTable(snapshot, functions, descriptors, frozenset(dynamic))
+        return table
+
+    @classmethod
+    def clear_callable_tables(cls) -> None:
+        """Clears the cached callable tables of all types."""
+        cls._type_tables.clear()
+
     # Magic Methods #
     # Construction/Destruction
     def __init__(
@@ -44,16 +159,79 @@ class FunctionRegister(BaseDict):
         functions: dict[str, AnyCallable] | None = None,
         object_: Any = None,
         objects: Iterable[Any, ...] = None,
+        lazy: bool | None = None,
         *args: Any,
         init: bool = True,
         **kwargs: Any,
     ) -> None:
+        # New Attributes #
+        self.pending_objects: list[Any] = []
+
         # Parent Attributes #
         super().__init__(*args, **kwargs)
 
         # Object Construction #
         if init:
-            self.construct(functions=functions, object_=object_, objects=objects, *args, **kwargs)
+            self.construct(functions=functions, object_=object_, objects=objects, lazy=lazy, *args, **kwargs)
+
+    # Container Methods
+    def __missing__(self, key: str) -> AnyCallable:
+        """Resolves a missing function from the pending objects.
+
+        Args:
+            key: The name of the function.
+
+        Returns:
+            The function.
+
+        Raises:
+            KeyError: When the function is not in the register or the pending objects.
+        """
+        for object_ in reversed(self.pending_objects):
+            if (func := self.resolve_name(object_, key)) is not None:
+                self.data[key] = func
+                return func
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Determines if a function is in the register, resolving it from the pending objects if it is missing.
+
+        Args:
+            key: The name of the function.
+
+        Returns:
+            True if the function is in the register.
+        """
+        if key in self.data:
+            return True
+        elif self.pending_objects:
+            try:
+                self.__missing__(key)
+            except KeyError:
+                return False
+            return True
+        else:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the names of the functions after resolving the pending objects.
+
+        Returns:
+            An iterator of the names of the functions.
+        """
+        if self.pending_objects:
+            self.resolve_pending()
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        """Gets the number of functions after resolving the pending objects.
+
+        Returns:
+            The number of functions.
+        """
+        if self.pending_objects:
+            self.resolve_pending()
+        return len(self.data)
 
     # Instance Methods #
     # Constructors/Destructors
@@ -62,6 +240,7 @@ class FunctionRegister(BaseDict):
         functions: dict[str, AnyCallable] | None = None,
         object_: Any = None,
         objects: Iterable[Any, ...] = None,
+        lazy: bool | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> None:
@@ -71,9 +250,13 @@ class FunctionRegister(BaseDict):
             functions: The functions and their keys to add to the register.
             object_: An object whose functions will be added to the register.
             objects: An iterable of objects whose functions will be added to the register.
+            lazy: Determines if the functions of objects are resolved when they are looked up.
             *args: Arguments for inheritance.
             **kwargs: Keyword arguments for inheritance.
         """
+        if lazy is not None:
+            self.is_lazy = lazy
+
         if object_ is not None:
             self.update_from_object(object_=object_)
 
@@ -85,17 +268,73 @@ class FunctionRegister(BaseDict):
 
         super().construct(*args, **kwargs)
 
+    def get_object_functions(self, object_: Any) -> dict[str, AnyCallable]:
+        """Gets the functions of the callable attributes of an object.
+
+        Args:
+            object_: The object to get the functions of.
+
+        Returns:
+            The functions of the object by the names of their attributes.
+        """
+        instance_dict = getattr(object_, "__dict__", {})
+        table = None if isinstance(object_, type) else self.get_callable_table(type(object_))
+        if table is None:
+            names = set(dir(object_)) | set(instance_dict.keys())
+            functions = {}
+        else:
+            names = table.dynamic | instance_dict.keys()
+            functions = {n: r() for n, r in table.functions.items() if n not in instance_dict}
+            functions.update((n, d) for n, d in table.descriptors.items() if n not in instance_dict)
+
+        for name in names:
+            if (func := get_function(getattr(object_, name, None))) is not None:
+                functions[name] = func
+        return functions
+
     def update_from_object(self, object_: Any) -> None:
         """Updates the register with an object whose functions will be added to the register.
 
         Args:
             object_: The object whose functions will be added to the register.
         """
-        for name in set(dir(object_)) | set(vars(object_).keys()):
-            attr = getattr(object_, name, None)
-            func = None if attr is None or not callable(attr) else attr.__func__ if hasattr(attr, "__func__") else attr
-            if func is not None:
-                self.data[name] = func
+        if self.is_lazy:
+            self.pending_objects.append(object_)
+        else:
+            self.data.update(self.get_object_functions(object_))
+
+    def resolve_name(self, object_: Any, name: str) -> AnyCallable | None:
+        """Resolves the function of an attribute of an object.
+
+        Args:
+            object_: The object to get the function from.
+            name: The name of the attribute.
+
+        Returns:
+            The function or None if the object does not have a callable attribute with the name.
+        """
+        instance_dict = getattr(object_, "__dict__", {})
+        table = None if isinstance(object_, type) else self.get_callable_table(type(object_))
+        if table is None:
+            if name not in instance_dict and name not in dir(object_):
+                return None
+        elif name not in instance_dict and name not in table.dynamic:
+            if (func_ref := table.functions.get(name, None)) is not None:
+                return func_ref()
+            return table.descriptors.get(name, None)
+        return get_function(getattr(object_, name, None))
+
+    def resolve_pending(self) -> None:
+        """Resolves all the functions of the pending objects without replacing the functions in the register."""
+        resolved = {}
+        for object_ in self.pending_objects:
+            resolved.update(self.get_object_functions(object_))
+        self.pending_objects.clear()
+
+        data = self.data
+        for name, func in resolved.items():
+            if name not in data:
+                data[name] = func
 
     def update_from_objects(self, *args: Any) -> None:
         """Updates the register with objects whose functions will be added to the register.
@@ -105,3 +344,31 @@ class FunctionRegister(BaseDict):
         """
         for object_ in args:
             self.update_from_object(object_=object_)
+
+
+# Functions #
+def get_snapshot(mro: tuple[type, ...]) -> tuple[int | tuple[int, tuple[str, ...], tuple[int, ...]], ...]:
+    """Gets the identities of the classes of an MRO and the attributes of its mutable classes.
+
+    Args:
+        mro: The MRO to get the snapshot of.
+
+    Returns:
+        The id of each immutable class and the id, attribute names, and attribute ids of each mutable class.
+    """
+    return tuple(
+        id(c) if c.__flags__ & IMMUTABLE_TYPE_FLAG else (id(c), tuple(c.__dict__), tuple(map(id, c.__dict__.values())))
+        for c in mro
+    )
+
+
+def get_function(attr: Any) -> AnyCallable | None:
+    """Gets the function of a callable attribute, which is the underlying function of a method.
+
+    Args:
+        attr: The attribute to get the function of.
+
+    Returns:
+        The function or None if the attribute is not callable.
+    """
+    return None if attr is None or not callable(attr) else attr.__func__ if hasattr(attr, "__func__") else attr
@@ -169,9 +169,94 @@ class BoundMethodRegister(BaseMethodRegister):
 
 
 class MethodRegister(BaseMethodRegister):
-    """A register which holds functions and binds appropriately."""
+    """A register which holds functions and binds appropriately.
+
+    The register bound to each instance is created once and cached by the identity of the instance, so repeated
+    attribute access returns the same bound register, which shares the functions of this register. Instances which are
+    equal still get their own bound registers. A cached register is removed when its instance dies.
+
+    Attributes:
+        bound_registers: The bound register of each instance by the id of the instance.
+
+    Args:
+        methods: The functions and their keys to add to the register.
+        object_: An object whose functions will be added to the register.
+        objects: An iterable of objects whose functions will be added to the register.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    bound_registers: dict[int, BoundMethodRegister]
 
     # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        methods: dict[str, AnyCallable] | None = None,
+        object_: Any = None,
+        objects: Iterable[Any, ...] = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.bound_registers: dict[int, BoundMethodRegister] = {}
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(methods=methods, object_=object_, objects=objects, *args, **kwargs)
+
+    # Pickling
+    def __getstate__(self) -> dict[str, Any]:
+        """Creates a dictionary of attributes which can be used to rebuild this object
+
+        Returns:
+            A dictionary of this object's attributes.
+        """
+        state = super().__getstate__()
+        del state["bound_registers"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Builds this object based on a dictionary of corresponding attributes.
+
+        Args:
+            state: The attributes to build this object from.
+        """
+        super().__setstate__(state)
+        self.bound_registers = {}
+
     # Descriptor
     def __get__(self, instance: Any, owner: type[Any] | None = None) -> BoundMethodRegister:
-        return BoundMethodRegister(register=self, instance=instance, owner=owner)
+        """Gets the register bound to an instance, which is cached for each instance.
+
+        Args:
+            instance: The object to bind the register to.
+            owner: The class of the object being bound to.
+
+        Returns:
+            The bound register.
+        """
+        if instance is None:
+            return BoundMethodRegister(register=self, owner=owner)
+
+        key = id(instance)
+        bound = self.bound_registers.get(key, None)
+        if bound is not None and bound.data is self.data and bound.__self__ is instance:
+            return bound
+
+        bound = BoundMethodRegister(register=self, owner=owner)
+        bound_registers = self.bound_registers
+
+        def remove_bound(_: weakref.ref) -> None:
+            """Removes the bound register of the instance after the instance dies, before its id can be reused."""
+            bound_registers.pop(key, None)
+
+        bound._self_ = weakref.ref(instance, remove_bound)
+        bound_registers[key] = bound
+        return bound
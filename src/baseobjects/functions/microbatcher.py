@@ -0,0 +1,320 @@
+"""microbatcher.py
+A decorator which coalesces the calls made within a short window into one call of a batch function.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from asyncio import wrap_future
+from collections.abc import Callable
+from concurrent.futures import Future
+from threading import Condition, Thread
+from time import monotonic
+from typing import Any
+
+# Third-Party Packages #
+
+# Local Packages #
+from ..typing import AnyCallable
+from .basedecorator import BaseDecorator
+
+
+# Definitions #
+# Classes #
+class MicroBatcher(BaseDecorator):
+    """A decorator which coalesces the calls made within a short window into one call of a batch function.
+
+    The wrapped function is the batch function, which takes a list of items and returns a list with a result for each
+    item. Each call of this object gives one item, which waits in a batch until the batch is full or the first item has
+    waited for the max wait. A worker thread then calls the batch function and fans the results back out to the
+    callers. Calls can come from any thread and asyncio tasks can await async_batch_call, which does not block the
+    event loop. If the batch function raises an exception, every call in the batch raises it.
+
+    The batches are not split by the object a call is bound to, so this object cannot be bound as a method. Once this
+    object is shut down, it does not take new items.
+
+    Attributes:
+        max_batch_size: The max number of items in a batch.
+        max_wait: The max number of seconds the first item of a batch waits for more items.
+        pending: The items waiting for a batch and their futures.
+        condition: The condition which guards the pending items and wakes the worker.
+        worker: The thread which calls the batch function.
+        is_running: Determines if the worker should keep running.
+        is_closed: Determines if this object was shut down and does not take new items.
+
+    Args:
+        func: The batch function to wrap.
+        max_batch_size: The max number of items in a batch.
+        max_wait: The max number of seconds the first item of a batch waits for more items.
+        *args: Arguments for inheritance.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    _bind_method: str = "bind_unsupported"
+    _wrapper_method: str = "batch_call"
+
+    max_batch_size: int = 64
+    max_wait: float = 0.001
+
+    pending: list[tuple[Any, Future]]
+    condition: Condition
+    worker: Thread | None = None
+    is_running: bool = False
+    is_closed: bool = False
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        func: AnyCallable | None = None,
+        max_batch_size: int | None = None,
+        max_wait: float | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.pending: list[tuple[Any, Future]] = []
+        self.condition: Condition = Condition()
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(func=func, max_batch_size=max_batch_size, max_wait=max_wait, *args, **kwargs)
+
+    # Pickling
+    def __getstate__(self) -> dict[str, Any]:
+        """Creates a dictionary of attributes which can be used to rebuild this object
+
+        Returns:
+            A dictionary of this object's attributes.
+        """
+        state = super().__getstate__()
+        del state["pending"]
+        del state["condition"]
+        state.pop("worker", None)
+        state.pop("is_running", None)
+        state.pop("is_closed", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Builds this object based on a dictionary of corresponding attributes.
+
+        Args:
+            state: The attributes to build this object from.
+        """
+        super().__setstate__(state)
+        self.pending = []
+        self.condition = Condition()
+
+    # Instance Methods #
+    # Constructors
+    def construct(
+        self,
+        func: AnyCallable | None = None,
+        max_batch_size: int | None = None,
+        max_wait: float | None = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            func: The batch function to wrap.
+            max_batch_size: The max number of items in a batch.
+            max_wait: The max number of seconds the first item of a batch waits for more items.
+            *args: Arguments for inheritance.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+
+        if max_wait is not None:
+            self.max_wait = max_wait
+
+        super().construct(func=func, *args, **kwargs)
+
+    # Binding
+    def bind_unsupported(self, instance: Any = None, owner: type[Any] | None = None) -> "MicroBatcher":
+        """Rejects binding this object to another object, because the batches would mix the calls of the objects.
+
+        Args:
+            instance: The object to bind this object to.
+            owner: The class of the object being bound to.
+
+        Returns:
+            This object if there is no object to bind to.
+
+        Raises:
+            TypeError: If there is an object to bind to.
+        """
+        if instance is None:
+            return self
+        raise TypeError(f"{type(self).__name__} {self.__name__!r} cannot be bound as a method.")
+
+    # Worker
+    def start(self) -> None:
+        """Starts the worker thread if it is not running.
+
+        Raises:
+            RuntimeError: If this object was shut down.
+        """
+        with self.condition:
+            if self.is_closed:
+                raise RuntimeError(f"{type(self).__name__} {self.__name__!r} was shut down.")
+            if not self.is_running:
+                self.is_running = True
+                self.worker = Thread(target=self.run_worker, name=f"MicroBatcher {self.__name__}", daemon=True)
+                self.worker.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stops the worker thread after it evaluates the pending items, after which no new items are taken.
+
+        Args:
+            wait: Determines if this call will wait for the worker to stop.
+        """
+        with self.condition:
+            self.is_closed = True
+            self.is_running = False
+            self.condition.notify_all()
+            worker = self.worker
+            self.worker = None
+
+        if wait and worker is not None:
+            worker.join()
+
+    def run_worker(self) -> None:
+        """Takes batches from the pending items and evaluates them until the worker is stopped."""
+        condition = self.condition
+        while True:
+            with condition:
+                while not self.pending and self.is_running:
+                    condition.wait()
+
+                if not self.pending:
+                    return
+
+                # Wait for the batch to fill until the first item has waited for the max wait.
+                deadline = monotonic() + self.max_wait
+                while self.is_running and len(self.pending) < self.max_batch_size:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0 or not condition.wait(remaining):
+                        break
+
+                batch = self.pending[:self.max_batch_size]
+                del self.pending[:self.max_batch_size]
+
+            self.evaluate_batch(batch)
+
+    def evaluate_batch(self, batch: list[tuple[Any, Future]]) -> None:
+        """Calls the batch function with the items of a batch and sets the results of their futures.
+
+        Args:
+            batch: The items and their futures.
+        """
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        items = [item for item, _ in batch]
+        futures = [future for _, future in batch]
+
+        try:
+            results = self.__wrapped__(items)
+            if len(results) != len(items):
+                raise ValueError(f"The batch function returned {len(results)} results for {len(items)} items.")
+        except BaseException as error:
+            for future in futures:
+                future.set_exception(error)
+        else:
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+    # Calling
+    def submit(self, item: Any) -> Future:
+        """Adds an item to the pending batch.
+
+        Args:
+            item: The item to give to the batch function.
+
+        Returns:
+            The future of the result of the item.
+
+        Raises:
+            RuntimeError: If this object was shut down.
+        """
+        future = Future()
+        with self.condition:
+            if not self.is_running:
+                self.start()
+            self.pending.append((item, future))
+            if len(self.pending) == 1 or len(self.pending) >= self.max_batch_size:
+                self.condition.notify()
+        return future
+
+    def batch_call(self, item: Any) -> Any:
+        """Evaluates an item in a batch and waits for its result.
+
+        Args:
+            item: The item to give to the batch function.
+
+        Returns:
+            The result of the item.
+        """
+        return self.submit(item).result()
+
+    async def async_batch_call(self, item: Any) -> Any:
+        """Evaluates an item in a batch and awaits its result without blocking the event loop.
+
+        Args:
+            item: The item to give to the batch function.
+
+        Returns:
+            The result of the item.
+        """
+        return await wrap_future(self.submit(item))
+
+
+# Functions #
+def micro_batch(
+    max_batch_size: int | None = None,
+    max_wait: float | None = None,
+    call_method: str | None = None,
+) -> Callable[[AnyCallable], MicroBatcher]:
+    """A factory to be used a decorator that sets the parameters of micro batcher factory.
+
+    Args:
+        max_batch_size: The max number of items in a batch.
+        max_wait: The max number of seconds the first item of a batch waits for more items.
+        call_method: The call method to use, such as "async_batch_call" for asyncio callers.
+
+    Returns:
+        The parameterized micro batcher factory.
+    """
+
+    def micro_batch_factory(func: AnyCallable) -> MicroBatcher:
+        """A factory for wrapping a batch function with a MicroBatcher object.
+
+        Args:
+            func: The batch function to wrap with a MicroBatcher.
+
+        Returns:
+            The MicroBatcher object which wraps the given batch function.
+        """
+        batcher = MicroBatcher(func, max_batch_size=max_batch_size, max_wait=max_wait)
+        if call_method is not None:
+            batcher.call_method = call_method
+        return batcher
+
+    return micro_batch_factory
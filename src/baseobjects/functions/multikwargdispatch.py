@@ -0,0 +1,396 @@
+"""multikwargdispatch.py
+A dispatcher which selects an implementation based on the types of several args or kwargs.
+
+The dispatch arguments are named when decorating and can be given either positionally or by name, their positions are
+found from the signature of the decorated function. Registered implementations are resolved to the most specific match
+through the MROs of the argument types and the resolutions are cached by the tuple of argument types.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from abc import get_cache_token
+from functools import update_wrapper
+from inspect import Parameter, signature
+from itertools import product
+from types import UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+# Third-Party Packages #
+
+# Local Packages #
+from ..typing import AnyCallable
+from .dynamiccallable import DynamicMethod
+from .basedecorator import BaseDecorator
+
+
+# Definitions #
+# Classes #
+class multikwargdispatchmethod(DynamicMethod):
+    """A wrapper for a bound multikwargdispatch."""
+
+    # Attributes #
+    _call_method: str = "dispatch_call"
+
+    # Calling
+    def dispatch_call(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the wrapped function's dispatch methods and returns the result.
+
+        Args:
+            *args: The arguments of the wrapped function.
+            **kwargs: The keyword arguments of the wrapped function.
+
+        Returns:
+            The output of the wrapped function.
+        """
+        func = self.__func__
+        instance = self.__self__
+        method = func.dispatch(func.extractor((instance, *args), kwargs))
+        return method.__get__(instance, self.__owner__)(*args, **kwargs)
+
+
+class multikwargdispatch(BaseDecorator):
+    """A dispatcher which selects an implementation based on the types of several args or kwargs.
+
+    The names of the args to dispatch on are given when decorating, otherwise all positional parameters of the decorated
+    function are used. When decorating a method, the instance is the first positional parameter, so the names should be
+    given. The decorated function is the implementation for when no registered implementation matches.
+
+    Implementations are registered either with the types to dispatch on or with annotations on the parameters with
+    the dispatch names, where unions register each combination. A call resolves the most specific implementation whose
+    types the argument types are subclasses of, preferring the closest types in the MROs when implementations are
+    equally specific. The resolutions are cached by the tuple of argument types, so a repeated call is a single dict
+    lookup.
+
+    Attributes:
+        names: The names of the args to dispatch on.
+        registry: The implementations for each tuple of types.
+        dispatch_cache: The implementations resolved for each tuple of argument types.
+        _cache_token: The abc cache token when the dispatch cache was filled or None if no abstract classes are
+            registered.
+        extractor: The function which gets the tuple of classes to dispatch on from the args and kwargs of a call.
+        method_dispatcher: The function which dispatches the correct bound method, which is created once for the
+            wrapped function and bound to each instance it is accessed from.
+
+    Args:
+        *names: The names of the args to dispatch on or the function to wrap.
+        func: The function to wrap.
+        wrapper_method: The name of the method which will act as the wrapper for this decorator.
+        init: Determines if this object will construct.
+        **kwargs: Keyword arguments for inheritance.
+    """
+
+    # Attributes #
+    method_type: type[DynamicMethod] = multikwargdispatchmethod
+    _bind_method: str = "bind_method_dispatcher"
+
+    names: tuple[str, ...] | None = None
+    registry: dict[tuple[type, ...], AnyCallable]
+    dispatch_cache: dict[tuple[type, ...], AnyCallable]
+    _cache_token: object | None = None
+    extractor: AnyCallable | None = None
+    method_dispatcher: AnyCallable | None = None
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        *names: AnyCallable | str,
+        func: AnyCallable | None = None,
+        wrapper_method: str | None = None,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.registry: dict[tuple[type, ...], AnyCallable] = {}
+        self.dispatch_cache: dict[tuple[type, ...], AnyCallable] = {}
+
+        # Parent Attributes #
+        super().__init__(init=False, **kwargs)
+
+        # Object Creation #
+        if init:
+            if names and not isinstance(names[0], str):
+                func, names = names[0], names[1:]
+            self.construct(names=names or None, func=func, wrapper_method=wrapper_method)
+
+    # Pickling
+    def __getstate__(self) -> dict[str, Any]:
+        """Creates a dictionary of attributes which can be used to rebuild this object
+
+        Returns:
+            A dictionary of this object's attributes.
+        """
+        state = super().__getstate__()
+        state["dispatch_cache"] = {}
+        state.pop("extractor", None)
+        state.pop("method_dispatcher", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Builds this object based on a dictionary of corresponding attributes.
+
+        Args:
+            state: The attributes to build this object from.
+        """
+        super().__setstate__(state)
+        if self.__wrapped__ is not None:
+            self.build_extractor()
+            self.build_method_dispatcher()
+
+    # Instance Methods #
+    # Constructors
+    def construct(
+        self,
+        names: tuple[str, ...] | None = None,
+        func: AnyCallable | None = None,
+        *args: Any,
+        wrapper_method: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """The constructor for this object.
+
+        Args:
+            names: The names of the args to dispatch on.
+            func: The function to wrap.
+            *args: Arguments for inheritance.
+            wrapper_method: The name of the method which will act as the wrapper for this decorator.
+            **kwargs: Keyword arguments for inheritance.
+        """
+        if names is not None:
+            self.names = tuple(names)
+
+        super().construct(func=func, *args, wrapper_method=wrapper_method, **kwargs)
+
+        if func is not None:
+            if self.names is None:
+                self.names = tuple(
+                    p.name for p in self.get_parameters(func)
+                    if p.kind in {Parameter.POSITIONAL_OR_KEYWORD, Parameter.POSITIONAL_ONLY}
+                )
+            self.registry[(object,) * len(self.names)] = func
+            self.dispatch_cache.clear()
+            self.build_extractor()
+            self.build_method_dispatcher()
+            self.call_method = "dispatch_call"
+
+    # Argument Extraction
+    @staticmethod
+    def get_parameters(func: AnyCallable) -> list[Parameter]:
+        """Gets the parameters of a function, which can be wrapped by a classmethod or staticmethod.
+
+        Args:
+            func: The function to get the parameters of.
+
+        Returns:
+            The parameters of the function or an empty list if its signature cannot be found.
+        """
+        try:
+            return list(signature(getattr(func, "__func__", func)).parameters.values())
+        except (TypeError, ValueError):
+            return []
+
+    def build_extractor(self) -> None:
+        """Creates the function which gets the tuple of classes to dispatch on from the args and kwargs of a call."""
+        positions = {
+            p.name: i for i, p in enumerate(self.get_parameters(self.__wrapped__))
+            if p.kind in {Parameter.POSITIONAL_OR_KEYWORD, Parameter.POSITIONAL_ONLY}
+        }
+        # Each dispatch arg is found by its position if it was given positionally, otherwise by its name. The tuple is
+        # written out as a single expression, which avoids a loop or generator on every call.
+        items = []
+        for name in self.names:
+            index = positions.get(name, None)
+            if index is None:
+                items.append(f"kwargs.get({name!r}).__class__")
+            else:
+                items.append(f"(args[{index}] if n_args > {index} else kwargs.get({name!r})).__class__")
+
+        namespace = {}
+        exec(
+            f"def extractor(args, kwargs):\n"
+            f"    n_args = len(args)\n"
+            f"    return ({', '.join(items)},)\n",
+            namespace,
+        )
+        self.extractor = namespace["extractor"]
+
+    # Registration
+    def register(self, *types: type | AnyCallable, func: AnyCallable | None = None) -> AnyCallable:
+        """Registers an implementation for a tuple of types.
+
+        Can be used as a decorator with the types, @f.register(int, str), or without types when the implementation's
+        parameters with the dispatch names are annotated. Types not given are treated as object.
+
+        Args:
+            *types: The types to register the implementation for or the implementation with annotated parameters.
+            func: The implementation to register.
+
+        Returns:
+            The registered implementation or a decorator which registers an implementation for the types.
+        """
+        if func is None:
+            if len(types) == 1 and not isinstance(types[0], type) and callable(types[0]):
+                func = types[0]
+                types = self.get_annotated_types(func)
+            else:
+                def register_decorator(func_: AnyCallable) -> AnyCallable:
+                    return self.register(*types, func=func_)
+
+                return register_decorator
+
+        if len(types) > len(self.names):
+            raise TypeError(f"{len(types)} types were given to register, but only {len(self.names)} args dispatch.")
+
+        types = tuple(types) + (object,) * (len(self.names) - len(types))
+        for combination in product(*(self.expand_union(t) for t in types)):
+            self.registry[combination] = func
+
+        self.dispatch_cache.clear()
+        if any(hasattr(t, "__abstractmethods__") for key in self.registry for t in key):
+            self._cache_token = get_cache_token()
+        return func
+
+    def get_annotated_types(self, func: AnyCallable) -> tuple[type, ...]:
+        """Gets the types to dispatch on from the annotations of an implementation's parameters.
+
+        Args:
+            func: The implementation to get the annotated types of.
+
+        Returns:
+            The annotated type of each dispatch arg, which is object if it is not annotated.
+        """
+        unwrapped = getattr(func, "__func__", func)
+        try:
+            annotations = get_type_hints(unwrapped)
+        except (NameError, TypeError):
+            annotations = getattr(unwrapped, "__annotations__", {})
+        return tuple(annotations.get(name, object) for name in self.names)
+
+    @staticmethod
+    def expand_union(type_: Any) -> tuple[type, ...]:
+        """Expands a union into its types.
+
+        Args:
+            type_: The type to expand.
+
+        Returns:
+            The types within the union or the type itself if it is not a union.
+        """
+        if isinstance(type_, UnionType) or get_origin(type_) is Union:
+            return get_args(type_)
+        elif isinstance(type_, type):
+            return (type_,)
+        else:
+            raise TypeError(f"Invalid type to dispatch on: {type_!r}.")
+
+    # Method Dispatching
+    def resolve(self, types: tuple[type, ...]) -> AnyCallable:
+        """Finds the most specific implementation for a tuple of argument types.
+
+        Args:
+            types: The types of the dispatch args.
+
+        Returns:
+            The most specific implementation.
+
+        Raises:
+            TypeError: If there are several equally specific implementations.
+        """
+        matches = [key for key in self.registry if all(map(issubclass, types, key))]
+        # Remove the matches which are less specific than another match.
+        candidates = [
+            key for key in matches
+            if not any(other != key and all(map(issubclass, other, key)) for other in matches)
+        ]
+
+        if len(candidates) > 1:
+            # Prefer the types which are closest in the MROs of the argument types.
+            def mro_distance(key: tuple[type, ...]) -> int:
+                return sum(t.__mro__.index(k) if k in t.__mro__ else len(t.__mro__) for t, k in zip(types, key))
+
+            distances = [mro_distance(key) for key in candidates]
+            closest = min(distances)
+            candidates = [key for key, distance in zip(candidates, distances) if distance == closest]
+            if len(candidates) > 1:
+                raise TypeError(f"Ambiguous dispatch for {types}, the candidates are {candidates}.")
+
+        return self.registry[candidates[0]]
+
+    def dispatch(self, types: tuple[type, ...]) -> AnyCallable:
+        """Gets the implementation for a tuple of argument types, caching the resolution for later calls.
+
+        Args:
+            types: The types of the dispatch args.
+
+        Returns:
+            The implementation for the types.
+        """
+        if self._cache_token is not None and (token := get_cache_token()) != self._cache_token:
+            # An abstract class registered another class, which may change the implementations resolved.
+            self.dispatch_cache.clear()
+            self._cache_token = token
+
+        try:
+            return self.dispatch_cache[types]
+        except KeyError:
+            self.dispatch_cache[types] = method = self.resolve(types)
+            return method
+
+    def dispatch_call(self, *args: Any, **kwargs: Any) -> Any:
+        """Calls the implementation for the types of the dispatch args.
+
+        Args:
+            *args: The arguments to pass to the found implementation.
+            **kwargs: The keyword arguments to pass to the found implementation.
+
+        Returns:
+            The return of the found implementation.
+        """
+        return self.dispatch(self.extractor(args, kwargs))(*args, **kwargs)
+
+    # Binding
+    def build_method_dispatcher(self) -> None:
+        """Creates the function which dispatches the correct bound method based on the input."""
+        if isinstance(self.__wrapped__, staticmethod):
+            def dispatch_function(self_, *args, **kwargs):
+                return self.dispatch(self.extractor(args, kwargs)).__get__(self_)(*args, **kwargs)
+        elif isinstance(self.__wrapped__, classmethod):
+            def dispatch_function(self_, *args, **kwargs):
+                method = self.dispatch(self.extractor((self_, *args), kwargs))
+                return method.__get__(None, self_)(*args, **kwargs)
+        else:
+            def dispatch_function(self_, *args, **kwargs):
+                return self.dispatch(self.extractor((self_, *args), kwargs)).__get__(self_)(*args, **kwargs)
+
+        dispatch_function.__isabstractmethod__ = getattr(self.__wrapped__, "__isabstractmethod__", False)
+        dispatch_function.register = self.register
+        update_wrapper(dispatch_function, self.__wrapped__)
+        if isinstance(self.__wrapped__, classmethod):
+            dispatch_function = classmethod(dispatch_function)
+        self.method_dispatcher = dispatch_function
+
+    def bind_method_dispatcher(self, instance: Any = None, owner: type[Any] | None = None) -> AnyCallable:
+        """Binds the function which dispatches the correct bound method based on the input.
+
+        Args:
+            instance: The object to bind this object to.
+            owner: The class of the object being bound to.
+
+        Returns:
+            A function which dispatches the correct bound method.
+        """
+        if instance is None:
+            return self
+
+        if self.method_dispatcher is None:
+            self.build_method_dispatcher()
+        return self.method_dispatcher.__get__(instance, owner)
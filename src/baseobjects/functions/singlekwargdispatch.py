@@ -17,14 +17,19 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
-from functools import singledispatch, singledispatchmethod, update_wrapper
+from abc import get_cache_token
+from collections.abc import Iterable
+from functools import partial, singledispatch, singledispatchmethod, update_wrapper
+from inspect import Parameter, signature
 from types import NoneType
 from typing import Any
+from weakref import WeakKeyDictionary
 
 # Third-Party Packages #
 
 # Local Packages #
 from ..typing import AnyCallable
+from ..bases import SentinelObject
 from .dynamiccallable import DynamicMethod
 from .basedecorator import BaseDecorator
 from .callablemultiplexer import MethodMultiplexer
@@ -49,10 +54,64 @@ class singlekwargdispatchmethod(DynamicMethod):
         Returns:
             The output of the wrapped function.
         """
-        method = self.__func__.dispatcher.dispatch(self.__func__.parse(*args, **kwargs))
+        func = self.__func__
+        method = func.dispatch(func.method_extractor(args, kwargs))
         return method.__get__(self.__self__, self.__owner__)(*args, **kwargs)
 
 
+class BoundMethodDispatcher(partial):
+    """A method dispatcher bound to an object, which is called like a bound method and can dispatch batches.
+
+    The call is the partial's, so binding and calling costs little more than a builtin bound method. Attributes which
+    this object does not have are gotten from the method dispatcher, like those of a bound method.
+
+    Args:
+        func: The method dispatcher to bind.
+        instance: The object to bind the method dispatcher to, which is the class for a classmethod.
+    """
+
+    __slots__ = ()
+
+    # Properties #
+    @property
+    def __func__(self) -> AnyCallable:
+        """The method dispatcher."""
+        return self.func
+
+    @property
+    def __self__(self) -> Any:
+        """The object the method dispatcher is bound to."""
+        return self.args[0]
+
+    # Magic Methods #
+    # Attribute Access
+    def __getattr__(self, name: str) -> Any:
+        """Gets an attribute of the method dispatcher which this object does not have.
+
+        Args:
+            name: The name of the attribute to get.
+
+        Returns:
+            The attribute of the method dispatcher.
+        """
+        return getattr(self.func, name)
+
+    # Instance Methods #
+    # Method Dispatching
+    def dispatch_many(self, items: Iterable[Any], *args: Any, **kwargs: Any) -> list[Any]:
+        """Calls the implementation bound to the object for each item, grouping the items like dispatch_many.
+
+        Args:
+            items: The items to dispatch on.
+            *args: The other arguments to pass to the implementations.
+            **kwargs: The keyword arguments to pass to the implementations.
+
+        Returns:
+            The results in the order of the items.
+        """
+        return self.func.dispatch_many_method(self.args[0], items, *args, **kwargs)
+
+
 class singlekwargdispatch(BaseDecorator, singledispatchmethod):
     """Extends singledispatch to allow kwargs to be used for dispatching.
 
@@ -60,11 +119,33 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
     allows the first kwarg to be used for dispatching if no args are provided. Furthermore, a kwarg name can be
     specified to have the dispatcher use that kwarg instead of the first kwarg.
 
+    Batches of items can be dispatched with dispatch_many, which groups the items by the implementation for their class
+    and calls each implementation once per group. Implementations registered with register_batch take the list of items
+    in their group and return a list of results, other implementations are called for each item.
+
+    When a kwarg is specified, its position in the signature of the wrapped function is found when the function or
+    kwarg is set, so calls dispatch on that argument whether it is given positionally or by name. The extraction of the
+    class from the arguments is compiled into functions for calls as a function and as a method, and the
+    implementations found for each class are cached, so a dispatching call does not go through the parse multiplexer
+    or the dispatcher's lookup.
+
     Attributes:
         _kwarg: The name of the kwarg to use of parsing the args for the class to use for dispatching.
         _parse_method: The default method for parsing the args for the class to use for dispatching.
         parse: The method for parsing the args for the class to use for dispatching.
-        dispatcher: The single dispatcher to use for this object.
+        dispatcher: The single dispatcher to use for this object, whose register is the register of this object.
+        dispatcher_register: The original register of the single dispatcher.
+        dispatch_cache: The implementations found by the dispatcher for each class, which does not keep the classes.
+        _cache_token: The abc cache token when the dispatch cache was filled or None if no abstract classes are
+            registered.
+        function_extractor: The function which gets the class to dispatch on from the args and kwargs of a call as a
+            function.
+        method_extractor: The function which gets the class to dispatch on from the args and kwargs of a call as a
+            bound method.
+        method_dispatcher: The function which dispatches the correct bound method, which is created once for the
+            wrapped function and bound to each instance it is accessed from.
+        bound_dispatcher_type: The type which binds the method dispatcher to an instance.
+        batch_dispatcher: The single dispatcher for the implementations which take a batch of items.
 
     Args:
         kwarg: Either the name of kwarg to dispatch with or the method to wrap.
@@ -82,6 +163,14 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
     _parse_method: str = "parse_first"
     parse: MethodMultiplexer
     dispatcher: AnyCallable | None = None
+    dispatcher_register: AnyCallable | None = None
+    dispatch_cache: WeakKeyDictionary[type, AnyCallable]
+    _cache_token: object | None = None
+    function_extractor: AnyCallable
+    method_extractor: AnyCallable
+    method_dispatcher: AnyCallable | None = None
+    bound_dispatcher_type: type[BoundMethodDispatcher] = BoundMethodDispatcher
+    batch_dispatcher: AnyCallable | None = None
 
     # Properties #
     @property
@@ -106,6 +195,8 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
     ) -> None:
         # New Attributes #
         self.parse: MethodMultiplexer = MethodMultiplexer(instance=self, select=self._parse_method)
+        self.dispatch_cache: WeakKeyDictionary[type, AnyCallable] = WeakKeyDictionary()
+        self.function_extractor = self.method_extractor = self.create_extractor(None)
 
         # Parent Attributes #
         super().__init__(*args, init=False, **kwargs)
@@ -126,6 +217,10 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
         """
         state = super().__getstate__()
         state["parse"] = (self.parse.register, self.parse.selected)
+        del state["dispatch_cache"]
+        del state["function_extractor"]
+        del state["method_extractor"]
+        state.pop("method_dispatcher", None)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
@@ -135,8 +230,12 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
             state: The attributes to build this object from.
         """
         self.__dict__.update(state)
-        s, r = state["parse"]
+        self.dispatch_cache = WeakKeyDictionary()
+        r, s = state["parse"]
         self.parse = MethodMultiplexer(instance=self, select=s, register=r)
+        self.build_extractors()
+        if self.__wrapped__ is not None:
+            self.build_method_dispatcher()
 
     # Instance Methods #
     # Constructors
@@ -160,10 +259,14 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
             self.kwarg = kwarg
 
         if func is not None:
-            self.dispatcher = singledispatch(func)
+            self.build_dispatcher(func)
 
         super().construct(func=func, *args, **kwargs)
 
+        if func is not None:
+            self.build_extractors()
+            self.build_method_dispatcher()
+
         if self.dispatcher is not None:
             self.call_method = "dispatch_call"
 
@@ -179,6 +282,77 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
         else:
             self.parse.select("parse_kwarg")
         self._kwarg = kwarg
+        self.build_extractors()
+
+    # Argument Extraction
+    def locate_kwarg(self, func: AnyCallable) -> tuple[int | None, bool]:
+        """Finds the position of the dispatch kwarg in the signature of a function.
+
+        Args:
+            func: The function to find the kwarg in.
+
+        Returns:
+            The positional index of the kwarg or None if it cannot be given positionally, and if it was found.
+        """
+        try:
+            parameter_kinds = [(p.name, p.kind) for p in signature(func).parameters.values()]
+        except (TypeError, ValueError):
+            return None, False
+
+        for index, (name, kind) in enumerate(parameter_kinds):
+            if name == self._kwarg:
+                if kind in {Parameter.POSITIONAL_OR_KEYWORD, Parameter.POSITIONAL_ONLY}:
+                    return index, True
+                elif kind == Parameter.KEYWORD_ONLY:
+                    return None, True
+        return None, False
+
+    def create_extractor(self, index: int | None, found: bool = False) -> AnyCallable:
+        """Creates a function which gets the class to dispatch on from the args and kwargs of a call.
+
+        Args:
+            index: The positional index of the dispatch kwarg in the call's args.
+            found: Determines if the dispatch kwarg was found in the signature.
+
+        Returns:
+            The function which gets the class to dispatch on.
+        """
+        kwarg = self._kwarg
+        if kwarg is None:
+            def extractor(args: tuple[Any, ...], kwargs: dict[str, Any]) -> type[Any]:
+                if args:
+                    return args[0].__class__
+                for value in kwargs.values():
+                    return value.__class__
+                return NoneType
+        elif not found or index == 0:
+            def extractor(args: tuple[Any, ...], kwargs: dict[str, Any]) -> type[Any]:
+                return args[0].__class__ if args else kwargs.get(kwarg).__class__
+        elif index is None:
+            def extractor(args: tuple[Any, ...], kwargs: dict[str, Any]) -> type[Any]:
+                return kwargs.get(kwarg).__class__
+        else:
+            def extractor(args: tuple[Any, ...], kwargs: dict[str, Any]) -> type[Any]:
+                return args[index].__class__ if len(args) > index else kwargs.get(kwarg).__class__
+
+        return extractor
+
+    def build_extractors(self) -> None:
+        """Creates the functions which get the class to dispatch on for calls as a function and as a method."""
+        func = self.__wrapped__
+        if func is None or self._kwarg is None:
+            self.function_extractor = self.method_extractor = self.create_extractor(None)
+            return
+
+        is_static = isinstance(func, staticmethod)
+        index, found = self.locate_kwarg(getattr(func, "__func__", func))
+        self.function_extractor = self.create_extractor(index, found)
+        if is_static or index is None:
+            self.method_extractor = self.function_extractor
+        elif index > 0:
+            self.method_extractor = self.create_extractor(index - 1, found)
+        else:
+            self.method_extractor = self.create_extractor(None, False)
 
     # Parameter Parsers
     def parse_first(self, *args: Any, **kwargs: Any) -> type[Any]:
@@ -200,7 +374,7 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
                 return NoneType
 
     def parse_kwarg(self, *args: Any, **kwargs: Any) -> type[Any]:
-        """Parses input for the first arg or a specific kwarg's class to be used for dispatching.
+        """Parses input for a specific kwarg's class, given positionally or by name, to be used for dispatching.
 
         Args:
             *args: The args given to the method.
@@ -209,37 +383,254 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
         Returns:
             The class to be used for dispatching.
         """
-        return args[0].__class__ if args else kwargs.get(self._kwarg, None).__class__
+        return self.function_extractor(args, kwargs)
 
-    # Binding
-    def bind_method_dispatcher(self, instance: Any = None, owner: type[Any] | None = None) -> AnyCallable:
-        """Creates a function which dispatches the correct bound method based on the input.
+    # Registration
+    def build_dispatcher(self, func: AnyCallable) -> None:
+        """Creates the single dispatcher of a function, whose registrations go through register to clear the cache.
 
         Args:
-            instance: The object to bind this object to.
-            owner: The class of the object being bound to.
+            func: The default implementation of the dispatcher.
+        """
+        dispatcher = singledispatch(func)
+        self.dispatcher_register = dispatcher.register
+        dispatcher.register = self.register
+        self.dispatcher = dispatcher
+        self.dispatch_cache.clear()
+
+    def register(self, cls: Any, method: AnyCallable | None = None) -> AnyCallable:
+        """Registers an implementation for a class and clears the dispatch cache.
+
+        Args:
+            cls: The class to register the implementation for or the implementation with an annotated first argument.
+            method: The implementation to register.
 
         Returns:
-            A function which dispatches the correct bound method.
+            The registered implementation or a decorator which registers an implementation for the class.
         """
-        if instance is None:
-            return self
+        registered = self.dispatcher_register(cls, func=method)
+        if method is None and registered is not cls:
+            # The class was given without an implementation, so register the implementation when decorating it.
+            def register_decorator(func: AnyCallable) -> AnyCallable:
+                return self.register(cls, func)
+
+            return register_decorator
+
+        self.dispatch_cache.clear()
+        if any(hasattr(c, "__abstractmethods__") for c in self.dispatcher.registry):
+            self._cache_token = get_cache_token()
+        return registered
+
+    def register_batch(self, cls: type[Any], method: AnyCallable | None = None) -> AnyCallable:
+        """Registers an implementation which takes a list of items of a class and returns a list of their results.
+
+        Batch implementations are only used by dispatch_many, where they take priority over the implementations for
+        single items. They are called with the list of items followed by the other args and kwargs.
+
+        Args:
+            cls: The class to register the batch implementation for.
+            method: The batch implementation to register.
+
+        Returns:
+            The registered batch implementation or a decorator which registers a batch implementation for the class.
+        """
+        if method is None:
+            def register_decorator(func: AnyCallable) -> AnyCallable:
+                return self.register_batch(cls, func)
+
+            return register_decorator
 
+        if self.batch_dispatcher is None:
+            # The default of the batch dispatcher marks that a class has no batch implementation.
+            self.batch_dispatcher = singledispatch(no_batch_sentinel)
+        return self.batch_dispatcher.register(cls, func=method)
+
+    # Method Dispatching
+    def dispatch(self, cls: type[Any]) -> AnyCallable:
+        """Gets the implementation for a class, caching it to bypass the dispatcher on later calls.
+
+        Args:
+            cls: The class to get the implementation for.
+
+        Returns:
+            The implementation for the class.
+        """
+        if self._cache_token is not None and (token := get_cache_token()) != self._cache_token:
+            # An abstract class registered another class, which may change the implementations found.
+            self.dispatch_cache.clear()
+            self._cache_token = token
+
+        try:
+            return self.dispatch_cache[cls]
+        except KeyError:
+            self.dispatch_cache[cls] = method = self.dispatcher.dispatch(cls)
+            return method
+
+    def dispatch_batch(self, cls: type[Any]) -> tuple[AnyCallable, bool]:
+        """Gets the implementation for a class within a batch, which is the batch implementation if there is one.
+
+        Args:
+            cls: The class to get the implementation for.
+
+        Returns:
+            The implementation for the class and if it is a batch implementation.
+        """
+        if self.batch_dispatcher is not None:
+            method = self.batch_dispatcher.dispatch(cls)
+            if method is not no_batch_sentinel:
+                return method, True
+        return self.dispatch(cls), False
+
+    def group_by_implementation(self, items: Iterable[Any]) -> tuple[int, list[tuple[AnyCallable, bool, list, list]]]:
+        """Groups items by the implementation for their class, resolving the implementation once for each class.
+
+        Args:
+            items: The items to group.
+
+        Returns:
+            The number of items and the groups, which contain the implementation, if it is a batch implementation, the
+            indices of the items, and the items.
+        """
+        by_class = {}
+        n_items = 0
+        for n_items, item in enumerate(items, 1):
+            try:
+                indices, class_items = by_class[item.__class__]
+            except KeyError:
+                by_class[item.__class__] = indices, class_items = [], []
+            indices.append(n_items - 1)
+            class_items.append(item)
+
+        groups = {}
+        for cls, (indices, class_items) in by_class.items():
+            method, is_batch = self.dispatch_batch(cls)
+            if (group := groups.get(method, None)) is None:
+                groups[method] = (method, is_batch, indices, class_items)
+            else:
+                group[2].extend(indices)
+                group[3].extend(class_items)
+
+        return n_items, list(groups.values())
+
+    def call_groups(
+        self,
+        n_items: int,
+        groups: list[tuple[AnyCallable, bool, list, list]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[Any]:
+        """Calls each implementation with its group of items and reassembles the results in the order of the items.
+
+        The items are passed as the first argument or as the kwarg if one is set.
+
+        Args:
+            n_items: The number of items.
+            groups: The groups of items with their implementations, the implementations must be bound if required.
+            args: The other arguments to pass to the implementations.
+            kwargs: The keyword arguments to pass to the implementations.
+
+        Returns:
+            The results in the order of the items.
+
+        Raises:
+            ValueError: If a batch implementation does not return a result for each item.
+        """
+        kwarg = self._kwarg
+        results = [None] * n_items
+        for method, is_batch, indices, group_items in groups:
+            if is_batch:
+                if kwarg is None:
+                    group_results = method(group_items, *args, **kwargs)
+                else:
+                    group_results = method(*args, **(kwargs | {kwarg: group_items}))
+
+                if len(group_results) != len(indices):
+                    raise ValueError(
+                        f"The batch implementation {method!r} returned {len(group_results)} results for "
+                        f"{len(indices)} items."
+                    )
+            elif kwarg is None:
+                group_results = [method(item, *args, **kwargs) for item in group_items]
+            else:
+                group_results = [method(*args, **(kwargs | {kwarg: item})) for item in group_items]
+
+            for index, result in zip(indices, group_results):
+                results[index] = result
+
+        return results
+
+    def dispatch_many(self, items: Iterable[Any], *args: Any, **kwargs: Any) -> list[Any]:
+        """Calls the implementation for each item, calling each implementation once for a group of items if possible.
+
+        Args:
+            items: The items to dispatch on, which are passed as the first argument or as the kwarg if one is set.
+            *args: The other arguments to pass to the implementations.
+            **kwargs: The keyword arguments to pass to the implementations.
+
+        Returns:
+            The results in the order of the items.
+        """
+        n_items, groups = self.group_by_implementation(items)
+        return self.call_groups(n_items, groups, args, kwargs)
+
+    def dispatch_many_method(self, instance: Any, items: Iterable[Any], *args: Any, **kwargs: Any) -> list[Any]:
+        """Calls the implementation bound to an instance for each item, grouping the items like dispatch_many.
+
+        Args:
+            instance: The object to bind the implementations to, which is the class for a classmethod.
+            items: The items to dispatch on, which are passed as the first argument after the instance or as the kwarg
+                if one is set.
+            *args: The other arguments to pass to the implementations.
+            **kwargs: The keyword arguments to pass to the implementations.
+
+        Returns:
+            The results in the order of the items.
+        """
+        n_items, groups = self.group_by_implementation(items)
+        if isinstance(self.__wrapped__, classmethod):
+            groups = [(m.__get__(None, instance), is_batch, i, g) for m, is_batch, i, g in groups]
+        else:
+            owner = instance.__class__
+            groups = [(m.__get__(instance, owner), is_batch, i, g) for m, is_batch, i, g in groups]
+        return self.call_groups(n_items, groups, args, kwargs)
+
+    # Binding
+    def build_method_dispatcher(self) -> None:
+        """Creates the function which dispatches the correct bound method based on the input."""
         if isinstance(self.__wrapped__, classmethod):
             def dispatch_function(self_, *args, **kwargs):
-                method = self.dispatcher.dispatch(self.parse(*args, **kwargs))
+                method = self.dispatch(self.method_extractor(args, kwargs))
                 return method.__get__(None, self_)(*args, **kwargs)
         else:
             def dispatch_function(self_, *args, **kwargs):
-                method = self.dispatcher.dispatch(self.parse(*args, **kwargs))
+                method = self.dispatch(self.method_extractor(args, kwargs))
                 return method.__get__(self_)(*args, **kwargs)
 
         dispatch_function.__isabstractmethod__ = getattr(self.__wrapped__, '__isabstractmethod__', False)
         dispatch_function.register = self.register
+        dispatch_function.register_batch = self.register_batch
+        dispatch_function.dispatch_many_method = self.dispatch_many_method
         update_wrapper(dispatch_function, self.__wrapped__)
+        self.method_dispatcher = dispatch_function
+
+    def bind_method_dispatcher(self, instance: Any = None, owner: type[Any] | None = None) -> AnyCallable:
+        """Binds the function which dispatches the correct bound method based on the input.
+
+        Args:
+            instance: The object to bind this object to.
+            owner: The class of the object being bound to.
+
+        Returns:
+            A function which dispatches the correct bound method.
+        """
+        if instance is None:
+            return self
+
+        if self.method_dispatcher is None:
+            self.build_method_dispatcher()
         if isinstance(self.__wrapped__, classmethod):
-            dispatch_function = classmethod(dispatch_function)
-        return dispatch_function.__get__(instance, owner)
+            return self.bound_dispatcher_type(self.method_dispatcher, instance.__class__ if owner is None else owner)
+        return self.bound_dispatcher_type(self.method_dispatcher, instance)
 
     # Method Dispatching
     def dispatch_call(self, *args: Any, **kwargs: Any) -> Any:
@@ -252,4 +643,8 @@ class singlekwargdispatch(BaseDecorator, singledispatchmethod):
         Returns:
             The return of the found method.
         """
-        return self.dispatcher.dispatch(self.parse(*args, **kwargs))(*args, **kwargs)
+        return self.dispatch(self.function_extractor(args, kwargs))(*args, **kwargs)
+
+
+# Names #
+no_batch_sentinel = SentinelObject("no_batch_sentinel")
@@ -19,11 +19,12 @@ from typing import Any
 # Third-Party Packages #
 
 # Local Packages #
-from ..bases import BaseObject
+from ..bases import BaseObject, slotted
 
 
 # Definitions #
 # Classes #
+@slotted
 class VersionType(BaseObject):
     """A dataclass like object that contains a string name and associated class for a version.
 
@@ -17,15 +17,19 @@ __email__ = __email__
 # Standard Libraries #
 import abc
 import copy
+import gc
 import pathlib
 from pstats import Stats, f8, func_std_string
+import time
 import timeit
+import tracemalloc
+from typing import Any
 
 # Third-Party Packages #
 import pytest
 
 # Local Packages #
-from src.baseobjects.bases import BaseObject
+from src.baseobjects.bases import BaseObject, slotted
 
 
 # Definitions #
@@ -36,6 +40,30 @@ def tmp_dir(tmpdir):
     return pathlib.Path(tmpdir)
 
 
+def measure_collections(func, number=100000):
+    """Measures the mean time of a function in μs and the number of garbage collections while it runs.
+
+    Unlike timeit, the garbage collector stays enabled, so the time includes the collections which the garbage of the
+    function causes.
+    """
+    collections = []
+
+    def count(phase, info):
+        if phase == "start":
+            collections.append(info["generation"])
+
+    gc.collect()
+    gc.callbacks.append(count)
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        mean = (time.perf_counter() - start) / number * 1000000
+    finally:
+        gc.callbacks.remove(count)
+    return mean, len(collections)
+
+
 # Classes #
 class StatsMicro(Stats):
     def print_stats(self, *amount):
@@ -142,6 +170,45 @@ class TestBaseObject(ClassPerformanceTest):
         print(f"\nNew speed {mean_new:.3f} μs took {percent:.3f}% of the time of the old function.")
         assert percent < self.speed_tolerance
 
+    def test_slotted_memory(self):
+        # BaseObject instances have a __dict__, so only classes whose bases are all slotted save memory.
+        class NormalNode:
+            previous: Any
+            next: Any
+            data: Any = None
+
+            def __init__(self, data=None):
+                self.previous = self
+                self.next = self
+                self.data = data
+
+        @slotted
+        class SlottedNode:
+            previous: Any
+            next: Any
+            data: Any = None
+
+            def __init__(self, data=None):
+                self.previous = self
+                self.next = self
+                self.data = data
+
+        def measure(class_, number=100000):
+            tracemalloc.start()
+            start = tracemalloc.take_snapshot()
+            nodes = [class_(i) for i in range(number)]
+            size = sum(s.size_diff for s in tracemalloc.take_snapshot().compare_to(start, "filename"))
+            tracemalloc.stop()
+            del nodes
+            return size / number
+
+        size_new = measure(SlottedNode)
+        size_old = measure(NormalNode)
+        percent = (size_new / size_old) * 100
+
+        print(f"\nSlotted object {size_new:.1f} bytes took {percent:.3f}% of the memory of an object with a __dict__.")
+        assert size_new < size_old
+
 
 # Main #
 if __name__ == "__main__":
@@ -29,7 +29,8 @@ import pytest
 
 # Local Packages #
 from src.baseobjects.cachingtools import *
-from .bases_performance import ClassPerformanceTest, StatsMicro
+from src.baseobjects.bases import ObjectPool
+from .bases_performance import ClassPerformanceTest, StatsMicro, measure_collections
 
 
 # Definitions #
@@ -55,6 +56,10 @@ class TestCachingObject(ClassPerformanceTest):
         def get_proxy(self):
             return [i for i in range(77)]
 
+        @timed_cached_property(lifetime=2)
+        def timed_property(self):
+            return [i for i in range(77)]
+
         def normal(self):
             return [i for i in range(77)]
 
@@ -122,6 +127,34 @@ class TestCachingObject(ClassPerformanceTest):
         )
         assert percent < self.speed_tolerance
 
+    def test_lru_churn_gc_pressure(self):
+        @timed_lru_cache(maxsize=128, lifetime=None)
+        def pooled(number):
+            return number * 2
+
+        @timed_lru_cache(maxsize=128, lifetime=None)
+        def created(number):
+            return number * 2
+
+        pooled.set_item_pool(ObjectPool(CacheItem))
+        numbers = iter(range(100000000))
+
+        def new_eval():
+            pooled(next(numbers))
+
+        def old_eval():
+            created(next(numbers))
+
+        mean_new, collections_new = measure_collections(new_eval)
+        mean_old, collections_old = measure_collections(old_eval)
+        percent = (mean_new / mean_old) * 100
+
+        print(
+            f"\nPooled eviction {mean_new:.3f} μs with {collections_new} collections took {percent:.3f}% of the time "
+            f"of new items with {collections_old} collections."
+        )
+        assert collections_new <= collections_old
+
     def test_cached_profile(self):
         cacher = TestCachingObject.CachingTestObject()
         cacher.proxy
@@ -138,6 +171,45 @@ class TestCachingObject(ClassPerformanceTest):
         ps.print_stats()
         print(s.getvalue())
 
+    def test_cached_property_speed(self):
+        cacher = TestCachingObject.CachingTestObject()
+
+        cacher.proxy
+        cacher.timed_property
+
+        def new_eval():
+            cacher.timed_property
+
+        def old_eval():
+            cacher.proxy
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        new_c_units = mean_new / self.call_speed
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        percent = (mean_new / mean_old) * 100
+
+        print(
+            f"\nNew speed {new_c_units:.3f} cu or {mean_new:.3f} μs took {percent:.3f}% of the time of the keyless "
+            f"cache."
+        )
+        assert percent < 100
+
+    def test_cached_property_profile(self):
+        cacher = TestCachingObject.CachingTestObject()
+        cacher.timed_property
+
+        pr = cProfile.Profile()
+        pr.enable()
+
+        cacher.timed_property
+
+        pr.disable()
+        s = io.StringIO()
+        sortby = pstats.SortKey.TIME
+        ps = StatsMicro(pr, stream=s).sort_stats(sortby)
+        ps.print_stats()
+        print(s.getvalue())
+
     def test_functool_bypass_speed(self):
         x = 1
 
@@ -16,6 +16,7 @@ __email__ = __email__
 # Imports #
 # Standard Libraries #
 
+import asyncio
 import cProfile
 import datetime
 import functools
@@ -29,8 +30,10 @@ import pytest
 
 # Local Packages #
 from src.baseobjects import BaseFunction
+from src.baseobjects.bases import ObjectPool
 from src.baseobjects.functions import *
-from .bases_performance import PerformanceTest, StatsMicro
+from src.baseobjects.functions.methodregister import BoundMethodRegister
+from .bases_performance import PerformanceTest, StatsMicro, measure_collections
 
 
 # Definitions #
@@ -81,6 +84,348 @@ class TestFunctions(PerformanceTest):
         print(f"\nDynamicFunction Overhead {new_c_units:.3f} cu or {overhead:.3f} μs.")
         assert True
 
+    def test_as_function_overhead(self):
+
+        def some_function(a, b=1):
+            return "10".find("1")
+
+        wapper = DynamicFunction(some_function)
+        generic_function = wapper.as_function()
+        exact_function = wapper.as_function(exact=True)
+
+        def new_eval():
+            exact_function(1)
+
+        def old_eval():
+            generic_function(1)
+
+        def raw_eval():
+            some_function(1)
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_raw = timeit.timeit(raw_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        exact_overhead = mean_new - mean_raw
+        generic_overhead = mean_old - mean_raw
+
+        print(
+            f"\nExact as_function Overhead {exact_overhead / self.call_speed:.3f} cu or {exact_overhead:.3f} μs, "
+            f"generic {generic_overhead / self.call_speed:.3f} cu or {generic_overhead:.3f} μs."
+        )
+        assert True
+
+    def test_callprofiler_overhead(self):
+
+        def some_function():
+            return "10".find("1")
+
+        profiler = CallProfiler(some_function)
+        disabled = CallProfiler(some_function, enabled=False)
+
+        def new_eval():
+            profiler()
+
+        def old_eval():
+            disabled()
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        overhead = mean_new - mean_old
+        new_c_units = overhead / self.call_speed
+
+        print(f"\nCallProfiler Overhead {new_c_units:.3f} cu or {overhead:.3f} μs over the disabled profiler.")
+        assert True
+
+    def test_callinstrumenter_overhead(self):
+
+        def some_function():
+            return "10".find("1")
+
+        wapper = DynamicFunction(some_function)
+        instrumenter = CallInstrumenter()
+
+        def new_eval():
+            wapper()
+
+        mean_disabled = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        instrumenter.enable()
+        try:
+            mean_enabled = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        finally:
+            instrumenter.disable()
+        overhead = mean_enabled - mean_disabled
+        new_c_units = overhead / self.call_speed
+
+        print(f"\nCallInstrumenter Enabled Overhead {new_c_units:.3f} cu or {overhead:.3f} μs.")
+        assert DynamicFunction.__call__ is DynamicCallable.__call__
+
+    def test_functionregister_update_speed(self):
+        some_object = DynamicFunction(lambda: None)
+        runs = 10000
+
+        def old_eval():
+            data = {}
+            for name in set(dir(some_object)) | set(vars(some_object).keys()):
+                attr = getattr(some_object, name, None)
+                func = None if attr is None or not callable(attr) else getattr(attr, "__func__", attr)
+                if func is not None:
+                    data[name] = func
+
+        def new_eval():
+            FunctionRegister().update_from_object(some_object)
+
+        def lazy_eval():
+            FunctionRegister(object_=some_object, lazy=True)["call"]
+
+        mean_new = timeit.timeit(new_eval, number=runs) / runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=runs) / runs * 1000000
+        mean_lazy = timeit.timeit(lazy_eval, number=runs) / runs * 1000000
+
+        print(
+            f"\nFunctionRegister update_from_object {mean_new:.3f} μs, lazy single lookup {mean_lazy:.3f} μs, "
+            f"uncached scan {mean_old:.3f} μs."
+        )
+        assert mean_new < mean_old
+
+    def test_methodregister_access_speed(self):
+
+        class SomeObject:
+            register = MethodRegister(methods={"some_function": len})
+
+        some_object = SomeObject()
+        register = SomeObject.__dict__["register"]
+
+        def new_eval():
+            some_object.register["some_function"]
+
+        def old_eval():
+            BoundMethodRegister(register=register, instance=some_object, owner=SomeObject)["some_function"]
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        percent = (mean_new / mean_old) * 100
+
+        print(f"\nMethodRegister Access {mean_new:.3f} μs took {percent:.3f}% of the time of an uncached binding.")
+        assert mean_new < mean_old
+
+    def test_asyncdynamicfunction_overhead(self):
+
+        async def some_function():
+            return "10".find("1")
+
+        wapper = AsyncDynamicFunction(some_function)
+        runs = 100000
+
+        async def new_eval():
+            for _ in range(runs):
+                await wapper()
+
+        async def old_eval():
+            for _ in range(runs):
+                await some_function()
+
+        mean_new = timeit.timeit(lambda: asyncio.run(new_eval()), number=1) / runs * 1000000
+        mean_old = timeit.timeit(lambda: asyncio.run(old_eval()), number=1) / runs * 1000000
+        overhead = mean_new - mean_old
+        new_c_units = overhead / self.call_speed
+
+        print(f"\nAsyncDynamicFunction Overhead {new_c_units:.3f} cu or {overhead:.3f} μs.")
+        assert True
+
+    def test_callpipeline_speed(self):
+
+        def parse(record):
+            return int(record)
+
+        def scale(record):
+            return record * 2
+
+        def shift(record):
+            return record + 1
+
+        stages = [DynamicFunction(parse), DynamicFunction(scale), DynamicFunction(shift)]
+        pipeline = CallPipeline(stages)
+        records = [str(i) for i in range(1000)]
+        runs = self.timeit_runs // 1000
+
+        def new_eval():
+            pipeline.call_batch(records)
+
+        def old_eval():
+            [stages[2](stages[1](stages[0](record))) for record in records]
+
+        def raw_eval():
+            [shift(scale(parse(record))) for record in records]
+
+        mean_new = timeit.timeit(new_eval, number=runs) / runs / len(records) * 1000000
+        mean_old = timeit.timeit(old_eval, number=runs) / runs / len(records) * 1000000
+        mean_raw = timeit.timeit(raw_eval, number=runs) / runs / len(records) * 1000000
+        fused_overhead = mean_new - mean_raw
+        chained_overhead = mean_old - mean_raw
+
+        print(
+            f"\nCallPipeline Overhead {fused_overhead / self.call_speed:.3f} cu or {fused_overhead:.3f} μs, "
+            f"chained per record {chained_overhead / self.call_speed:.3f} cu or {chained_overhead:.3f} μs."
+        )
+        assert mean_new < mean_old
+
+    def test_pooled_method_gc_pressure(self):
+        class Example:
+            @DynamicFunction
+            def method(self):
+                return self
+
+        function = Example.method
+        pool = ObjectPool(DynamicMethod)
+        example = Example()
+
+        def new_eval():
+            method = pool.acquire(func=function, instance=example)
+            method()
+            pool.release(method)
+
+        def old_eval():
+            example.method()
+
+        mean_new, collections_new = measure_collections(new_eval)
+        mean_old, collections_old = measure_collections(old_eval)
+        percent = (mean_new / mean_old) * 100
+
+        print(
+            f"\nPooled binding {mean_new:.3f} μs with {collections_new} collections took {percent:.3f}% of the time "
+            f"of a new binding with {collections_old} collections."
+        )
+        assert collections_new < collections_old
+
+    def test_methodmultiplexer_overhead(self):
+
+        class SomeObject:
+            def some_method(self):
+                return "10".find("1")
+
+        some_object = SomeObject()
+        multiplexer = MethodMultiplexer(instance=some_object, select="some_method")
+        bound_method = some_object.some_method
+
+        def new_eval():
+            multiplexer()
+
+        def old_eval():
+            bound_method()
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        overhead = mean_new - mean_old
+        new_c_units = overhead / self.call_speed
+
+        print(f"\nMethodMultiplexer Overhead {new_c_units:.3f} cu or {overhead:.3f} μs.")
+        assert True
+
+    def test_dynamicfunction_call_method_overhead(self):
+
+        def some_function():
+            return "10".find("1")
+
+        wapper = DynamicFunction(some_function)
+        wapper.call_method = "call"
+
+        def new_eval():
+            wapper()
+
+        def old_eval():
+            wapper.call()
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        overhead = mean_new - mean_old
+        new_c_units = overhead / self.call_speed
+
+        print(f"\nDynamicFunction Call Method Dispatch Overhead {new_c_units:.3f} cu or {overhead:.3f} μs.")
+        assert True
+
+    def test_singlekwargdispatch_overhead(self):
+
+        @singlekwargdispatch("a")
+        def some_function(a=None):
+            return None
+
+        @some_function.register
+        def _(a: str):
+            return "10".find(a)
+
+        def direct_function(a):
+            return "10".find(a)
+
+        def new_eval():
+            some_function(a="1")
+
+        def old_eval():
+            direct_function(a="1")
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        overhead = mean_new - mean_old
+        new_c_units = overhead / self.call_speed
+
+        print(f"\nsinglekwargdispatch Overhead {new_c_units:.3f} cu or {overhead:.3f} μs.")
+        assert True
+
+    def test_dispatch_many_speed(self):
+
+        @singlekwargdispatch
+        def some_function(a=None):
+            return None
+
+        @some_function.register
+        def _(a: str):
+            return a.find("1")
+
+        @some_function.register_batch(int)
+        def _(items):
+            return [i + 1 for i in items]
+
+        items = [str(i) if i % 2 else i for i in range(10000)]
+        runs = self.timeit_runs // 100000
+
+        def new_eval():
+            some_function.dispatch_many(items)
+
+        def old_eval():
+            [some_function(item) for item in items]
+
+        mean_new = timeit.timeit(new_eval, number=runs) / runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=runs) / runs * 1000000
+
+        print(f"\ndispatch_many of {len(items)} items {mean_new:.3f} μs vs per item dispatch {mean_old:.3f} μs.")
+        assert True
+
+    def test_multikwargdispatch_overhead(self):
+
+        @multikwargdispatch("a", "b")
+        def some_function(a=None, b=None):
+            return None
+
+        @some_function.register
+        def _(a: str, b: str):
+            return a.find(b)
+
+        def direct_function(a, b):
+            return a.find(b)
+
+        def new_eval():
+            some_function("10", b="1")
+
+        def old_eval():
+            direct_function("10", b="1")
+
+        mean_new = timeit.timeit(new_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        mean_old = timeit.timeit(old_eval, number=self.timeit_runs) / self.timeit_runs * 1000000
+        overhead = mean_new - mean_old
+        new_c_units = overhead / self.call_speed
+
+        print(f"\nmultikwargdispatch Overhead {new_c_units:.3f} cu or {overhead:.3f} μs.")
+        assert True
+
     @pytest.mark.skipif(not profiling, reason="not profiling")
     def test_basefunction_profile(self):
         def some_function():
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_asyncdynamiccallable.py
+Tests AsyncDynamicFunction and AsyncBaseDecorator
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import asyncio
+import threading
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import AsyncBaseDecorator, AsyncDynamicFunction, AsyncDynamicMethod
+
+
+# Definitions #
+# Functions #
+async def identity(x):
+    return x
+
+
+def thread_name():
+    return threading.current_thread().name
+
+
+# Classes #
+class TestAsyncDynamicFunction:
+    class Example:
+        @AsyncDynamicFunction
+        async def value(self, x):
+            return self, x
+
+        @AsyncBaseDecorator(offload=True)
+        def offloaded(self):
+            return threading.current_thread().name
+
+    def test_coroutine_function(self):
+        function = AsyncDynamicFunction(identity)
+        assert asyncio.iscoroutinefunction(function)
+        assert function.call_method == "call"
+        assert asyncio.run(function(1)) == 1
+
+    def test_sync_function(self):
+        function = AsyncDynamicFunction(thread_name)
+        assert asyncio.iscoroutinefunction(function)
+        assert function.call_method == "inline_call"
+        assert asyncio.run(function()) == threading.current_thread().name
+
+    def test_offload(self):
+        function = AsyncDynamicFunction(thread_name, offload=True)
+        assert function.call_method == "thread_call"
+        assert asyncio.run(function()) != threading.current_thread().name
+
+        function.call_method = "executor_call"
+        try:
+            assert asyncio.run(function()) != threading.current_thread().name
+        finally:
+            function.shutdown_executor()
+
+    def test_method(self):
+        example = self.Example()
+        assert isinstance(example.value, AsyncDynamicMethod)
+        assert asyncio.run(example.value(2)) == (example, 2)
+
+    def test_decorator(self):
+        example = self.Example()
+        assert isinstance(self.Example.offloaded, AsyncBaseDecorator)
+        assert asyncio.iscoroutinefunction(self.Example.offloaded)
+        assert asyncio.run(example.offloaded()) != threading.current_thread().name
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
@@ -16,7 +16,13 @@ __email__ = __email__
 # Imports #
 # Standard Libraries #
 import abc
+import asyncio
+import copy
+import inspect
 import pathlib
+import pickle
+from typing import Any, ClassVar
+import weakref
 
 # Third-Party Packages #
 import pytest
@@ -97,6 +103,188 @@ class TestBaseObject(BaseBaseObjectTest):
         assert id(new.immutable) == id(test_object.immutable)
         assert id(new.mutable) != id(test_object.mutable)
 
+    def test_deepcopy_cycle(self, test_object):
+        test_object.mutable["self"] = test_object
+        new = test_object.deepcopy()
+        assert new.mutable["self"] is new
+
+    def test_copy_slots(self):
+        class SlotObject(BaseObject):
+            __slots__ = ("__private", "public", "unset")
+
+            def __init__(self):
+                self.__private = [1]
+                self.public = [2]
+                self.attribute = [3]
+
+            def get_private(self):
+                return self.__private
+
+        test_object = SlotObject()
+        new = copy.copy(test_object)
+        assert new.get_private() is test_object.get_private()
+        assert new.public is test_object.public and new.attribute is test_object.attribute
+        assert not hasattr(new, "unset")
+
+        new = copy.deepcopy(test_object)
+        assert new.get_private() == [1] and new.get_private() is not test_object.get_private()
+        assert new.public == [2] and new.attribute == [3] and new.attribute is not test_object.attribute
+
+    def test_copy_state(self):
+        class StateObject(BaseObject):
+            def __init__(self):
+                self.kept = [1]
+                self.dropped = [2]
+
+            def __getstate__(self):
+                state = super().__getstate__()
+                del state["dropped"]
+                return state
+
+            def __setstate__(self, state):
+                super().__setstate__(state)
+                self.dropped = None
+
+        test_object = StateObject()
+        new = test_object.copy()
+        assert new.kept is test_object.kept and new.dropped is None
+        new = test_object.deepcopy()
+        assert new.kept == [1] and new.kept is not test_object.kept and new.dropped is None
+
+
+# Slotted
+class TestSlotted:
+    @slotted
+    class SlottedObject:
+        count: ClassVar[int] = 0
+        name: str
+        items: list
+        data: Any = None
+
+        def __init__(self, name="", items=None, data=None):
+            super().__init__()
+            self.name = name
+            self.items = [] if items is None else items
+            if data is not None:
+                self.data = data
+
+        @property
+        def size(self):
+            return len(self.items)
+
+    def test_slots(self):
+        class_ = self.SlottedObject
+        assert class_.__slots__ == ("name", "items", "data", "__weakref__")
+        assert class_.count == 0
+        test_object = class_("a", [1])
+        assert not hasattr(test_object, "__dict__")
+        assert test_object.data is None and test_object.size == 1
+        assert weakref.ref(test_object)() is test_object
+        with pytest.raises(AttributeError):
+            test_object.other = 1
+
+    def test_pickle(self):
+        test_object = self.SlottedObject("a", [1], data=2)
+        new = pickle.loads(pickle.dumps(test_object))
+        assert (new.name, new.items, new.data) == ("a", [1], 2)
+        new = copy.deepcopy(test_object)
+        assert new.items == [1] and new.items is not test_object.items
+
+    def test_subclass(self):
+        @slotted
+        class SlottedChild(self.SlottedObject):
+            extra: int = 1
+
+        class DictChild(self.SlottedObject):
+            pass
+
+        child = SlottedChild("a")
+        assert SlottedChild.__slots__ == ("extra",)
+        assert (child.name, child.data, child.extra) == ("a", None, 1)
+        assert not hasattr(child, "__dict__")
+
+        child = DictChild()
+        child.other = 1
+        assert child.other == 1 and child.data is None
+
+    def test_inherited_default(self):
+        @slotted
+        class SlottedChild(self.SlottedObject):
+            data: int = 0
+            items: list
+
+        assert SlottedChild.__slots__ == ()
+        assert SlottedChild("a").data == 0 and SlottedChild("a", data=1).data == 1
+        assert self.SlottedObject("a").data is None
+
+    def test_base_object(self):
+        @slotted
+        class SlottedBase(BaseObject):
+            name: str = ""
+
+        assert SlottedBase.__slots__ == ("name",)
+        test_object = SlottedBase()
+        test_object.name = "a"
+        test_object.other = 1
+        assert weakref.ref(test_object)() is test_object
+        assert test_object.__getstate__() == {"other": 1, "name": "a"}
+        new = test_object.deepcopy()
+        assert (new.name, new.other) == ("a", 1)
+
+    def test_defaults(self):
+        class Uninitialized(self.SlottedObject):
+            def __init__(self):
+                pass
+
+        assert Uninitialized().data is None
+        assert not hasattr(Uninitialized(), "name")
+        assert Uninitialized.__new__ is self.SlottedObject.__new__
+
+    def test_existing_slots(self):
+        with pytest.raises(TypeError):
+            slotted(type("Slots", (BaseObject,), {"__slots__": ()}))
+
+
+# Object Pool
+class TestObjectPool:
+    class PooledObject(BaseObject):
+        def __init__(self, data=None, *args, init=True, **kwargs):
+            self.data = None
+            super().__init__(*args, init=False, **kwargs)
+            if init:
+                self.construct(data=data)
+
+        def construct(self, data=None, *args, **kwargs):
+            self.data = data
+            super().construct(*args, **kwargs)
+
+        def reset(self):
+            self.data = None
+
+    def test_acquire_release(self):
+        pool = ObjectPool(self.PooledObject, max_size=1)
+        first = pool.acquire([1])
+        second = pool.acquire(data=[2])
+        assert first is not second and (first.data, second.data) == ([1], [2])
+
+        assert pool.release(first) and first.data is None
+        assert not pool.release(second) and len(pool) == 1
+        assert pool.acquire([3]) is first and first.data == [3]
+        assert len(pool) == 0
+
+    def test_exact_type(self):
+        pool = ObjectPool(self.PooledObject)
+        assert not pool.release(type("Child", (self.PooledObject,), {})())
+        assert not pool.release(BaseObject())
+        assert len(pool) == 0
+
+    def test_pickle_clear(self):
+        pool = ObjectPool(self.PooledObject)
+        pool.release(self.PooledObject())
+        assert len(pickle.loads(pickle.dumps(pool))) == 0
+        pool.clear()
+        assert len(pool) == 0
+
 
 # Base Function
 class TestBaseFunction(BaseBaseObjectTest):
@@ -132,6 +320,55 @@ class TestBaseFunction(BaseBaseObjectTest):
         generate_function.bind_to_attribute(instance=obj)
         assert isinstance(obj.generic, BaseMethod)
 
+    def test_metadata(self):
+        def generic(*args, **kwargs):
+            """A generic function."""
+            return args[0]
+
+        generic.extra = 1
+        function = self.class_(func=generic)
+        assert function.__doc__ == generic.__doc__
+        assert function.__qualname__ == generic.__qualname__
+        assert function.__module__ == generic.__module__
+        assert function.extra == 1
+        generic.extra = 2
+        assert function.extra == 2
+        with pytest.raises(AttributeError):
+            function.missing
+
+    def test_exact_function(self):
+        def generic(a, b=2, /, c=3, *args, d, e=5, **kwargs):
+            return a, b, c, args, d, e, kwargs
+
+        function = self.class_(func=generic)
+        exact = function.as_function(exact=True)
+        assert exact.__code__.co_varnames == generic.__code__.co_varnames
+        assert inspect.signature(exact) == inspect.signature(generic)
+        assert exact(1, 2, 3, 4, d=4, f=6) == generic(1, 2, 3, 4, d=4, f=6)
+        assert exact.__wrapped__ is function
+
+    def test_exact_method(self):
+        def generic(self, a, *, b=1):
+            return self, a, b
+
+        obj = BaseObject()
+        exact = self.class_(func=generic).bind(instance=obj).as_function(exact=True)
+        assert list(inspect.signature(exact).parameters) == ["a", "b"]
+        assert exact(2) == (obj, 2, 1)
+
+    def test_exact_coroutine(self):
+        async def generic(a):
+            return a
+
+        exact = self.class_(func=generic).as_function(exact=True)
+        assert asyncio.iscoroutinefunction(exact)
+        assert asyncio.run(exact(1)) == 1
+
+    def test_exact_fallback(self):
+        exact = self.class_(func=dict).as_function(exact=True)
+        assert exact.__code__.co_varnames == ("args", "kwargs")
+        assert exact(a=1) == {"a": 1}
+
 
 # Base Method
 class TestBaseMethod(BaseBaseObjectTest):
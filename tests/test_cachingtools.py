@@ -23,6 +23,7 @@ import time
 import pytest
 
 # Local Packages #
+from src.baseobjects.bases import ObjectPool
 from src.baseobjects.cachingtools import *
 from .test_bases import ClassTest
 
@@ -46,6 +47,10 @@ class TestCachingObject(ClassTest):
         def get_proxy(self):
             return datetime.datetime.now()
 
+        @timed_cached_property(lifetime=1)
+        def timed_property(self):
+            return datetime.datetime.now()
+
         def normal(self):
             return datetime.datetime.now()
 
@@ -83,6 +88,218 @@ class TestCachingObject(ClassTest):
 
         assert n == 2
 
+    def test_lru_cache_eviction(self):
+        calls = []
+
+        @timed_lru_cache(maxsize=2)
+        def double(number):
+            calls.append(number)
+            return number * 2
+
+        for number in (0, 1, 0, 2, 0, 1):
+            double(number)
+
+        assert calls == [0, 1, 2, 1]
+        assert set(double.cache_container) == {0, 1}
+
+    def test_lru_cache_pool(self):
+        @timed_lru_cache(maxsize=2)
+        def double(number):
+            return number * 2
+
+        assert double.item_pool is None and double.cache_item_type is CacheItem
+        double.set_item_pool(ObjectPool(CacheItem))
+        double(0)
+        double(1)
+        reused = id(double.cache_container[1])
+        for number in range(2, 6):
+            double(number)
+
+        # The evicted items are released to the pool and reused for new results.
+        assert reused in map(id, double.cache_container.values())
+        assert [double(number) for number in (4, 5)] == [8, 10]
+
+        double.remove_item(5)
+        assert len(double.item_pool) == 1
+        assert 5 not in double.cache_container and double(5) == 10
+        assert len(double.item_pool) == 0 and len(double.priority) == 2
+
+    def test_tiered_cache(self):
+        calls = []
+        second_tier = {}
+
+        @timed_tiered_cache(maxsize=2, second_tier=second_tier, tier_key=repr)
+        def double(number):
+            calls.append(number)
+            return number * 2
+
+        for number in (0, 1, 2, 3):
+            double(number)
+
+        assert second_tier == {"0": 0, "1": 2}
+        assert double(0) == 0
+        assert double(1) == 2
+        assert calls == [0, 1, 2, 3]
+        assert set(double.cache_container) == {0, 1}
+        assert second_tier == {"2": 4, "3": 6}
+
+        # A given second tier can be shared, so only the results this cache demoted are cleared.
+        second_tier["other"] = 1
+        double.clear_cache()
+        assert not double.cache_container and second_tier == {"other": 1}
+        assert double(2) == 4 and calls == [0, 1, 2, 3, 2]
+
+        @timed_tiered_cache(maxsize=1, cache_exceptions=(KeyError,))
+        def get_item(key):
+            calls.append(key)
+            if key < 0:
+                raise KeyError(key)
+            return key
+
+        assert [get_item(0), get_item(1), get_item(0)] == [0, 1, 0]
+        assert get_item.second_tier == {1: 1}
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                get_item(-1)
+        assert calls[5:] == [0, 1, -1]
+
+        get_item.clear_cache()
+        assert not get_item.second_tier
+
+    def test_tiered_lifetime(self):
+        calls = []
+        second_tier = {}
+
+        @timed_tiered_cache(maxsize=1, second_tier=second_tier, lifetime=0.5)
+        def double(number):
+            calls.append(number)
+            return number * 2
+
+        double(0)
+        double(1)
+        assert second_tier == {0: 0}
+        time.sleep(0.6)
+
+        # The demoted result is older than the lifetime, so it is evaluated again rather than promoted.
+        assert double(0) == 0 and calls == [0, 1, 0]
+
+    def test_compression(self):
+        @timed_lru_cache(maxsize=4, compression="zlib", compression_threshold=100)
+        def repeat(number):
+            return "abc" * number
+
+        assert repeat(1) == repeat(1) == "abc"
+        assert repeat(1000) == repeat(1000) == "abc" * 1000
+        assert isinstance(repeat.cache_container[1000].payload, bytes)
+
+        stats = repeat.compressor.get_stats()
+        assert stats["compressions"] == 1
+        assert stats["decompressions"] == 1
+        assert stats["compressed_size"] < stats["raw_size"] == 3000
+
+    def test_compression_surrogates(self):
+        @timed_lru_cache(maxsize=4, compression="zlib", compression_threshold=100)
+        def repeat(number):
+            return "\ud800" * number
+
+        assert repeat(1000) == repeat(1000) == "\ud800" * 1000
+        assert isinstance(repeat.cache_container[1000].payload, bytes)
+
+        # An uncompressed result stays in the result slot of the base item rather than in the payload.
+        assert repeat(1) == repeat(1) == "\ud800"
+        assert repeat.cache_container[1].payload is None
+        assert "payload" in type(repeat.cache_container[1]).__slots__
+
+    def test_compression_shared(self):
+        class Repeater:
+            @timed_lru_cache(maxsize=4, compression="zlib", compression_threshold=100, local=True)
+            def repeat(self, number):
+                return "abc" * number
+
+        first, second = Repeater(), Repeater()
+        assert first.repeat(1000) == second.repeat(1000) == "abc" * 1000
+
+        # Every binding shares the compressor of the function, so the statistics are not split.
+        compressor = Repeater.__dict__["repeat"].compressor
+        assert first.repeat.compressor is compressor and second.repeat.compressor is compressor
+        assert compressor.get_stats()["compressions"] == 2
+
+        with pytest.raises(ValueError) as error:
+            compressor.set_codec("missing")
+        assert error.value.__cause__ is None and error.value.__suppress_context__
+
+    def test_tiered_compression(self):
+        second_tier = {}
+
+        @timed_tiered_cache(maxsize=1, second_tier=second_tier, compression="zlib", compression_threshold=100)
+        def repeat(number):
+            return "abc" * number
+
+        repeat(1000)
+        repeat(1)
+        assert repeat.compressor.get_stats()["decompressions"] == 0
+        assert isinstance(second_tier[1000].payload, bytes)
+
+        assert repeat(1000) == "abc" * 1000
+        assert repeat.compressor.get_stats()["decompressions"] == 1
+        assert second_tier == {1: "abc"}
+
+    def test_replay(self):
+        pulled = []
+
+        @timed_cache(local=False, replay=True)
+        def count(number):
+            for i in range(number):
+                pulled.append(i)
+                yield i
+
+        first = iter(count(4))
+        assert next(first) == 0
+        assert pulled == [0]
+
+        assert list(count(4)) == [0, 1, 2, 3]
+        assert list(first) == [1, 2, 3]
+        assert list(count(4)) == [0, 1, 2, 3]
+        assert pulled == [0, 1, 2, 3]
+
+    def test_replay_exception(self):
+        @timed_cache(local=False, replay=True)
+        def count(number):
+            for i in range(number):
+                if i == 2:
+                    raise ValueError(i)
+                yield i
+
+        for _ in range(2):
+            replayed = []
+            with pytest.raises(ValueError):
+                for i in count(4):
+                    replayed.append(i)
+            assert replayed == [0, 1]
+
+    def test_replay_interrupt(self):
+        class Interrupted:
+            def __init__(self):
+                self.items = iter(range(3))
+                self.is_interrupted = False
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                if not self.is_interrupted:
+                    self.is_interrupted = True
+                    raise KeyboardInterrupt
+                return next(self.items)
+
+        replay = ReplayIterable(Interrupted())
+        with pytest.raises(KeyboardInterrupt):
+            list(replay)
+
+        # The interrupt is not stored, so later iterations continue from the iterator.
+        assert replay.exception is None
+        assert list(replay) == list(replay) == [0, 1, 2]
+
     def test_object_timed_cache(self):
         cacher = TestCachingObject.CachingTestObject()
 
@@ -107,6 +324,26 @@ class TestCachingObject(ClassTest):
         assert second > first
         assert third == second
 
+    def test_timed_cached_property(self):
+        cacher = TestCachingObject.CachingTestObject()
+
+        first = cacher.timed_property
+        second = cacher.timed_property
+        time.sleep(1.1)
+        third = cacher.timed_property
+
+        assert first == second
+        assert third > second
+
+        cacher.clear_caches()
+        assert cacher.timed_property > third
+
+        cacher.disable_caching()
+        assert cacher.timed_property != cacher.timed_property
+
+        cacher.enable_caching()
+        assert cacher.timed_property == cacher.timed_property
+
     def test_object_cache_instances(self):
         cacher = TestCachingObject.CachingTestObject()
         cacher2 = TestCachingObject.CachingTestObject()
@@ -118,6 +355,62 @@ class TestCachingObject(ClassTest):
 
         assert second - first != self.zero_time
 
+    def test_exception_caching(self):
+        calls = []
+
+        @timed_cache(local=False, cache_exceptions=(KeyError,))
+        def get_item(key):
+            calls.append(key)
+            raise KeyError(key)
+
+        errors = []
+        for _ in range(3):
+            with pytest.raises(KeyError) as error:
+                get_item("missing")
+            errors.append((error.value, error.value.__traceback__))
+
+        assert calls == ["missing"]
+        assert not get_item.cache_container
+
+        # Each hit raises a copy, so the cached exception does not keep the frames of the hits.
+        (cached, traceback), *hits = errors
+        assert all(error is not cached and error.args == ("missing",) for error, _ in hits)
+        assert cached.__traceback__ is traceback
+
+    def test_negative_lifetime(self):
+        calls = []
+
+        @timed_cache(local=False, negative_results=(None,), negative_lifetime=0.5)
+        def find(number):
+            calls.append(number)
+            return None if number == 0 else number
+
+        assert find(0) is None
+        assert find(0) is None
+        assert find(1) == find(1) == 1
+        assert calls == [0, 1]
+        assert 0 in find.negative_container and 0 not in find.cache_container
+
+        time.sleep(0.6)
+        find(0)
+        find(1)
+
+        assert calls == [0, 1, 0]
+
+    def test_negative_eviction(self):
+        calls = []
+
+        @timed_lru_cache(maxsize=1, negative_results=(None,))
+        def find(number):
+            calls.append(number)
+            return None if number == 0 else number
+
+        assert find(1) == 1
+        assert find(0) is None
+        assert find(1) == 1
+        assert calls == [1, 0]
+        assert set(find.cache_container) == {1}
+
 
 # Main #
 if __name__ == "__main__":
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_callablemultiplexer.py
+Tests CallableMultiplexer, MethodMultiplexer, and AutotuningMultiplexer
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import time
+import weakref
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import CallableMultiplexer, MethodMultiplexer, AutotuningMultiplexer
+
+
+# Definitions #
+# Classes #
+class TestMethodMultiplexer:
+    class ExampleClass:
+        def __init__(self, value):
+            self.value = value
+
+        def first(self):
+            return self.value
+
+        def second(self):
+            return -self.value
+
+    @pytest.fixture
+    def multiplexer(self):
+        example = self.ExampleClass(1)
+        return example, MethodMultiplexer(instance=example, select="first")
+
+    def test_select(self, multiplexer):
+        example, multiplexer = multiplexer
+        assert multiplexer() == 1
+        multiplexer.select("second")
+        assert multiplexer() == -1
+        assert multiplexer.target() == -1
+
+    def test_add_select_function(self, multiplexer):
+        example, multiplexer = multiplexer
+        multiplexer.add_select_function("third", lambda self: self.value * 3)
+        assert multiplexer() == 3
+
+    def test_add_select_method(self, multiplexer):
+        example, multiplexer = multiplexer
+        other = self.ExampleClass(2)
+        multiplexer.add_select_method("second", other.second)
+        assert multiplexer() == -1
+
+    def test_rebinding(self, multiplexer):
+        example, multiplexer = multiplexer
+        multiplexer.add_select_function("double", lambda self: self.value * 2)
+        other = self.ExampleClass(5)
+        multiplexer.bind(other)
+        assert multiplexer() == 10
+
+
+class TestCallableMultiplexer:
+    def test_unbound_function(self):
+        multiplexer = CallableMultiplexer()
+        multiplexer.add_select_function("add", lambda a, b: a + b)
+        assert multiplexer.target is multiplexer.__func__
+        assert multiplexer(1, 2) == 3
+
+    def test_binding(self):
+        example = TestMethodMultiplexer.ExampleClass(4)
+        multiplexer = CallableMultiplexer(instance=example)
+        multiplexer.add_select_function("value", lambda self: self.value)
+        multiplexer.is_binding = True
+        assert multiplexer() == 4
+        multiplexer.is_binding = False
+        assert multiplexer(example) == 4
+
+    def test_self_bound(self):
+        example = TestMethodMultiplexer.ExampleClass(3)
+        multiplexer = CallableMultiplexer(instance=example, select="second")
+        assert multiplexer.is_self_bound
+        assert multiplexer() == -3
+
+
+class TestAutotuningMultiplexer:
+    @staticmethod
+    def slow(items):
+        time.sleep(0.001)
+        return sum(items)
+
+    @staticmethod
+    def fast(items):
+        return sum(items)
+
+    @staticmethod
+    def slow_when_small(items):
+        if len(items) < 10:
+            time.sleep(0.001)
+        return sum(items)
+
+    def test_tuning_under_traffic(self):
+        multiplexer = AutotuningMultiplexer(samples=3)
+        multiplexer.add_function("slow", self.slow)
+        multiplexer.add_function("fast", self.fast)
+        for _ in range(6):
+            assert multiplexer([1, 2]) == 3
+        assert not multiplexer.is_tuning
+        assert multiplexer.selected == "fast"
+        assert multiplexer.target is self.fast
+        stats = multiplexer.get_stats()[None]
+        assert stats["fast"]["count"] == 3 and stats["fast"]["selected"]
+
+    def test_workload_buckets(self):
+        multiplexer = AutotuningMultiplexer(size_key=len, buckets=[10])
+        multiplexer.add_function("slow", self.slow)
+        multiplexer.add_function("slow_when_small", self.slow_when_small)
+        selected = multiplexer.tune([([1] * 2,), ([1] * 20,)], repeats=1)
+        assert set(selected) == {0, 1}
+        assert selected[1] == "slow_when_small"
+        assert multiplexer([1] * 20) == 20
+
+    def test_pin(self):
+        multiplexer = AutotuningMultiplexer()
+        multiplexer.add_function("slow", self.slow)
+        multiplexer.add_function("fast", self.fast)
+        multiplexer.pin("slow")
+        assert multiplexer.selected == "slow"
+        multiplexer([1])
+        assert not multiplexer.measurements
+        multiplexer.retune()
+        assert multiplexer.selected == "slow"
+
+    def test_not_tuning(self):
+        multiplexer = AutotuningMultiplexer(size_key=len, buckets=[10], tuning=False)
+        with pytest.raises(ValueError):
+            multiplexer([1])
+        multiplexer.add_function("slow", self.slow)
+        multiplexer.add_function("fast", self.fast)
+        assert multiplexer([1]) == 1
+        assert not multiplexer.measurements
+
+    @pytest.mark.parametrize("size_key", [None, len])
+    def test_rebinding(self, size_key):
+        example, other = TestMethodMultiplexer.ExampleClass(1), TestMethodMultiplexer.ExampleClass(2)
+        multiplexer = AutotuningMultiplexer(instance=example, binding=True, size_key=size_key, buckets=[10])
+        multiplexer.add_function("first", lambda self, items=(): ("a", self.value))
+        multiplexer.add_function("second", lambda self, items=(): ("b", self.value))
+        multiplexer.pin("second", 0)
+        assert multiplexer(()) == ("b", 1)
+        multiplexer.bind(other)
+        assert multiplexer(()) == ("b", 2)
+        reference = weakref.ref(example)
+        del example
+        assert reference() is None
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
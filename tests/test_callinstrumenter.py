@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_callinstrumenter.py
+Tests CallInstrumenter
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import io
+import json
+import pathlib
+import pstats
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import CallInstrumenter, DynamicCallable, DynamicFunction, MethodMultiplexer
+
+
+# Definitions #
+# Functions #
+@DynamicFunction
+def inner(x):
+    return x
+
+
+@DynamicFunction
+def outer(x):
+    return inner(x) + inner(x)
+
+
+@DynamicFunction
+def countdown(n):
+    return n if n < 1 else countdown(n - 1)
+
+
+# Classes #
+class TestCallInstrumenter:
+    class Example:
+        @DynamicFunction
+        def value(self, x):
+            return x
+
+    @pytest.fixture
+    def instrumenter(self):
+        instrumenter = CallInstrumenter()
+        yield instrumenter
+        instrumenter.disable()
+
+    def test_switching(self, instrumenter):
+        original = DynamicCallable.__call__
+        instrumenter.enable()
+        assert instrumenter.is_enabled
+        assert DynamicCallable.__call__ is not original
+        with pytest.raises(RuntimeError):
+            CallInstrumenter().enable()
+        instrumenter.disable()
+        assert DynamicCallable.__call__ is original
+        outer(1)
+        assert instrumenter.get_stats() == {}
+
+    def test_stats(self, instrumenter):
+        instrumenter.enable()
+        outer(1)
+        countdown(3)
+        instrumenter.disable()
+        stats = instrumenter.get_stats()
+
+        outer_stats = stats[f"{__name__}.outer"]
+        inner_stats = stats[f"{__name__}.inner"]
+        assert outer_stats["count"] == 1
+        assert inner_stats["count"] == 2
+        assert inner_stats["callers"] == {f"{__name__}.outer": 2}
+        assert outer_stats["total_time"] >= inner_stats["total_time"]
+        assert outer_stats["internal_time"] == pytest.approx(outer_stats["total_time"] - inner_stats["total_time"])
+
+        countdown_stats = stats[f"{__name__}.countdown"]
+        assert countdown_stats["count"] == 4
+        assert countdown_stats["primitive_count"] == 1
+
+    def test_method(self, instrumenter):
+        example = self.Example()
+        multiplexer = MethodMultiplexer(instance=example, select="value")
+        instrumenter.enable()
+        example.value(1)
+        multiplexer(2)
+        instrumenter.disable()
+        assert instrumenter.get_stats()[f"{__name__}.TestCallInstrumenter.Example.value"]["count"] == 2
+
+    def test_dispatch(self, instrumenter):
+        function = DynamicFunction(lambda x: inner(x))
+        instrumenter.enable()
+        function(1)
+        instrumenter.disable()
+        stats = instrumenter.get_stats()
+
+        # The dispatch is recorded, but the calls it makes are attributed to the function which dispatched them.
+        function_name = f"{__name__}.TestCallInstrumenter.test_dispatch.<locals>.<lambda>"
+        dispatch_stats = stats["src.baseobjects.functions.dynamiccallable.DynamicCallable.call"]
+        assert dispatch_stats["count"] == 2
+        assert dispatch_stats["callers"] == {function_name: 1, f"{__name__}.inner": 1}
+        assert stats[f"{__name__}.inner"]["callers"] == {function_name: 1}
+        assert getattr(function.call_multiplexer.target, "__instrumenter__", None) is None
+
+    def test_export(self, instrumenter, tmp_path):
+        instrumenter.enable()
+        outer(1)
+        instrumenter.disable()
+
+        assert json.loads(instrumenter.to_json())[f"{__name__}.outer"]["count"] == 1
+
+        stream = io.StringIO()
+        pstats.Stats(instrumenter, stream=stream).print_stats()
+        assert f"{__name__}.inner" in stream.getvalue()
+
+        path = pathlib.Path(tmp_path, "calls.prof")
+        instrumenter.dump_stats(path)
+        # The call of each function is dispatched by the call multiplexer, which is recorded as well.
+        assert pstats.Stats(str(path)).total_calls == 6
+
+        instrumenter.reset()
+        assert instrumenter.get_stats() == {}
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
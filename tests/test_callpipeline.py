@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_callpipeline.py
+Tests CallPipeline
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import gc
+import pickle
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import CallPipeline, CallableMultiplexer, DynamicFunction
+
+
+# Definitions #
+# Functions #
+def parse(record):
+    return int(record)
+
+
+def scale(record):
+    return record * 2
+
+
+def shift(record):
+    return record + 1
+
+
+# Classes #
+class ExampleDynamic(DynamicFunction):
+    def negative_call(self, *args, **kwargs):
+        return -self.__wrapped__(*args, **kwargs)
+
+
+class ExampleClass:
+    def __init__(self, offset):
+        self.offset = offset
+
+    @DynamicFunction
+    def add_offset(self, record):
+        return record + self.offset
+
+
+class TestCallPipeline:
+    def test_call(self):
+        pipeline = CallPipeline([DynamicFunction(parse), scale, DynamicFunction(shift)])
+        assert pipeline("3") == 7
+        assert pipeline.fused_call("4") == 9
+
+    def test_batch(self):
+        pipeline = CallPipeline([DynamicFunction(parse), DynamicFunction(scale)])
+        assert pipeline.call_batch(["1", "2", "3"]) == [2, 4, 6]
+        assert pipeline.call_batch(str(i) for i in range(3)) == [0, 2, 4]
+
+        iterator = pipeline.iterate(iter(["1", "2"]))
+        assert next(iterator) == 2
+        assert list(iterator) == [4]
+
+    def test_bound_method(self):
+        example = ExampleClass(10)
+        pipeline = CallPipeline([parse, example.add_offset])
+        assert pipeline("5") == 15
+        example.offset = 20
+        assert pipeline("5") == 25
+
+    def test_deleted_instance(self):
+        example = ExampleClass(10)
+        pipeline = CallPipeline([parse, example.add_offset])
+        iterator = pipeline.iterate(["1", "2"])
+        assert next(iterator) == 11
+
+        del example
+        gc.collect()
+        with pytest.raises(ReferenceError):
+            pipeline("5")
+        with pytest.raises(ReferenceError):
+            next(iterator)
+
+    def test_multiplexer(self):
+        multiplexer = CallableMultiplexer()
+        multiplexer.add_select_function("scale", scale)
+        pipeline = CallPipeline([parse, multiplexer])
+        assert pipeline("2") == 4
+        multiplexer.add_select_function("shift", shift)
+        assert pipeline("2") == 3
+
+    def test_rebuild_on_call_method(self):
+        stage = ExampleDynamic(scale)
+        pipeline = CallPipeline([parse, stage, shift])
+        fused_call = pipeline.fused_call
+        assert pipeline("2") == 5
+        assert pipeline.is_current()
+
+        stage.call_method = "negative_call"
+        assert not pipeline.is_current()
+        assert pipeline("2") == -3
+        assert pipeline.fused_call is not fused_call
+        assert pipeline.call_batch(["1"]) == [-1]
+
+        # A function from an earlier build still evaluates through the current build.
+        assert fused_call("2") == -3
+
+    def test_rebuild_on_function(self):
+        stage = DynamicFunction(scale)
+        pipeline = CallPipeline([parse, stage])
+        assert list(pipeline.iterate(["2"])) == [4]
+        stage.__func__ = shift
+        assert list(pipeline.iterate(["2"])) == [3]
+
+    def test_rebuild_during_iteration(self):
+        stage = ExampleDynamic(scale)
+        pipeline = CallPipeline([parse, stage])
+        iterator = pipeline.iterate(["1", "2", "3"])
+        assert next(iterator) == 2
+
+        # The change is checked before each record, so the rest of the iteration uses the new call method.
+        stage.call_method = "negative_call"
+        assert list(iterator) == [-4, -6]
+
+    def test_append(self):
+        pipeline = CallPipeline()
+        assert pipeline(1) == 1
+        pipeline.append(DynamicFunction(scale))
+        pipeline.extend([shift])
+        assert pipeline(1) == 3
+
+    def test_pickle(self):
+        pipeline = CallPipeline([parse, scale, shift])
+        loaded = pickle.loads(pickle.dumps(pipeline))
+        assert loaded("3") == 7
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
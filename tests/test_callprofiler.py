@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_callprofiler.py
+Tests CallProfiler
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import CallProfiler, profile_calls
+
+
+# Definitions #
+# Classes #
+class TestCallProfiler:
+    def test_stats(self):
+        @profile_calls(percentiles=(50, 100))
+        def add(a, b):
+            return a + b
+
+        assert isinstance(add, CallProfiler)
+        assert add.is_enabled
+        for i in range(10):
+            assert add(i, 1) == i + 1
+        stats = add.get_stats()
+        assert stats["count"] == 10
+        assert stats["min"] <= stats["percentiles"][50] <= stats["percentiles"][100] == stats["max"]
+        assert stats["total"] == pytest.approx(stats["mean"] * 10)
+        add.reset()
+        assert add.get_stats()["count"] == 0
+
+    def test_disable(self):
+        @profile_calls(enabled=False)
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert add.get_stats()["count"] == 0
+        add.enable()
+        add(1, 2)
+        assert add.get_stats()["count"] == 1
+
+    def test_threads(self):
+        @profile_calls()
+        def wait(seconds):
+            time.sleep(seconds)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(wait, [0.001] * 40))
+        stats = wait.get_stats()
+        assert stats["count"] == 40
+        assert sum(stats["threads"].values()) == 40
+        assert stats["min"] >= 0.001
+
+    def test_exception(self):
+        @profile_calls()
+        def fail():
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            fail()
+        assert fail.get_stats()["count"] == 1
+
+    def test_stack_samples(self):
+        @profile_calls(stack_sample_rate=2)
+        def identity(a):
+            return a
+
+        for i in range(4):
+            identity(i)
+        stack, count = identity.get_stats()["stacks"][0]
+        assert count == 2
+        assert stack[0][2] == "test_stack_samples"
+
+    def test_method(self):
+        class Example:
+            @profile_calls()
+            def value(self):
+                return 1
+
+        example = Example()
+        assert example.value() == 1
+        assert Example.value.get_stats()["count"] == 1
+
+    def test_coroutine(self):
+        @profile_calls()
+        async def wait():
+            await asyncio.sleep(0.01)
+            return 1
+
+        assert asyncio.run(wait()) == 1
+        assert wait.get_stats()["min"] >= 0.01
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
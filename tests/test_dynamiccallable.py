@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_dynamiccallable.py
+Tests DynamicFunction
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError
+import time
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.bases import ObjectPool
+from src.baseobjects.functions import DynamicFunction, DynamicMethod
+
+
+# Definitions #
+# Functions #
+def square(x, offset=0):
+    return x * x + offset
+
+
+@DynamicFunction
+def cube(x):
+    return x * x * x
+
+
+def sleep(x):
+    time.sleep(0.1)
+    return x
+
+
+# Classes #
+class ExampleMethod(DynamicMethod):
+    def negative_call(self, *args, **kwargs):
+        return -self.call(*args, **kwargs)
+
+
+class ExampleFunction(DynamicFunction):
+    method_type = ExampleMethod
+
+
+class TestDynamicFunction:
+    @pytest.fixture
+    def function(self):
+        function = DynamicFunction(square)
+        yield function
+        function.shutdown_executor()
+
+    def test_call(self, function):
+        assert function(3) == 9
+        assert function.call_method == "call"
+
+    def test_submit_call(self, function):
+        function.call_method = "submit_call"
+        future = function(3, offset=1)
+        assert isinstance(future, Future)
+        assert future.result() == 10
+        assert isinstance(function.executor, ThreadPoolExecutor)
+
+    @pytest.mark.parametrize("chunksize", [1, 4])
+    def test_map_call(self, function, chunksize):
+        function.call_method = "map_call"
+        assert list(function(range(10), chunksize=chunksize)) == [x * x for x in range(10)]
+        assert list(function(range(3), [1, 2, 3])) == [1, 3, 7]
+
+    def test_process_executor(self, function):
+        function.set_executor(executor_type=ProcessPoolExecutor, max_workers=2, chunksize=3)
+        assert list(function.map_call(range(10))) == [x * x for x in range(10)]
+        assert function.submit_call(4).result() == 16
+
+    def test_process_decorated(self):
+        cube.set_executor(executor_type=ProcessPoolExecutor, max_workers=2, chunksize=2)
+        try:
+            assert cube.submit_call(2).result() == 8
+            assert list(cube.map_call(range(5))) == [x * x * x for x in range(5)]
+            assert list(cube.map_call(range(3), chunksize=1)) == [0, 1, 8]
+        finally:
+            cube.shutdown_executor()
+
+    def test_map_timeout(self):
+        function = DynamicFunction(sleep)
+        function.set_executor(max_workers=1, chunksize=2)
+        try:
+            # Each chunk takes less than the timeout, but all of them take more.
+            with pytest.raises(TimeoutError):
+                list(function.map_call(range(6), timeout=0.45))
+        finally:
+            function.shutdown_executor()
+
+    def test_given_executor(self, function):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            function.set_executor(executor)
+            assert function.submit_call(2).result() == 4
+            function.shutdown_executor()
+            assert function.executor is None
+            assert executor.submit(square, 1).result() == 1
+
+    def test_pooled_method(self):
+        class Example:
+            def __init__(self, x):
+                self.x = x
+
+            @ExampleFunction
+            def get_square(self, offset=0):
+                return square(self.x, offset)
+
+        pool = ObjectPool(ExampleMethod)
+        first, second = Example(2), Example(3)
+        method = pool.acquire(func=Example.get_square, instance=first)
+        method.call_method = "negative_call"
+        assert method() == -4
+        assert pool.release(method)
+
+        # The released method is rebound with the default call method.
+        assert pool.acquire(func=Example.get_square, instance=second) is method
+        assert method(1) == 10 and method.__self__ is second
+        assert first.get_square() == 4
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_functionregister.py
+Tests FunctionRegister and MethodRegister
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import dataclasses
+import gc
+import pickle
+import weakref
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import FunctionRegister, MethodRegister
+
+
+# Definitions #
+# Classes #
+class TestFunctionRegister:
+    class Example:
+        value = 1
+
+        def method(self):
+            return "method"
+
+        @staticmethod
+        def static():
+            return "static"
+
+        @classmethod
+        def class_method(cls):
+            return cls
+
+        @property
+        def dynamic(self):
+            return self.method
+
+    def test_update_from_object(self):
+        example = self.Example()
+        example.instance_function = len
+        example.static = 0
+        register = FunctionRegister(object_=example)
+        assert register["method"] is self.Example.method
+        assert register["class_method"] is self.Example.class_method.__func__
+        assert register["dynamic"] is self.Example.method
+        assert register["instance_function"] is len
+        assert "static" not in register
+        assert "value" not in register
+
+    def test_callable_table_cache(self):
+        class Example(self.Example):
+            pass
+
+        table = FunctionRegister.get_callable_table(Example)
+        assert FunctionRegister.get_callable_table(Example) is table
+        assert "static" in table.functions and "dynamic" in table.dynamic
+
+        Example.method = lambda self: "replaced"
+        assert FunctionRegister.get_callable_table(Example) is not table
+        assert FunctionRegister(object_=Example())["method"](None) == "replaced"
+
+        self.Example.added = lambda self: "added"
+        try:
+            assert FunctionRegister(object_=Example())["added"](None) == "added"
+        finally:
+            del self.Example.added
+
+    def test_callable_table_references(self):
+        class Ambiguous:
+            def __eq__(self, other):
+                raise ValueError("The truth value is ambiguous.")
+
+        class Example(self.Example):
+            values = Ambiguous()
+
+            def method(self):
+                return super().method()
+
+        table = FunctionRegister.get_callable_table(Example)
+        assert FunctionRegister.get_callable_table(Example) is table
+        assert FunctionRegister(object_=Example())["method"] is Example.method
+
+        # The table only references the type and its attributes weakly, so it does not keep the type alive.
+        type_ref = weakref.ref(Example)
+        del Example
+        gc.collect()
+        assert type_ref() is None and table.functions["method"]() is None
+
+    def test_lazy(self):
+        example = self.Example()
+        register = FunctionRegister(object_=example, functions={"method": len}, lazy=True)
+        assert register.pending_objects == [example]
+        assert register.data == {"method": len}
+        assert register["static"] is self.Example.static
+        assert register.get("value", None) is None
+        assert "dynamic" in register
+        with pytest.raises(KeyError):
+            register["missing"]
+
+        assert register.data.keys() == {"method", "static", "dynamic"}
+        assert "class_method" in list(register)
+        assert not register.pending_objects
+        assert register["method"] is len
+
+
+class TestMethodRegister:
+    class Example:
+        register = MethodRegister(methods={"length": len})
+
+    def test_bound_register_cache(self):
+        example = self.Example()
+        bound = example.register
+        assert example.register is bound
+        assert bound.__self__ is example
+        assert bound["length"] is len
+        assert self.Example().register is not bound
+
+        register = self.Example.__dict__["register"]
+        register["extra"] = abs
+        assert bound["extra"] is abs
+
+        del example, bound
+        gc.collect()
+        assert len(register.bound_registers) == 0
+
+    def test_unhashable_instance(self):
+        class Unhashable(self.Example):
+            __hash__ = None
+
+        example = Unhashable()
+        assert example.register["length"] is len
+        assert example.register is example.register
+
+    def test_equal_instances(self):
+        @dataclasses.dataclass(frozen=True)
+        class Point:
+            x: int
+            register = MethodRegister(methods={"length": len})
+
+        first, second = Point(1), Point(1)
+        assert first == second and hash(first) == hash(second)
+        assert first.register is not second.register
+        assert first.register.__self__ is first and second.register.__self__ is second
+
+    def test_pickle(self):
+        register = pickle.loads(pickle.dumps(self.Example.__dict__["register"]))
+        assert register["length"] is len
+        assert len(register.bound_registers) == 0
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
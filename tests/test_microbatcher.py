@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_microbatcher.py
+Tests MicroBatcher
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import MicroBatcher, micro_batch
+
+
+# Definitions #
+# Classes #
+class TestMicroBatcher:
+    @pytest.fixture
+    def batcher(self):
+        batches = []
+
+        @micro_batch(max_batch_size=8, max_wait=0.05)
+        def double(items):
+            batches.append(len(items))
+            return [item * 2 for item in items]
+
+        yield double, batches
+        double.shutdown()
+
+    def test_single_call(self, batcher):
+        double, batches = batcher
+        assert isinstance(double, MicroBatcher)
+        assert double(2) == 4
+        assert batches == [1]
+
+    def test_thread_calls(self, batcher):
+        double, batches = batcher
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(double, range(32)))
+        assert results == [i * 2 for i in range(32)]
+        assert sum(batches) == 32
+        assert max(batches) <= 8
+
+    def test_async_calls(self, batcher):
+        double, batches = batcher
+
+        async def gather():
+            return await asyncio.gather(*(double.async_batch_call(i) for i in range(8)))
+
+        assert asyncio.run(gather()) == [i * 2 for i in range(8)]
+        assert sum(batches) == 8
+        assert max(batches) <= 8
+
+    def test_shutdown(self, batcher):
+        double, batches = batcher
+        assert double(1) == 2
+        double.shutdown(wait=False)
+        with pytest.raises(RuntimeError):
+            double(2)
+        assert double.worker is None and not double.pending
+
+    def test_method(self):
+        class Example:
+            @micro_batch()
+            def double(self, items):
+                return [item * 2 for item in items]
+
+        with pytest.raises(TypeError):
+            Example().double(1)
+        assert isinstance(Example.double, MicroBatcher)
+
+    def test_exception(self):
+        @micro_batch(max_wait=0.0)
+        def failing(items):
+            raise RuntimeError("failed")
+
+        with pytest.raises(RuntimeError):
+            failing(1)
+        failing.shutdown()
+
+    def test_wrong_length(self):
+        @micro_batch(max_wait=0.0)
+        def short(items):
+            return []
+
+        with pytest.raises(ValueError):
+            short(1)
+        short.shutdown()
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_multikwargdispatch.py
+Tests multikwargdispatch
+"""
+# Package Header #
+from src.baseobjects.header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+# Imports #
+# Standard Libraries #
+import abc
+
+# Third-Party Packages #
+import pytest
+
+# Local Packages #
+from src.baseobjects.functions import multikwargdispatch
+
+
+# Definitions #
+# Classes #
+class TestMultiKwargDispatch:
+    class ExampleClass:
+        @multikwargdispatch("a", "b")
+        def combine(self, a, b=None):
+            return "default"
+
+        @combine.register
+        def _(self, a: int, b: int):
+            return "int, int"
+
+        @combine.register
+        def _(self, a: int, b: str | bytes):
+            return "int, str"
+
+        @combine.register(bool, int)
+        def _(self, a, b):
+            return "bool, int"
+
+    def test_method(self):
+        example = self.ExampleClass()
+        assert example.combine(1, 2) == "int, int"
+        assert example.combine(1, "2") == "int, str"
+        assert example.combine(1, b"2") == "int, str"
+        assert example.combine("1", 2) == "default"
+
+    def test_kwargs(self):
+        example = self.ExampleClass()
+        assert example.combine(b=2, a=1) == "int, int"
+        assert example.combine(1, b="2") == "int, str"
+        assert example.combine(1) == "default"
+
+    def test_most_specific(self):
+        example = self.ExampleClass()
+        assert example.combine(True, 2) == "bool, int"
+        assert example.combine(True, "2") == "int, str"
+
+    def test_function(self):
+        @multikwargdispatch
+        def function(a, b):
+            return "default"
+
+        @function.register(int)
+        def _(a, b):
+            return "int, object"
+
+        @function.register(object, int)
+        def _(a, b):
+            return "object, int"
+
+        assert function(1, "2") == "int, object"
+        assert function("1", 2) == "object, int"
+        with pytest.raises(TypeError):
+            function(1, 2)
+
+    def test_cache(self):
+        @multikwargdispatch("a", "b")
+        def function(a, b):
+            return "default"
+
+        assert function(1, 2) == "default"
+        assert (int, int) in function.dispatch_cache
+
+        @function.register(int, int)
+        def _(a, b):
+            return "int, int"
+
+        assert not function.dispatch_cache
+        assert function(1, 2) == "int, int"
+
+    def test_abstract_registration(self):
+        class Abstract(abc.ABC):
+            pass
+
+        class Concrete:
+            pass
+
+        @multikwargdispatch("a", "b")
+        def function(a, b):
+            return "default"
+
+        @function.register
+        def _(a: Abstract, b: int):
+            return "abstract"
+
+        assert function(Concrete(), 1) == "default"
+        Abstract.register(Concrete)
+        assert function(Concrete(), 1) == "abstract"
+
+
+# Main #
+if __name__ == "__main__":
+    pytest.main(["-v", "-s"])
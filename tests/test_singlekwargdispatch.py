@@ -14,13 +14,16 @@ __email__ = __email__
 
 # Imports #
 # Standard Libraries #
+import abc
+import gc
 import pickle
+import weakref
 
 # Third-Party Packages #
 import pytest
 
 # Local Packages #
-from baseobjects.functions import singlekwargdispatch
+from src.baseobjects.functions import singlekwargdispatch
 
 
 # Definitions #
@@ -51,6 +54,14 @@ class TestSingleKwargDispatchMethod:
         def _(self, a: str):
             return True
 
+        @singlekwargdispatch(kwarg="b")
+        def third_overload(self, a, b=None):
+            return None
+
+        @third_overload.register
+        def _(self, a, b: int):
+            return b + 1
+
     def test_arg(self):
         example = self.ExampleClass()
         assert example.first_overload(1) == 2
@@ -74,6 +85,104 @@ class TestSingleKwargDispatchMethod:
         assert example.second_overload(b=None, a=1) is not None
         assert example.second_overload(a="Any")
 
+    def test_positional_kwarg(self):
+        example = self.ExampleClass()
+        assert example.third_overload(None, 1) == 2
+        assert example.third_overload(None, b=1) == 2
+        assert example.third_overload(1, b=None) is None
+
+    def test_bound_dispatcher(self):
+        example = self.ExampleClass()
+        assert example.first_overload.__func__ is example.first_overload.__func__
+        assert example.first_overload.__self__ is example
+        assert example.first_overload.register == self.ExampleClass.first_overload.register
+        assert example.first_overload.__name__ == "first_overload"
+
+    def test_abstract_method(self):
+        class AbstractClass(abc.ABC):
+            @singlekwargdispatch
+            @abc.abstractmethod
+            def method(self, a):
+                pass
+
+        with pytest.raises(TypeError):
+            AbstractClass()
+
+    def test_dispatch_many(self):
+        calls = []
+
+        @singlekwargdispatch
+        def dispatched(a, offset=0):
+            calls.append("default")
+            return None
+
+        @dispatched.register
+        def _(a: str, offset=0):
+            calls.append("str")
+            return a + str(offset)
+
+        @dispatched.register_batch(int)
+        def _(items, offset=0):
+            calls.append("int batch")
+            return [i + offset for i in items]
+
+        assert dispatched.dispatch_many([1, "a", 2, None, True, "b"], offset=1) == [2, "a1", 3, None, 2, "b1"]
+        assert calls.count("int batch") == 1
+        assert calls.count("str") == 2
+        assert dispatched(1) is None
+
+    def test_dispatch_many_method(self):
+        example = self.ExampleClass()
+        assert example.first_overload.dispatch_many([1, "Any", 2]) == [2, True, 3]
+        assert example.third_overload.dispatch_many([1, None, 2], None) == [2, None, 3]
+
+        @singlekwargdispatch(kwarg="b")
+        def dispatched(a, b=None):
+            return a
+
+        @dispatched.register_batch(int)
+        def _(a, b):
+            return [a + i for i in b]
+
+        assert dispatched.dispatch_many([1, "Any"], 1) == [2, 1]
+
+    def test_abstract_registration(self):
+        class Abstract(abc.ABC):
+            pass
+
+        class Concrete:
+            pass
+
+        @singlekwargdispatch
+        def dispatched(a):
+            return "default"
+
+        @dispatched.register
+        def _(a: Abstract):
+            return "abstract"
+
+        assert dispatched(Concrete()) == "default"
+        Abstract.register(Concrete)
+        assert dispatched(Concrete()) == "abstract"
+
+    def test_dispatch_cache(self):
+        @singlekwargdispatch
+        def dispatched(a):
+            return "default"
+
+        class Temporary:
+            pass
+
+        assert dispatched(Temporary()) == "default"
+        reference = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+        assert reference() is None and not dispatched.dispatch_cache
+
+        assert dispatched(1) == "default"
+        dispatched.dispatcher.register(int, lambda a: "int")
+        assert dispatched(1) == "int"
+
 
 # Main #
 if __name__ == "__main__":